@@ -0,0 +1,113 @@
+"""
+Benchmark the vote analytics against multi-year rollups.
+
+A throwaway test database is seeded with `--history-days` of menus and
+votes, the daily rollups are built (timed, then timed again for a single
+newly closed day) and each analytics query is measured for a short and a
+multi-year period. Results are written as JSON.
+
+Usage:
+    python benchmarks/bench_analytics.py --users 2000 --restaurants 100 \\
+        --history-days 1095 --iterations 50 --output analytics.json
+"""
+
+import argparse
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import setup_django, summarize, write_results  # noqa: E402
+
+
+def measure(func, iterations):
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return summarize(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=2_000)
+    parser.add_argument("--restaurants", type=int, default=100)
+    parser.add_argument("--memberships", type=int, default=3)
+    parser.add_argument("--history-days", type=int, default=1_095)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--keepdb", action="store_true")
+    parser.add_argument("--output", help="Write the JSON results to this file.")
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.test.utils import (
+        setup_databases,
+        setup_test_environment,
+        teardown_databases,
+    )
+    from django.utils.timezone import now
+
+    from benchmarks.dataset import seed_dataset
+    from services.votes.analytics import (
+        refresh_rollups,
+        vote_trend,
+        weekday_distribution,
+        win_counts,
+    )
+
+    setup_test_environment()
+    old_config = setup_databases(verbosity=0, interactive=False, keepdb=args.keepdb)
+    try:
+        dataset = seed_dataset(
+            users=args.users,
+            restaurants=args.restaurants,
+            memberships_per_user=args.memberships,
+            history_days=args.history_days,
+        )
+        today = now().date()
+
+        started = time.perf_counter()
+        days = refresh_rollups(today=today - timedelta(days=1))
+        backfill = time.perf_counter() - started
+        started = time.perf_counter()
+        refresh_rollups(today=today)
+        incremental = time.perf_counter() - started
+
+        end = today - timedelta(days=1)
+        restaurant = dataset["restaurant_ids"][0]
+        queries = {}
+        for label, days_back in (("90 days", 90), ("full history", args.history_days)):
+            start = end - timedelta(days=days_back - 1)
+            queries[label] = {
+                "wins": measure(lambda: win_counts(start, end), args.iterations),
+                "trend": measure(
+                    lambda: vote_trend(restaurant, start, end), args.iterations
+                ),
+                "weekdays": measure(
+                    lambda: weekday_distribution(start, end), args.iterations
+                ),
+                "weekdays (restaurant)": measure(
+                    lambda: weekday_distribution(start, end, restaurant),
+                    args.iterations,
+                ),
+            }
+
+        results = {
+            "params": vars(args),
+            "counts": dataset["counts"],
+            "backfill": {"days": days, "seconds": round(backfill, 3)},
+            "incremental_seconds": round(incremental, 3),
+            "queries": queries,
+        }
+    finally:
+        teardown_databases(old_config, verbosity=0, keepdb=args.keepdb)
+
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
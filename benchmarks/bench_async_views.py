@@ -0,0 +1,175 @@
+"""
+Compare sync and async read views under concurrent ASGI connections.
+
+Each mode runs in its own process so ASYNC_READ_VIEWS is read by the URL
+configuration. Requests are driven straight into the ASGI application of
+one worker, so the numbers show how many concurrent connections a single
+worker sustains, its latency under that load and how many threads it needs.
+
+Usage:
+    python benchmarks/bench_async_views.py --concurrency 1,16,64,256 \\
+        --requests 2000 --output async.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import setup_django, summarize, write_results  # noqa: E402
+
+
+async def asgi_get(app, path, token):
+    """
+    Send one GET request to the ASGI app and return its status code.
+    """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"host", b"testserver"),
+            (b"authorization", f"Bearer {token}".encode()),
+        ],
+        "server": ("testserver", 80),
+        "client": ("127.0.0.1", 0),
+    }
+    body_sent = False
+    status = []
+
+    async def receive():
+        nonlocal body_sent
+        if not body_sent:
+            body_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # Django listens for a disconnect until the response is sent.
+        await asyncio.Future()
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+
+    await app(scope, receive, send)
+    return status[0]
+
+
+async def run_level(app, targets, concurrency, requests):
+    """
+    Keep `concurrency` requests in flight until `requests` have completed.
+    """
+    samples, errors, peak_threads = [], 0, threading.active_count()
+    queue = iter(range(requests))
+
+    async def client():
+        nonlocal errors, peak_threads
+        for i in queue:
+            path, token = targets[i % len(targets)]
+            started = time.perf_counter()
+            status = await asgi_get(app, path, token)
+            samples.append((time.perf_counter() - started) * 1000)
+            errors += status != 200
+            peak_threads = max(peak_threads, threading.active_count())
+
+    started = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    wall = time.perf_counter() - started
+    return {
+        "concurrency": concurrency,
+        "throughput_rps": round(requests / wall, 1),
+        "errors": errors,
+        "peak_threads": peak_threads,
+        **summarize(samples),
+    }
+
+
+def run_mode(concurrency_levels, requests):
+    setup_django()
+
+    from django.core.asgi import get_asgi_application
+    from django.db import connections
+    from django.test.utils import (
+        setup_databases,
+        setup_test_environment,
+        teardown_databases,
+    )
+    from rest_framework_simplejwt.tokens import AccessToken
+    from users.models import CustomUser
+
+    from benchmarks.dataset import seed_dataset
+
+    setup_test_environment()
+    old_config = setup_databases(verbosity=0, interactive=False)
+    try:
+        data = seed_dataset(users=500, restaurants=50, history_days=1)
+        tokens = [
+            str(AccessToken.for_user(user))
+            for user in CustomUser.objects.filter(id__in=data["employee_ids"][:50])
+        ]
+        targets = []
+        for i, token in enumerate(tokens):
+            restaurant_id = data["restaurant_ids"][i % len(data["restaurant_ids"])]
+            targets += [
+                (f"/api/restaurants/{restaurant_id}/daily-menu/", token),
+                ("/api/votes/results/", token),
+                ("/api/auth/profile/", token),
+            ]
+        connections.close_all()
+
+        app = get_asgi_application()
+        levels = []
+        for concurrency in concurrency_levels:
+            asyncio.run(run_level(app, targets, concurrency, min(requests, 50)))
+            levels.append(asyncio.run(run_level(app, targets, concurrency, requests)))
+        connections.close_all()
+    finally:
+        teardown_databases(old_config, verbosity=0)
+    return levels
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--concurrency", default="1,16,64,256")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--output", help="Write the JSON results to this file.")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    levels = [int(level) for level in args.concurrency.split(",")]
+
+    if args.child:
+        print(json.dumps(run_mode(levels, args.requests)))
+        return
+
+    results = {"params": vars(args)}
+    for mode, enabled in (("sync", "False"), ("async", "True")):
+        completed = subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--child",
+                f"--concurrency={args.concurrency}",
+                f"--requests={args.requests}",
+            ],
+            env={**os.environ, "ASYNC_READ_VIEWS": enabled},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        results[mode] = json.loads(completed.stdout.strip().splitlines()[-1])
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
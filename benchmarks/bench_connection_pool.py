@@ -0,0 +1,102 @@
+"""
+Compare DailyMenuView latency with and without the connection pool.
+
+Each mode runs in its own process so DB_POOL_ENABLED is read by settings.
+Connections are closed after every request, as Django does in production
+with CONN_MAX_AGE=0 (the test client normally keeps them open).
+
+Usage:
+    python benchmarks/bench_connection_pool.py --requests 2000 --output pool.json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import setup_django, summarize, write_results  # noqa: E402
+
+
+def run_mode(requests, warmup):
+    setup_django()
+
+    from django.db import connections
+    from django.utils.timezone import now
+    from rest_framework.test import APIClient
+    from restaurants.models import Menu, Restaurant
+    from services.db.connection_pool import get_pool_stats
+    from users.models import CustomUser
+
+    owner, _ = CustomUser.objects.get_or_create(
+        email="bench-owner@example.com", defaults={"role": "restaurant_admin"}
+    )
+    restaurant, _ = Restaurant.objects.get_or_create(
+        name="Benchmark Restaurant", defaults={"owner": owner}
+    )
+    Menu.objects.get_or_create(
+        restaurant=restaurant,
+        date=now().date(),
+        defaults={"items": {"Soup": 5, "Steak": 15}},
+    )
+    connections.close_all()
+
+    client = APIClient()
+    client.force_authenticate(user=owner)
+    url = f"/api/restaurants/{restaurant.id}/daily-menu/"
+
+    samples = []
+    for i in range(warmup + requests):
+        started = time.perf_counter()
+        response = client.get(url)
+        connections.close_all()
+        elapsed = (time.perf_counter() - started) * 1000
+        assert response.status_code == 200, response.status_code
+        if i >= warmup:
+            samples.append(elapsed)
+
+    return {**summarize(samples), "pool": get_pool_stats()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--output", help="Write the JSON results to this file.")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_mode(args.requests, args.warmup)))
+        return
+
+    results = {}
+    for mode, enabled in (("without_pool", "False"), ("with_pool", "True")):
+        completed = subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--child",
+                f"--requests={args.requests}",
+                f"--warmup={args.warmup}",
+            ],
+            env={**os.environ, "DB_POOL_ENABLED": enabled},
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        results[mode] = json.loads(completed.stdout.strip().splitlines()[-1])
+
+    results["speedup_p50"] = round(
+        results["without_pool"]["p50_ms"] / max(results["with_pool"]["p50_ms"], 1e-9),
+        2,
+    )
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
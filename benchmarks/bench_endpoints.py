@@ -0,0 +1,398 @@
+"""
+Benchmark every API endpoint against a seeded dataset.
+
+A throwaway test database is created, seeded with a parameterized dataset
+and every URL in lunch_voting_api/urls.py is measured for latency,
+throughput and query count. A simulated noon vote burst then sends votes
+from concurrent clients. Results are written as JSON so runs can be diffed.
+
+Usage:
+    python benchmarks/bench_endpoints.py --users 50000 --restaurants 2000 \\
+        --iterations 200 --burst-clients 32 --output endpoints.json
+"""
+
+import argparse
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from itertools import count
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import setup_django, summarize, write_results  # noqa: E402
+
+
+class Bench:
+    """
+    Builds authenticated API clients and times requests.
+    """
+
+    def __init__(self, dataset):
+        from rest_framework_simplejwt.tokens import AccessToken
+        from users.models import CustomUser
+
+        self.dataset = dataset
+        self._access_token = AccessToken
+        self._users = CustomUser.objects
+        self._tokens = {}
+
+    def client(self, user_id=None):
+        from rest_framework.test import APIClient
+
+        client = APIClient()
+        if user_id is not None:
+            token = self._tokens.get(user_id)
+            if token is None:
+                user = self._users.get(id=user_id)
+                token = self._tokens[user_id] = str(self._access_token.for_user(user))
+            client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        return client
+
+    def measure(self, prepare, iterations):
+        """
+        Run `prepare(i)` outside the timer and the request it returns inside.
+        The first request runs under a query counter and is not timed.
+        """
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        client, method, path, data = prepare(0)
+        with CaptureQueriesContext(connection) as queries:
+            response = getattr(client, method)(path, data, format="json")
+        query_count = len(queries)
+        status_codes = {response.status_code: 1}
+
+        samples = []
+        busy = 0.0
+        for i in range(1, iterations + 1):
+            client, method, path, data = prepare(i)
+            started = time.perf_counter()
+            response = getattr(client, method)(path, data, format="json")
+            elapsed = time.perf_counter() - started
+            busy += elapsed
+            samples.append(elapsed * 1000)
+            code = response.status_code
+            status_codes[code] = status_codes.get(code, 0) + 1
+
+        return {
+            **summarize(samples),
+            "throughput_rps": round(iterations / busy, 1) if busy else None,
+            "queries": query_count,
+            "status_codes": status_codes,
+        }
+
+
+def build_scenarios(bench):
+    """
+    Return {label: (url_name, prepare)} for every benchmarked request.
+    """
+    from django.conf import settings
+    from django.utils.timezone import now
+    from rest_framework_simplejwt.tokens import RefreshToken
+    from restaurants.models import Restaurant
+    from users.models import CustomUser
+
+    from benchmarks.dataset import BENCH_PASSWORD
+
+    data = bench.dataset
+    owner_id = data["owner_ids"][0]
+    restaurant_id = data["restaurant_ids"][0]
+    menu_id = data["today_menus"][restaurant_id]
+    employees = data["employee_ids"]
+    employee_id = employees[0]
+    voters = iter(employees[len(employees) // 2 :])
+    outsiders = iter(
+        e for e in employees if restaurant_id not in data["memberships"][e]
+    )
+    future = count(1)
+    today = now().date()
+    owner = CustomUser.objects.get(id=owner_id)
+
+    def fresh_restaurant(i):
+        return Restaurant.objects.create(name=f"Scratch {time.time_ns()}", owner=owner)
+
+    def fresh_refresh(i):
+        return str(RefreshToken.for_user(CustomUser.objects.get(id=employee_id)))
+
+    def get(url_name, path, user_id=employee_id):
+        return url_name, lambda i: (bench.client(user_id), "get", path, None)
+
+    def scrape(i):
+        client = bench.client()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {settings.METRICS_TOKEN}")
+        return client, "get", "/metrics", None
+
+    def vote(i):
+        user_id = next(voters)
+        menu = data["today_menus"][data["memberships"][user_id][0]]
+        return bench.client(user_id), "post", "/api/votes/vote/", {"menu": menu}
+
+    return {
+        "POST register": (
+            "register",
+            lambda i: (
+                bench.client(),
+                "post",
+                "/api/auth/register/",
+                {
+                    "email": f"new{time.time_ns()}@bench.example.com",
+                    "name": "New",
+                    "surname": "User",
+                    "password": BENCH_PASSWORD,
+                    "role": "employee",
+                },
+            ),
+        ),
+        "POST login": (
+            "login",
+            lambda i: (
+                bench.client(),
+                "post",
+                "/api/auth/login/",
+                {"email": data["login_email"], "password": BENCH_PASSWORD},
+            ),
+        ),
+        "POST logout": (
+            "logout",
+            lambda i: (
+                bench.client(employee_id),
+                "post",
+                "/api/auth/logout/",
+                {"refresh": fresh_refresh(i)},
+            ),
+        ),
+        "POST token_refresh": (
+            "token_refresh",
+            lambda i: (
+                bench.client(),
+                "post",
+                "/api/auth/token/refresh/",
+                {"refresh": fresh_refresh(i)},
+            ),
+        ),
+        "GET user_profile": get("user_profile", "/api/auth/profile/"),
+        "GET restaurant-list-create": get(
+            "restaurant-list-create", "/api/restaurants/"
+        ),
+        "POST restaurant-list-create": (
+            "restaurant-list-create",
+            lambda i: (
+                bench.client(owner_id),
+                "post",
+                "/api/restaurants/",
+                {"name": f"Created {time.time_ns()}", "owner": owner_id},
+            ),
+        ),
+        "GET restaurant-detail": get(
+            "restaurant-detail", f"/api/restaurants/{restaurant_id}/", owner_id
+        ),
+        "PATCH restaurant-detail": (
+            "restaurant-detail",
+            lambda i: (
+                bench.client(owner_id),
+                "patch",
+                f"/api/restaurants/{restaurant_id}/",
+                {"name": f"Bench Restaurant 0 v{i}-{time.time_ns()}"},
+            ),
+        ),
+        "DELETE restaurant-detail": (
+            "restaurant-detail",
+            lambda i: (
+                bench.client(owner_id),
+                "delete",
+                f"/api/restaurants/{fresh_restaurant(i).id}/",
+                None,
+            ),
+        ),
+        "PATCH add-employee": (
+            "add-employee",
+            lambda i: (
+                bench.client(owner_id),
+                "patch",
+                f"/api/restaurants/{restaurant_id}/add-employee/",
+                {"employee_id": next(outsiders)},
+            ),
+        ),
+        "GET menu-list-create": get(
+            "menu-list-create", f"/api/restaurants/{restaurant_id}/menus/", owner_id
+        ),
+        "POST menu-list-create": (
+            "menu-list-create",
+            lambda i: (
+                bench.client(owner_id),
+                "post",
+                f"/api/restaurants/{restaurant_id}/menus/",
+                {
+                    "restaurant": restaurant_id,
+                    "date": str(today + timedelta(days=next(future))),
+                    "items": {"Soup": 5, "Main": 12},
+                },
+            ),
+        ),
+        "GET menu-detail": get(
+            "menu-detail",
+            f"/api/restaurants/{restaurant_id}/menus/{menu_id}/",
+            owner_id,
+        ),
+        "PATCH menu-detail": (
+            "menu-detail",
+            lambda i: (
+                bench.client(owner_id),
+                "patch",
+                f"/api/restaurants/{restaurant_id}/menus/{menu_id}/",
+                {"items": {"Soup": 5, "Main": 10 + i % 5}},
+            ),
+        ),
+        "GET daily-menu": get(
+            "daily-menu", f"/api/restaurants/{restaurant_id}/daily-menu/"
+        ),
+        "POST vote-create": ("vote-create", vote),
+        "GET vote-results": get("vote-results", "/api/votes/results/"),
+        "GET vote-recommendations": get(
+            "vote-recommendations", "/api/votes/recommendations/"
+        ),
+        "GET metrics": ("metrics", scrape),
+    }
+
+
+def run_noon_burst(bench, clients, votes_per_client):
+    """
+    Let `clients` threads cast votes for today's menus at the same time.
+    """
+    from django.db import connections
+
+    data = bench.dataset
+    employees = data["employee_ids"]
+    voters = employees[: len(employees) // 2]
+    needed = clients * votes_per_client
+    if needed > len(voters):
+        raise SystemExit(f"The noon burst needs {needed} voters, only {len(voters)}.")
+    batches = [
+        voters[i * votes_per_client : (i + 1) * votes_per_client]
+        for i in range(clients)
+    ]
+    # Build tokens up front so the burst only measures voting.
+    for user_id in voters[:needed]:
+        bench.client(user_id)
+    barrier = threading.Barrier(clients)
+
+    def cast(batch):
+        samples, errors = [], 0
+        barrier.wait()
+        try:
+            for user_id in batch:
+                menu = data["today_menus"][data["memberships"][user_id][0]]
+                client = bench.client(user_id)
+                started = time.perf_counter()
+                response = client.post(
+                    "/api/votes/vote/", {"menu": menu}, format="json"
+                )
+                samples.append((time.perf_counter() - started) * 1000)
+                errors += response.status_code != 201
+        finally:
+            connections.close_all()
+        return samples, errors
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        outcomes = list(pool.map(cast, batches))
+    wall = time.perf_counter() - started
+
+    samples = [s for batch, _ in outcomes for s in batch]
+    return {
+        "clients": clients,
+        "votes": needed,
+        "errors": sum(errors for _, errors in outcomes),
+        "wall_seconds": round(wall, 3),
+        "throughput_rps": round(needed / wall, 1),
+        **summarize(samples),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=50_000)
+    parser.add_argument("--restaurants", type=int, default=2_000)
+    parser.add_argument("--memberships", type=int, default=5)
+    parser.add_argument("--history-days", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--iterations", type=int, default=100)
+    parser.add_argument("--burst-clients", type=int, default=16)
+    parser.add_argument("--burst-votes", type=int, default=50)
+    parser.add_argument("--only", help="Comma separated labels to run.")
+    parser.add_argument("--keepdb", action="store_true")
+    parser.add_argument("--output", help="Write the JSON results to this file.")
+    args = parser.parse_args()
+
+    setup_django()
+
+    from django.conf import settings
+    from django.test.utils import (
+        setup_databases,
+        setup_test_environment,
+        teardown_databases,
+    )
+    from django.urls import get_resolver
+    from services.votes.recommendations import refresh_recommendations
+
+    from benchmarks.dataset import seed_dataset
+
+    setup_test_environment()
+    # Scrape /metrics with a token, as a deployment must.
+    settings.METRICS_TOKEN = settings.METRICS_TOKEN or "bench"
+    old_config = setup_databases(verbosity=0, interactive=False, keepdb=args.keepdb)
+    try:
+        started = time.perf_counter()
+        dataset = seed_dataset(
+            users=args.users,
+            restaurants=args.restaurants,
+            memberships_per_user=args.memberships,
+            history_days=args.history_days,
+            seed=args.seed,
+        )
+        seed_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        refresh_recommendations()
+        recommendations_seconds = time.perf_counter() - started
+
+        bench = Bench(dataset)
+        scenarios = build_scenarios(bench)
+        only = set(args.only.split(",")) if args.only else None
+
+        endpoints = {}
+        for label, (url_name, prepare) in scenarios.items():
+            if only and label not in only:
+                continue
+            endpoints[label] = {
+                "url_name": url_name,
+                **bench.measure(prepare, args.iterations),
+            }
+
+        url_names = {
+            name for name in get_resolver().reverse_dict if isinstance(name, str)
+        }
+        covered = {url_name for url_name, _ in scenarios.values()}
+
+        results = {
+            "params": {
+                **vars(args),
+                "database": settings.DATABASES["default"]["ENGINE"],
+            },
+            "seed_seconds": round(seed_seconds, 2),
+            "recommendations_seconds": round(recommendations_seconds, 2),
+            "endpoints": endpoints,
+            "noon_burst": run_noon_burst(bench, args.burst_clients, args.burst_votes),
+            "not_covered": sorted(url_names - covered),
+        }
+    finally:
+        teardown_databases(old_config, verbosity=0, keepdb=args.keepdb)
+
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
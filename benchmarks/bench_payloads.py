@@ -0,0 +1,114 @@
+"""
+Benchmark JSON encoding and response compression on API payloads.
+
+Restaurant and menu lists shaped like the serializer output are encoded
+with DRF's stdlib JSONRenderer and the orjson-backed FastJSONRenderer, then
+compressed with every available encoding. Encode/compress times and
+payload sizes are written as JSON.
+
+Usage:
+    python benchmarks/bench_payloads.py --restaurants 2000 --employees 25 \\
+        --menus 365 --iterations 50 --output payloads.json
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import setup_django, summarize, write_results  # noqa: E402
+
+
+def build_payloads(restaurants, employees, menus, seed=0):
+    """
+    Return restaurant and menu lists as the serializers would produce them.
+    """
+    from services.seeding.generator import DISHES
+
+    rng = random.Random(seed)
+    created = datetime(2025, 1, 1, 9, 30, tzinfo=timezone.utc).isoformat()
+    restaurant_list = [
+        {
+            "id": i,
+            "name": f"Restaurant {i}",
+            "owner": i,
+            "employees": rng.sample(range(1, restaurants * employees), employees),
+            "created_at": created,
+        }
+        for i in range(1, restaurants + 1)
+    ]
+    start = date(2025, 1, 1)
+    menu_list = [
+        {
+            "id": i,
+            "restaurant": 1,
+            "date": (start + timedelta(days=i)).isoformat(),
+            "items": {dish: rng.randint(3, 20) for dish in rng.sample(DISHES, 5)},
+        }
+        for i in range(menus)
+    ]
+    return {"restaurant list": restaurant_list, "menu list": menu_list}
+
+
+def timed(func, iterations):
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        result = func()
+        samples.append((time.perf_counter() - started) * 1000)
+    return result, summarize(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--restaurants", type=int, default=2_000)
+    parser.add_argument("--employees", type=int, default=25)
+    parser.add_argument("--menus", type=int, default=365)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--output", help="Write the JSON results to this file.")
+    args = parser.parse_args()
+
+    setup_django()
+
+    from rest_framework.renderers import JSONRenderer
+
+    from services.api import compression
+    from services.api.renderers import FastJSONRenderer, orjson
+
+    renderers = {"stdlib": JSONRenderer(), "fast": FastJSONRenderer()}
+    encodings = ["gzip"] + (["br"] if compression.brotli is not None else [])
+
+    results = {
+        "params": {
+            **vars(args),
+            "orjson": orjson is not None,
+            "brotli": compression.brotli is not None,
+        },
+        "payloads": {},
+    }
+    for label, payload in build_payloads(
+        args.restaurants, args.employees, args.menus
+    ).items():
+        entry = {}
+        for name, renderer in renderers.items():
+            body, entry[f"encode_{name}"] = timed(
+                lambda: renderer.render(payload), args.iterations
+            )
+            entry[f"bytes_{name}"] = len(body)
+        for encoding in encodings:
+            compressed, entry[f"compress_{encoding}"] = timed(
+                lambda: compression.compress(body, encoding), args.iterations
+            )
+            entry[f"bytes_{encoding}"] = len(compressed)
+            entry[f"ratio_{encoding}"] = round(len(compressed) / len(body), 3)
+        results["payloads"][label] = entry
+
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
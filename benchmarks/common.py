@@ -0,0 +1,57 @@
+"""
+Helpers shared by the benchmark scripts in this directory.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+BASE_DIR = Path(__file__).resolve().parent.parent
+
+
+def setup_django():
+    """
+    Configure Django for a standalone benchmark script.
+    """
+    if str(BASE_DIR) not in sys.path:
+        sys.path.insert(0, str(BASE_DIR))
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "lunch_voting_api.settings")
+
+    import django
+
+    django.setup()
+
+
+def percentile(samples, pct):
+    """
+    Return the `pct` percentile of `samples` using nearest-rank.
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered) + 0.5) - 1))
+    return ordered[rank]
+
+
+def summarize(samples_ms):
+    """
+    Return latency percentiles in milliseconds for a list of samples.
+    """
+    return {
+        "count": len(samples_ms),
+        "p50_ms": round(percentile(samples_ms, 50), 3),
+        "p90_ms": round(percentile(samples_ms, 90), 3),
+        "p99_ms": round(percentile(samples_ms, 99), 3),
+        "max_ms": round(max(samples_ms, default=0.0), 3),
+    }
+
+
+def write_results(results, output=None):
+    """
+    Print benchmark results as JSON and optionally save them to `output`.
+    """
+    payload = json.dumps(results, indent=2, default=str)
+    print(payload)
+    if output:
+        Path(output).write_text(payload + "\n")
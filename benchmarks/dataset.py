@@ -0,0 +1,34 @@
+"""
+Seed a parameterized dataset for the benchmarks.
+"""
+
+BENCH_PASSWORD = "benchpass123"
+
+
+def seed_dataset(
+    users=50_000,
+    restaurants=2_000,
+    memberships_per_user=5,
+    history_days=5,
+    vote_ratio=0.8,
+    seed=0,
+    batch_size=5_000,
+):
+    """
+    Load the dataset with the same generator as `manage.py seed` and
+    return the ids needed to build benchmark requests.
+    """
+    from services.seeding.generator import generate, get_loader
+
+    result = generate(
+        users=users,
+        restaurants=restaurants,
+        memberships_per_user=memberships_per_user,
+        days=history_days,
+        vote_ratio=vote_ratio,
+        seed=seed,
+        password=BENCH_PASSWORD,
+        loader=get_loader(batch_size=batch_size),
+    )
+    result["login_email"] = f"{result['email_prefix']}.employee0@seed.example.com"
+    return result
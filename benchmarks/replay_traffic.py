@@ -0,0 +1,207 @@
+"""
+Replay captured production traffic against a running instance.
+
+Traces recorded by TrafficCaptureMiddleware are re-issued over HTTP at
+their original pacing divided by --speed, from a pool of concurrent
+keep-alive clients. Each recorded user hash is mapped to a local user of
+the same role, so per-user patterns (polling, the noon vote burst) survive
+the replay. Latency percentiles and status codes are reported per URL name
+so runs of two builds against the same traces can be diffed.
+
+Usage:
+    python benchmarks/replay_traffic.py traffic/ --base-url http://127.0.0.1:8000 \\
+        --speed 10 --clients 32 --output replay.json
+"""
+
+import argparse
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
+from pathlib import Path
+from urllib.parse import urlsplit
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from benchmarks.common import setup_django, summarize, write_results  # noqa: E402
+
+
+def local_tokens(traces):
+    """
+    Map every recorded user hash to an access token of a local active user
+    with the same role, spreading hashes evenly over those users.
+    """
+    from rest_framework_simplejwt.tokens import AccessToken
+    from users.models import CustomUser
+
+    hashes = {(trace["u"], trace.get("ro", "")) for trace in traces if "u" in trace}
+    users = CustomUser.objects.filter(is_active=True).order_by("id")
+    by_role = defaultdict(list)
+    for user_id, role in users.values_list("id", "role"):
+        by_role[role].append(user_id)
+    everyone = [user_id for ids in by_role.values() for user_id in ids]
+
+    chosen = {}
+    for user_hash, role in hashes:
+        ids = by_role.get(role) or everyone
+        if not ids:
+            raise SystemExit("The replay needs at least one local user.")
+        chosen[user_hash] = ids[int(user_hash, 16) % len(ids)]
+    users = CustomUser.objects.in_bulk(set(chosen.values()))
+    return {
+        user_hash: str(AccessToken.for_user(users[user_id]))
+        for user_hash, user_id in chosen.items()
+    }
+
+
+class Replayer:
+    """
+    Sends trace requests from worker threads, one keep-alive connection
+    per thread, and collects latencies per URL name.
+    """
+
+    def __init__(self, base_url, tokens, timeout):
+        parts = urlsplit(base_url)
+        self.connection_class = (
+            HTTPSConnection if parts.scheme == "https" else HTTPConnection
+        )
+        self.netloc = parts.netloc
+        self.prefix = parts.path.rstrip("/")
+        self.tokens = tokens
+        self.timeout = timeout
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        # Last ETag seen per (user hash, path), sent back on requests that
+        # were conditional when recorded.
+        self.etags = {}
+        self.samples = defaultdict(list)
+        self.statuses = defaultdict(Counter)
+        self.lag_ms = []
+        self.errors = Counter()
+
+    def connection(self):
+        connection = getattr(self.local, "connection", None)
+        if connection is None:
+            connection = self.local.connection = self.connection_class(
+                self.netloc, timeout=self.timeout
+            )
+        return connection
+
+    def send(self, trace, prepared, due):
+        method, path, body, headers = prepared
+        url_name = trace["r"].split(":")[-1]
+        user_hash = trace.get("u")
+        if user_hash is not None:
+            headers["Authorization"] = f"Bearer {self.tokens[user_hash]}"
+        etag_key = (user_hash, path)
+        if trace.get("h", {}).get("c") and etag_key in self.etags:
+            headers["If-None-Match"] = self.etags[etag_key]
+
+        started = time.perf_counter()
+        with self.lock:
+            self.lag_ms.append((started - due) * 1000)
+        try:
+            connection = self.connection()
+            connection.request(method, self.prefix + path, body=body, headers=headers)
+            response = connection.getresponse()
+            response.read()
+        except (OSError, HTTPException) as error:
+            self.local.connection = None
+            self.error(url_name, type(error).__name__)
+            return
+        elapsed = (time.perf_counter() - started) * 1000
+        if response.will_close:
+            self.local.connection = None
+
+        etag = response.getheader("ETag")
+        with self.lock:
+            if etag:
+                self.etags[etag_key] = etag
+            self.samples[url_name].append(elapsed)
+            self.statuses[url_name][str(response.status)] += 1
+
+    def error(self, url_name, reason):
+        with self.lock:
+            self.errors[f"{url_name}: {reason}"] += 1
+
+    def run(self, traces, speed, clients):
+        """
+        Issue every trace at its recorded offset divided by `speed`.
+        Returns the wall time in seconds.
+        """
+        from django.urls import NoReverseMatch
+        from services.monitoring.traffic import build_request
+
+        # Paths and bodies are built up front so the schedule only sends.
+        # Routes this build no longer has are counted as errors.
+        prepared = []
+        for trace in traces:
+            try:
+                prepared.append((trace, build_request(trace)))
+            except NoReverseMatch:
+                self.error(trace["r"], "NoReverseMatch")
+        first = traces[0]["t"]
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=clients) as pool:
+            for trace, request in prepared:
+                due = started + (trace["t"] - first) / speed
+                delay = due - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                pool.submit(self.send, trace, request, due)
+        return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("traces", nargs="+", help="Trace files or directories.")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--speed", type=float, default=1.0)
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--limit", type=int, help="Replay only the first N traces.")
+    parser.add_argument("--only", help="Comma separated URL names to replay.")
+    parser.add_argument("--output", help="Write the JSON results to this file.")
+    args = parser.parse_args()
+    if not 1 <= args.speed <= 50:
+        parser.error("--speed must be between 1 and 50.")
+
+    setup_django()
+
+    from services.monitoring.traffic import read_traces
+
+    traces = read_traces(args.traces)
+    if args.only:
+        only = set(args.only.split(","))
+        traces = [trace for trace in traces if trace["r"].split(":")[-1] in only]
+    traces = traces[: args.limit]
+    if not traces:
+        raise SystemExit("No traces to replay.")
+
+    replayer = Replayer(args.base_url, local_tokens(traces), args.timeout)
+    wall = replayer.run(traces, args.speed, args.clients)
+
+    sent = sum(len(samples) for samples in replayer.samples.values())
+    results = {
+        "params": vars(args),
+        "traces": len(traces),
+        "recorded_seconds": round(traces[-1]["t"] - traces[0]["t"], 3),
+        "wall_seconds": round(wall, 3),
+        "throughput_rps": round(sent / wall, 1) if wall else 0.0,
+        "schedule_lag": summarize(replayer.lag_ms),
+        "errors": dict(replayer.errors),
+        "endpoints": {
+            url_name: {
+                **summarize(samples),
+                "statuses": dict(replayer.statuses[url_name]),
+            }
+            for url_name, samples in sorted(replayer.samples.items())
+        },
+    }
+    write_results(results, args.output)
+
+
+if __name__ == "__main__":
+    main()
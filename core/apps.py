@@ -0,0 +1,16 @@
+from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+from django.utils.module_loading import autodiscover_modules
+
+
+class CoreConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "core"
+
+    def ready(self):
+        # Register the background tasks defined in each app's tasks.py.
+        autodiscover_modules("tasks")
+
+        from services.monitoring.request_timing import install_query_recorder
+
+        connection_created.connect(install_query_recorder)
@@ -0,0 +1,52 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from services.retention.archive import apply_retention, expired
+
+
+class Command(BaseCommand):
+    help = (
+        "Archive menus and votes older than the retention window to gzipped "
+        "NDJSON files and delete them in small batches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=settings.RETENTION_DAYS)
+        parser.add_argument("--dir", default=settings.RETENTION_ARCHIVE_DIR)
+        parser.add_argument(
+            "--batch-size", type=int, default=settings.DELETE_BATCH_SIZE
+        )
+        parser.add_argument(
+            "--max-batch-seconds",
+            type=float,
+            default=settings.DELETE_MAX_BATCH_SECONDS,
+            help="Shrink batches that take longer than this.",
+        )
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0.0,
+            help="Seconds to sleep between batches.",
+        )
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **options):
+        if options["dry_run"]:
+            cutoff, querysets = expired(options["days"])
+            for queryset in querysets:
+                self.stdout.write(
+                    f"{queryset.model._meta.db_table}: {queryset.count()} rows "
+                    f"before {cutoff}"
+                )
+            return
+
+        results = apply_retention(
+            directory=options["dir"],
+            days=options["days"],
+            batch_size=options["batch_size"],
+            max_batch_seconds=options["max_batch_seconds"],
+            pause=options["pause"],
+        )
+        for table, (deleted, path) in results.items():
+            target = f" -> {path}" if path else ""
+            self.stdout.write(f"{table}: {deleted} rows archived{target}")
+        self.stdout.write(self.style.SUCCESS("Retention applied."))
@@ -0,0 +1,44 @@
+import io
+import pstats
+from collections import Counter
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = "Aggregate collected request profiles into a hot-function report."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--dir", default=None, help="Profile directory (default: PROFILE_DIR)."
+        )
+        parser.add_argument(
+            "--url-name", help="Only include profiles recorded for this URL name."
+        )
+        parser.add_argument("--top", type=int, default=25)
+        parser.add_argument(
+            "--sort",
+            default="cumulative",
+            choices=["cumulative", "tottime", "calls"],
+        )
+
+    def handle(self, *args, **options):
+        directory = Path(options["dir"] or settings.PROFILE_DIR)
+        pattern = f"{options['url_name']}-*.prof" if options["url_name"] else "*.prof"
+        files = sorted(directory.glob(pattern))
+        if not files:
+            raise CommandError(f"No profiles matching {pattern} in {directory}.")
+
+        per_url = Counter(path.name.rsplit("-", 1)[0] for path in files)
+        self.stdout.write(f"Aggregated {len(files)} profiles from {directory}:")
+        for url_name, count in per_url.most_common():
+            self.stdout.write(f"  {url_name}: {count}")
+
+        stream = io.StringIO()
+        stats = pstats.Stats(str(files[0]), stream=stream)
+        for path in files[1:]:
+            stats.add(str(path))
+        stats.strip_dirs().sort_stats(options["sort"]).print_stats(options["top"])
+        self.stdout.write(stream.getvalue())
@@ -0,0 +1,37 @@
+import signal
+
+from django.core.management.base import BaseCommand
+from services.jobs.worker import Worker
+
+
+class Command(BaseCommand):
+    help = "Run background jobs from the database job queue."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--queues",
+            default="default,maintenance",
+            help="Comma separated queues, highest priority first.",
+        )
+        parser.add_argument(
+            "--concurrency", type=int, default=1, help="Jobs run in parallel."
+        )
+        parser.add_argument("--poll-interval", type=float, default=1.0)
+        parser.add_argument(
+            "--burst",
+            action="store_true",
+            help="Exit once no job is due instead of polling.",
+        )
+
+    def handle(self, *args, **options):
+        worker = Worker(
+            queues=[q.strip() for q in options["queues"].split(",") if q.strip()],
+            concurrency=options["concurrency"],
+            poll_interval=options["poll_interval"],
+            burst=options["burst"],
+        )
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(signum, lambda *_: worker.stop())
+
+        processed = worker.run()
+        self.stdout.write(self.style.SUCCESS(f"Processed {processed} job(s)."))
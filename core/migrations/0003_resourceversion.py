@@ -0,0 +1,24 @@
+# Generated by Django 5.1.6 on 2026-10-19 11:51
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0002_outboxevent"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ResourceVersion",
+            fields=[
+                (
+                    "key",
+                    models.CharField(max_length=100, primary_key=True, serialize=False),
+                ),
+                ("version", models.BigIntegerField(default=0)),
+                ("updated_at", models.DateTimeField()),
+            ],
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.1.6 on 2026-10-19 13:03
+
+import services.db.transaction_ids
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0004_idempotencykey"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="outboxevent",
+            name="txid",
+            field=models.BigIntegerField(
+                db_default=services.db.transaction_ids.CurrentTransactionId(),
+                editable=False,
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="outboxevent",
+            index=models.Index(fields=["txid", "id"], name="core_outbox_feed_idx"),
+        ),
+    ]
@@ -0,0 +1,129 @@
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import models
+from django.db.models import Q
+from django.utils import timezone
+from services.db.transaction_ids import CurrentTransactionId
+
+
+class Job(models.Model):
+    """
+    A unit of background work claimed by `manage.py worker` processes.
+    """
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    STATUS_CHOICES = [
+        (QUEUED, "Queued"),
+        (RUNNING, "Running"),
+        (SUCCEEDED, "Succeeded"),
+        (FAILED, "Failed"),
+    ]
+
+    queue = models.CharField(max_length=64, default="default")
+    task = models.CharField(max_length=255)
+    kwargs = models.JSONField(default=dict)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=QUEUED)
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=3)
+    run_at = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    locked_by = models.CharField(max_length=255, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Workers only ever scan due jobs of one queue.
+            models.Index(
+                fields=["queue", "run_at"],
+                condition=Q(status="queued"),
+                name="core_job_due_idx",
+            ),
+            models.Index(
+                fields=["queue", "locked_at"],
+                condition=Q(status="running"),
+                name="core_job_running_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.task} [{self.queue}] {self.status}"
+
+
+class OutboxEvent(models.Model):
+    """
+    An append-only record of a vote or menu change, written in the same
+    transaction as the change and served by the change feed.
+    """
+
+    CREATED = "created"
+    UPDATED = "updated"
+    DELETED = "deleted"
+    ACTION_CHOICES = [
+        (CREATED, "Created"),
+        (UPDATED, "Updated"),
+        (DELETED, "Deleted"),
+    ]
+
+    id = models.BigAutoField(primary_key=True)
+    # The writing transaction. The feed is ordered by (txid, id) and only
+    # serves finished transactions, so an event can never appear behind a
+    # consumer's cursor, however long its transaction runs.
+    txid = models.BigIntegerField(db_default=CurrentTransactionId(), editable=False)
+    topic = models.CharField(max_length=32)
+    action = models.CharField(max_length=16, choices=ACTION_CHOICES)
+    object_id = models.BigIntegerField()
+    payload = models.JSONField(encoder=DjangoJSONEncoder)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["txid", "id"], name="core_outbox_feed_idx")]
+
+    def __str__(self):
+        return f"#{self.id} {self.topic}.{self.action} {self.object_id}"
+
+
+class ResourceVersion(models.Model):
+    """
+    A change counter for a cached API resource, bumped in the transaction
+    that changes it. Conditional GETs compare ETags built from these
+    counters without loading the resource itself.
+    """
+
+    key = models.CharField(max_length=100, primary_key=True)
+    version = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField()
+
+    def __str__(self):
+        return f"{self.key} v{self.version}"
+
+
+class IdempotencyKey(models.Model):
+    """
+    The stored response of the first POST a user sent with an
+    Idempotency-Key header, replayed to retries until it expires.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="idempotency_keys",
+    )
+    key = models.CharField(max_length=255)
+    # SHA-256 of the method, path and body, so a key cannot be reused for
+    # a different request.
+    fingerprint = models.CharField(max_length=64)
+    status_code = models.PositiveSmallIntegerField()
+    body = models.JSONField(null=True, encoder=DjangoJSONEncoder)
+    location = models.CharField(max_length=255, blank=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        unique_together = ("user", "key")
+
+    def __str__(self):
+        return f"{self.user_id}:{self.key} -> {self.status_code}"
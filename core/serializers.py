@@ -0,0 +1,37 @@
+from django.conf import settings
+from rest_framework import serializers
+
+
+class SubRequestSerializer(serializers.Serializer):
+    """
+    One request of a batch: a method, an /api/ path with its query string,
+    an optional JSON body and optional extra headers.
+    """
+
+    method = serializers.ChoiceField(
+        choices=["GET", "HEAD", "OPTIONS", "POST", "PUT", "PATCH", "DELETE"]
+    )
+    path = serializers.CharField()
+    body = serializers.JSONField(required=False)
+    headers = serializers.DictField(child=serializers.CharField(), required=False)
+
+    def to_internal_value(self, data):
+        if isinstance(data, dict) and isinstance(data.get("method"), str):
+            data = {**data, "method": data["method"].upper()}
+        return super().to_internal_value(data)
+
+
+class BatchSerializer(serializers.Serializer):
+    """
+    A batch of sub-requests, limited to BATCH_MAX_REQUESTS.
+    """
+
+    requests = SubRequestSerializer(many=True, allow_empty=False)
+    parallel = serializers.BooleanField(default=False)
+
+    def validate_requests(self, value):
+        if len(value) > settings.BATCH_MAX_REQUESTS:
+            raise serializers.ValidationError(
+                f"A batch holds at most {settings.BATCH_MAX_REQUESTS} requests."
+            )
+        return value
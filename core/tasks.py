@@ -0,0 +1,20 @@
+from core.models import IdempotencyKey
+from django.utils.timezone import now
+from services.jobs.queue import task
+from services.retention.archive import apply_retention as apply_now
+
+
+@task(queue="maintenance", max_attempts=1)
+def apply_retention():
+    """
+    Archive and delete menus and votes older than RETENTION_DAYS.
+    """
+    apply_now()
+
+
+@task(queue="maintenance")
+def prune_idempotency_keys():
+    """
+    Delete the stored responses of expired idempotency keys.
+    """
+    IdempotencyKey.objects.filter(expires_at__lte=now()).delete()
@@ -0,0 +1,188 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils.timezone import now
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+from restaurants.models import Menu, Restaurant
+from votes.models import Vote
+
+
+@pytest.fixture
+def data(django_user_model):
+    """
+    Creates an employee of a restaurant that has today's menu.
+    """
+    owner = django_user_model.objects.create_user(
+        email="batch.owner@example.com", password="testpass123", role="restaurant_admin"
+    )
+    employee = django_user_model.objects.create_user(
+        email="batch.employee@example.com", password="testpass123"
+    )
+    restaurant = Restaurant.objects.create(name="Batch Cafe", owner=owner)
+    restaurant.employees.add(employee)
+    menu = Menu.objects.create(
+        restaurant=restaurant, date=now().date(), items={"Soup": 5}
+    )
+    return employee, restaurant, menu
+
+
+def client_for(user):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+    return client
+
+
+def app_start(restaurant):
+    return [
+        {"method": "GET", "path": "/api/auth/profile/"},
+        {"method": "GET", "path": "/api/restaurants/?fields=id,name"},
+        {"method": "get", "path": f"/api/restaurants/{restaurant.id}/daily-menu/"},
+        {"method": "GET", "path": "/api/votes/results/"},
+    ]
+
+
+@pytest.mark.django_db
+def test_batch_matches_individual_requests(data):
+    """Test that each sub-response equals the response of its own request."""
+    employee, restaurant, _ = data
+    client = client_for(employee)
+    subs = app_start(restaurant)
+
+    response = client.post("/api/batch/", {"requests": subs}, format="json")
+
+    assert response.status_code == 200
+    for sub, result in zip(subs, response.json()["responses"]):
+        expected = client.get(sub["path"])
+        assert result["status"] == expected.status_code
+        assert result["body"] == expected.json()
+
+
+@pytest.mark.django_db
+def test_batch_validates_the_token_once(data):
+    """Test that sub-requests reuse the batch's authenticated user."""
+    employee, restaurant, _ = data
+    client = client_for(employee)
+
+    with CaptureQueriesContext(connection) as queries:
+        client.post("/api/batch/", {"requests": app_start(restaurant)}, format="json")
+
+    user_lookups = [q for q in queries if 'FROM "users_customuser"' in q["sql"]]
+    assert len(user_lookups) == 1
+
+
+@pytest.mark.django_db
+def test_batch_runs_writes_in_order(data):
+    """Test that a write is visible to the reads that follow it."""
+    employee, restaurant, menu = data
+
+    response = client_for(employee).post(
+        "/api/batch/",
+        {
+            "requests": [
+                {
+                    "method": "POST",
+                    "path": "/api/votes/vote/",
+                    "body": {"menu": menu.id},
+                },
+                {
+                    "method": "POST",
+                    "path": "/api/votes/vote/",
+                    "body": {"menu": menu.id},
+                },
+                {"method": "GET", "path": "/api/votes/results/"},
+            ]
+        },
+        format="json",
+    )
+
+    created, duplicate, results = response.json()["responses"]
+    assert created["status"] == 201
+    assert duplicate["status"] == 400
+    assert results["body"][0]["votes"] == 1
+    assert Vote.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_batch_headers_stay_on_the_batch(data):
+    """Test that idempotency and conditional headers are per sub-request."""
+    employee, restaurant, menu = data
+    client = client_for(employee)
+    etag = client.get("/api/votes/results/")["ETag"]
+    vote = {"method": "POST", "path": "/api/votes/vote/", "body": {"menu": menu.id}}
+    results = {"method": "GET", "path": "/api/votes/results/"}
+
+    response = client.post(
+        "/api/batch/",
+        {
+            "requests": [
+                results,
+                vote,
+                vote,
+                {**results, "headers": {"If-None-Match": "*"}},
+            ]
+        },
+        format="json",
+        HTTP_IDEMPOTENCY_KEY="batch-1",
+        HTTP_IF_NONE_MATCH=etag,
+    )
+
+    statuses = [r["status"] for r in response.json()["responses"]]
+    assert statuses == [200, 201, 400, 304]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_batch_runs_reads_in_parallel(data):
+    """Test that parallel reads return the same responses in order."""
+    employee, restaurant, _ = data
+    client = client_for(employee)
+    subs = app_start(restaurant)
+
+    sequential = client.post("/api/batch/", {"requests": subs}, format="json")
+    parallel = client.post(
+        "/api/batch/", {"requests": subs, "parallel": True}, format="json"
+    )
+
+    assert parallel.json() == sequential.json()
+
+
+@pytest.mark.django_db
+def test_batch_rejects_bad_sub_requests(data, settings):
+    """Test the size limit, foreign paths, nesting and unknown routes."""
+    employee, _, _ = data
+    client = client_for(employee)
+    settings.BATCH_MAX_REQUESTS = 2
+
+    too_many = [{"method": "GET", "path": "/api/auth/profile/"}] * 3
+    response = client.post("/api/batch/", {"requests": too_many}, format="json")
+    assert response.status_code == 400
+
+    response = client.post(
+        "/api/batch/",
+        {
+            "requests": [
+                {"method": "GET", "path": "/metrics"},
+                {"method": "POST", "path": "/api/batch/", "body": {"requests": []}},
+            ]
+        },
+        format="json",
+    )
+    assert [r["status"] for r in response.json()["responses"]] == [400, 400]
+
+    response = client.post(
+        "/api/batch/",
+        {"requests": [{"method": "GET", "path": "/api/nowhere/"}]},
+        format="json",
+    )
+    assert response.json()["responses"][0]["status"] == 404
+
+
+@pytest.mark.django_db
+def test_batch_requires_authentication():
+    """Test that anonymous batches are rejected."""
+    response = APIClient().post(
+        "/api/batch/",
+        {"requests": [{"method": "GET", "path": "/api/auth/profile/"}]},
+        format="json",
+    )
+    assert response.status_code == 401
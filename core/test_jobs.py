@@ -0,0 +1,149 @@
+from datetime import timedelta
+
+import pytest
+from core.models import Job
+from django.utils.timezone import now
+from restaurants.models import Restaurant
+from rest_framework.test import APIClient
+from services.jobs.queue import claim, requeue_stale, run, schedule_periodic, task
+from services.jobs.worker import Worker
+
+calls = []
+
+
+@task(name="tests.record")
+def record(value):
+    calls.append(value)
+
+
+@task(name="tests.tick")
+def tick():
+    calls.append("tick")
+
+
+@task(name="tests.explode", max_attempts=2)
+def explode():
+    raise RuntimeError("boom")
+
+
+@pytest.fixture(autouse=True)
+def reset_calls():
+    calls.clear()
+
+
+@pytest.mark.django_db
+def test_enqueued_job_is_claimed_and_run():
+    """Test that a claimed job runs its task and is marked succeeded."""
+    job = record.enqueue(value=1)
+
+    claimed = claim(["default"], "test")
+    assert claimed.id == job.id
+    assert claimed.status == Job.RUNNING
+    assert claim(["default"], "test") is None
+
+    assert run(claimed) == Job.SUCCEEDED
+    assert calls == [1]
+
+
+@pytest.mark.django_db
+def test_failed_job_is_retried_with_backoff_then_failed(settings):
+    """Test that failures back off exponentially until attempts run out."""
+    settings.JOB_RETRY_BACKOFF = 10
+    job = explode.enqueue()
+
+    assert run(claim(["default"], "test")) == Job.QUEUED
+    job.refresh_from_db()
+    assert "RuntimeError: boom" in job.last_error
+    assert job.run_at > now() + timedelta(seconds=9)
+    assert claim(["default"], "test") is None
+
+    Job.objects.filter(id=job.id).update(run_at=now())
+    assert run(claim(["default"], "test")) == Job.FAILED
+
+
+@pytest.mark.django_db
+def test_scheduled_job_waits_for_run_at():
+    """Test that a delayed job is not claimed before it is due."""
+    record.enqueue(delay=60, value=1)
+
+    assert claim(["default"], "test") is None
+
+
+@pytest.mark.django_db
+def test_queue_concurrency_limit(settings):
+    """Test that a limited queue is skipped while it is at its limit."""
+    settings.JOB_QUEUE_CONCURRENCY = {"exports": 1}
+    record.enqueue(queue="exports", value=1)
+    record.enqueue(queue="exports", value=2)
+    record.enqueue(value=3)
+
+    first = claim(["exports", "default"], "a")
+    second = claim(["exports", "default"], "b")
+    assert (first.queue, second.queue) == ("exports", "default")
+
+    run(first)
+    assert claim(["exports"], "a").kwargs == {"value": 2}
+
+
+@pytest.mark.django_db
+def test_stale_running_job_is_requeued():
+    """Test that a job held by a dead worker goes back to the queue."""
+    record.enqueue(value=1)
+    job = claim(["default"], "dead")
+    Job.objects.filter(id=job.id).update(locked_at=now() - timedelta(hours=2))
+
+    assert requeue_stale(timeout=60) == 1
+    job.refresh_from_db()
+    assert job.status == Job.QUEUED
+    assert job.locked_by == ""
+
+
+@pytest.mark.django_db
+def test_periodic_tasks_are_scheduled_once_per_interval(settings):
+    """Test that workers enqueue scheduled tasks only when they are due."""
+    settings.JOB_SCHEDULE = {"tests.tick": 3600}
+
+    assert schedule_periodic(["maintenance"]) == []
+    assert schedule_periodic(["default"]) == ["tests.tick"]
+    assert schedule_periodic(["default"]) == []
+
+    job = claim(["default"], "test")
+    assert run(job) == Job.SUCCEEDED
+    assert schedule_periodic(["default"]) == []
+
+    Job.objects.filter(id=job.id).update(created_at=now() - timedelta(hours=2))
+    assert schedule_periodic(["default"]) == ["tests.tick"]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_burst_worker_drains_queues():
+    """Test that a burst worker runs every due job and exits."""
+    for value in range(3):
+        record.enqueue(value=value)
+
+    processed = Worker(["default"], burst=True).run()
+
+    assert processed == 3
+    assert sorted(calls) == [0, 1, 2]
+    assert not Job.objects.exclude(status=Job.SUCCEEDED).exists()
+
+
+@pytest.mark.django_db
+def test_restaurant_delete_in_background(settings, django_user_model):
+    """Test that restaurant deletion is queued and done by the worker task."""
+    settings.RESTAURANT_DELETE_IN_BACKGROUND = True
+    owner = django_user_model.objects.create_user(
+        email="jobs.owner@example.com", password="testpass123", role="restaurant_admin"
+    )
+    restaurant = Restaurant.objects.create(name="Queued Grill", owner=owner)
+    client = APIClient()
+    client.force_authenticate(user=owner)
+
+    response = client.delete(f"/api/restaurants/{restaurant.id}/")
+
+    assert response.status_code == 202
+    assert Restaurant.objects.filter(id=restaurant.id).exists()
+    job = claim(["maintenance"], "test")
+    assert job.id == response.data["job"]
+    assert run(job) == Job.SUCCEEDED
+    assert not Restaurant.objects.filter(id=restaurant.id).exists()
@@ -0,0 +1,118 @@
+import json
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from rest_framework.test import APIClient
+from services.monitoring.metrics import (
+    MetricsRegistry,
+    record_cache_lookup,
+    render_metrics,
+)
+
+User = get_user_model()
+
+METRICS_URL = "/metrics"
+
+
+@pytest.fixture
+def client():
+    return APIClient()
+
+
+@pytest.mark.django_db
+@override_settings(METRICS_PUBLIC=True)
+def test_metrics_exposition(client):
+    """
+    Test that request latency and status counts are exposed per URL name.
+    """
+    user = User.objects.create_user(email="metrics@example.com", password="pass1234")
+    client.force_authenticate(user=user)
+    client.get("/api/auth/profile/")
+    record_cache_lookup("membership", hit=True)
+
+    response = client.get(METRICS_URL)
+    body = response.content.decode()
+
+    assert response.status_code == 200
+    assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE lunch_http_request_duration_seconds histogram" in body
+    assert (
+        'lunch_http_request_duration_seconds_bucket{url_name="user_profile",le="+Inf"}'
+        in body
+    )
+    assert 'lunch_http_responses_total{url_name="user_profile",status="200"}' in body
+    assert 'lunch_cache_hit_ratio{cache="membership"}' in body
+    assert "lunch_votes_accepted_last_minute 0" in body
+
+
+@pytest.mark.django_db
+@override_settings(METRICS_TOKEN="secret")
+def test_metrics_token_required(client):
+    """
+    Test that the endpoint rejects scrapes without the configured token.
+    """
+    assert client.get(METRICS_URL).status_code == 403
+    assert client.get(METRICS_URL, HTTP_AUTHORIZATION="Bearer nope").status_code == 403
+    response = client.get(METRICS_URL, HTTP_AUTHORIZATION="Bearer secret")
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+@override_settings(METRICS_TOKEN="", METRICS_PUBLIC=False)
+def test_metrics_closed_without_token(client):
+    """
+    Test that the endpoint is not public unless explicitly opted out.
+    """
+    assert client.get(METRICS_URL).status_code == 403
+    with override_settings(METRICS_PUBLIC=True):
+        assert client.get(METRICS_URL).status_code == 200
+
+
+def test_snapshots_are_aggregated_across_processes(tmp_path, settings):
+    """
+    Test that snapshot files written by other workers are merged.
+    """
+    settings.METRICS_DIR = str(tmp_path)
+    worker = MetricsRegistry()
+    worker.inc("lunch_votes_accepted_total", value=3)
+    worker.observe("lunch_http_request_duration_seconds", 0.02, (("url_name", "x"),))
+    snapshot = worker.snapshot()
+    snapshot["pid"] = 999999
+    (tmp_path / "metrics_999999.json").write_text(json.dumps(snapshot))
+
+    local = MetricsRegistry()
+    local.inc("lunch_votes_accepted_total", value=2)
+    totals = sum(
+        value
+        for snap in local.collect()
+        for name, _, value in snap["counters"]
+        if name == "lunch_votes_accepted_total"
+    )
+
+    assert totals == 5
+
+
+def test_exited_workers_keep_their_totals(tmp_path, settings):
+    """
+    Test that counters of exited workers survive their snapshot file.
+    """
+    settings.METRICS_DIR = str(tmp_path)
+    worker = MetricsRegistry()
+    worker.register_counter(
+        lambda: [("lunch_db_pool_checkouts_total", (("alias", "default"),), 7)]
+    )
+    worker.register_gauge(
+        lambda: [("lunch_db_pool_connections", (("alias", "default"),), 3)]
+    )
+    snapshot = worker.snapshot()
+    snapshot["pid"] = 999999
+    dead = tmp_path / "metrics_999999.json"
+    dead.write_text(json.dumps(snapshot))
+
+    for _ in range(2):
+        output = render_metrics()
+        assert "# TYPE lunch_db_pool_checkouts_total counter" in output
+        assert 'lunch_db_pool_checkouts_total{alias="default"} 7\n' in output
+        assert 'lunch_db_pool_connections{alias="default"} 3' not in output
+        assert not dead.exists()
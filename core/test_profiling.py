@@ -0,0 +1,91 @@
+from io import StringIO
+
+import pytest
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+User = get_user_model()
+
+PROFILE_URL = "/api/auth/profile/"
+
+
+@pytest.fixture
+def make_client(db):
+    """
+    Fixture returning a JWT-authenticated client for a new user.
+    """
+
+    def _make_client(email, is_staff):
+        user = User.objects.create_user(
+            email=email, password="testpass123", is_staff=is_staff
+        )
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+        return client
+
+    return _make_client
+
+
+@pytest.fixture
+def profile_dir(settings, tmp_path):
+    settings.PROFILE_DIR = str(tmp_path)
+    settings.PROFILE_SUMMARY_TOP_N = 3
+    return tmp_path
+
+
+def test_staff_request_is_profiled(make_client, profile_dir):
+    """Test that staff users get a profile file and a summary header."""
+    client = make_client("staff@example.com", is_staff=True)
+
+    response = client.get(PROFILE_URL, HTTP_X_PROFILE="1")
+
+    assert response.status_code == 200
+    assert response["X-Profile-Summary"].count("cum_ms=") == 3
+    assert [p.name.split("-")[0] for p in profile_dir.glob("*.prof")] == [
+        "user_profile"
+    ]
+
+
+def test_non_staff_request_is_not_profiled(make_client, profile_dir):
+    """Test that the profiling flag is ignored for regular users."""
+    client = make_client("employee@example.com", is_staff=False)
+
+    response = client.get(f"{PROFILE_URL}?profile=1")
+
+    assert response.status_code == 200
+    assert "X-Profile-Summary" not in response
+    assert not list(profile_dir.glob("*.prof"))
+
+
+@pytest.mark.parametrize(
+    "flags",
+    [
+        {"HTTP_X_PROFILE": "0"},
+        {"QUERY_STRING": "profile=0"},
+        {"QUERY_STRING": "profile=false"},
+    ],
+)
+def test_false_flags_do_not_profile(make_client, profile_dir, flags):
+    """Test that the profiling flags are read as booleans."""
+    client = make_client("staff@example.com", is_staff=True)
+
+    response = client.get(PROFILE_URL, **flags)
+
+    assert response.status_code == 200
+    assert "X-Profile-Summary" not in response
+    assert not list(profile_dir.glob("*.prof"))
+
+
+def test_profile_report_command(make_client, profile_dir):
+    """Test that collected profiles are aggregated into a report."""
+    client = make_client("staff@example.com", is_staff=True)
+    client.get(PROFILE_URL, HTTP_X_PROFILE="1")
+    client.get(f"{PROFILE_URL}?profile=true")
+
+    out = StringIO()
+    call_command("profile_report", "--top", "5", stdout=out)
+
+    assert "Aggregated 2 profiles" in out.getvalue()
+    assert "user_profile: 2" in out.getvalue()
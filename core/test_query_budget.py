@@ -0,0 +1,40 @@
+import pytest
+from django.test import override_settings
+from django.urls import get_resolver
+from services.testing.query_budget import QUERY_BUDGETS, assert_query_budget
+
+
+def metrics_request(dataset):
+    client = dataset.client()
+    client.credentials(HTTP_AUTHORIZATION="Bearer scrape")
+    return client, "/metrics", None
+
+
+def batch_request(dataset):
+    user = dataset.fresh_employee()
+    requests = [
+        {"method": "GET", "path": "/api/auth/profile/"},
+        {"method": "GET", "path": "/api/restaurants/"},
+    ]
+    return dataset.client(user), "/api/batch/", {"requests": requests}
+
+
+@pytest.mark.django_db
+@override_settings(METRICS_TOKEN="scrape")
+def test_metrics_query_budget():
+    """Test that the metrics endpoint never touches the database."""
+    assert_query_budget("metrics", "get", metrics_request)
+
+
+@pytest.mark.django_db
+def test_batch_query_budget():
+    """Test that a batch costs no more than its sub-requests."""
+    assert_query_budget("batch", "post", batch_request)
+
+
+def test_every_url_has_a_query_budget():
+    """Test that new endpoints cannot be added without a query budget."""
+    url_names = {name for name in get_resolver().reverse_dict if isinstance(name, str)}
+    budgeted = {url_name for url_name, _ in QUERY_BUDGETS}
+
+    assert url_names - budgeted == set()
@@ -0,0 +1,77 @@
+import gzip
+import json
+from datetime import timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.utils.timezone import now
+from restaurants.models import Menu, Restaurant
+from services.db.batch_delete import delete_in_batches
+from votes.models import Vote
+
+
+@pytest.fixture
+def history(django_user_model):
+    """
+    Creates menus and votes two years ago and today.
+    """
+    owner = django_user_model.objects.create_user(
+        email="retention.owner@example.com",
+        password="testpass123",
+        role="restaurant_admin",
+    )
+    voters = [
+        django_user_model.objects.create_user(
+            email=f"retention{i}@example.com", password="testpass123"
+        )
+        for i in range(5)
+    ]
+    restaurant = Restaurant.objects.create(name="Retention Grill", owner=owner)
+    today = now().date()
+    for day in (today - timedelta(days=730), today):
+        menu = Menu.objects.create(restaurant=restaurant, date=day, items={"Soup": 5})
+        for voter in voters:
+            Vote.objects.create(user=voter, menu=menu)
+    return restaurant, today
+
+
+@pytest.mark.django_db
+def test_delete_in_batches_visits_every_row(history):
+    """Test that batched deletes remove all rows and report each batch."""
+    batches = []
+    deleted = delete_in_batches(
+        Vote.objects.all(), batch_size=2, on_batch=lambda rows: batches.append(rows)
+    )
+
+    assert deleted == 10
+    assert [len(batch) for batch in batches] == [2, 2, 2, 2, 2]
+    assert not Vote.objects.exists()
+
+
+@pytest.mark.django_db
+def test_retention_archives_and_deletes_expired_rows(history, tmp_path):
+    """Test that rows older than the window are archived and deleted."""
+    _, today = history
+    call_command(
+        "apply_retention", "--days", "365", "--dir", str(tmp_path), stdout=StringIO()
+    )
+
+    assert list(Menu.objects.values_list("date", flat=True)) == [today]
+    assert Vote.objects.count() == 5
+    archives = {path.name.split("-")[0]: path for path in tmp_path.iterdir()}
+    assert set(archives) == {"votes_vote", "restaurants_menu"}
+    votes = gzip.decompress(archives["votes_vote"].read_bytes()).splitlines()
+    assert len(votes) == 5
+    assert json.loads(votes[0])["date"] == str(today - timedelta(days=730))
+
+
+@pytest.mark.django_db
+def test_retention_dry_run_keeps_rows(history, tmp_path):
+    """Test that a dry run only reports counts."""
+    out = StringIO()
+    call_command("apply_retention", "--dry-run", "--dir", str(tmp_path), stdout=out)
+
+    assert "votes_vote: 5 rows" in out.getvalue()
+    assert Vote.objects.count() == 10
+    assert not any(tmp_path.iterdir())
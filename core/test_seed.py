@@ -0,0 +1,58 @@
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from restaurants.models import Menu, Restaurant
+from users.models import CustomUser
+from votes.models import Vote
+
+SEED_ARGS = ["--users", "30", "--restaurants", "4", "--days", "3"]
+
+
+@pytest.mark.django_db
+def test_seed_generates_dataset():
+    """Test that the seed command loads every table."""
+    out = StringIO()
+    call_command("seed", *SEED_ARGS, stdout=out)
+
+    assert CustomUser.objects.count() == 34
+    assert Restaurant.objects.count() == 4
+    assert Menu.objects.count() == 4 * 4
+    assert Vote.objects.exists()
+    assert "votes/min" in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_seeded_votes_respect_memberships():
+    """Test that every generated vote is for a restaurant the voter belongs to."""
+    call_command("seed", *SEED_ARGS, stdout=StringIO())
+
+    memberships = set(
+        Restaurant.employees.through.objects.values_list(
+            "customuser_id", "restaurant_id"
+        )
+    )
+    votes = Vote.objects.values_list("user_id", "menu__restaurant_id")
+
+    assert set(votes) <= memberships
+
+
+@pytest.mark.django_db
+def test_seed_is_deterministic_and_refuses_reload():
+    """Test that a seed produces the same votes and cannot be loaded twice."""
+    call_command("seed", *SEED_ARGS, stdout=StringIO())
+    first = list(Vote.objects.order_by("id").values_list("user_id", "menu_id"))
+
+    with pytest.raises(CommandError):
+        call_command("seed", *SEED_ARGS, stdout=StringIO())
+
+    Vote.objects.all().delete()
+    Menu.objects.all().delete()
+    Restaurant.objects.all().delete()
+    CustomUser.objects.all().delete()
+    call_command("seed", *SEED_ARGS, stdout=StringIO())
+    second = list(Vote.objects.order_by("id").values_list("user_id", "menu_id"))
+
+    offset = first[0][0] - second[0][0], first[0][1] - second[0][1]
+    assert [(u - offset[0], m - offset[1]) for u, m in first] == second
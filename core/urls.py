@@ -0,0 +1,7 @@
+from django.urls import path
+from .views import metrics_view, BatchView
+
+urlpatterns = [
+    path("metrics", metrics_view, name="metrics"),
+    path("api/batch/", BatchView.as_view(), name="batch"),
+]
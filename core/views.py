@@ -0,0 +1,59 @@
+import hmac
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+from django.views.decorators.http import require_GET
+from rest_framework import generics
+from rest_framework.response import Response
+from services.api.batch import run_batch
+from services.monitoring.metrics import render_metrics
+from .serializers import BatchSerializer
+
+
+@require_GET
+def metrics_view(request):
+    """
+    Prometheus scrape endpoint in the text exposition format.
+
+    Scrapes must send `Bearer <METRICS_TOKEN>`; without a token the endpoint
+    is closed unless METRICS_PUBLIC is set.
+    """
+    token = settings.METRICS_TOKEN
+    if token:
+        sent = request.headers.get("Authorization", "")
+        if not hmac.compare_digest(sent.encode(), f"Bearer {token}".encode()):
+            return HttpResponseForbidden()
+    elif not settings.METRICS_PUBLIC:
+        return HttpResponseForbidden()
+
+    return HttpResponse(
+        render_metrics(), content_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+class BatchView(generics.GenericAPIView):
+    """
+    API endpoint running several API requests in one round trip.
+
+    The batch is authenticated once and its sub-requests run as the same
+    user; responses come back in request order.
+    """
+
+    serializer_class = BatchSerializer
+    batchable = False
+
+    def post(self, request, *args, **kwargs):
+        """
+        Runs the sub-requests, reads concurrently when `parallel` is set.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        return Response(
+            {
+                "responses": run_batch(
+                    request,
+                    serializer.validated_data["requests"],
+                    serializer.validated_data["parallel"],
+                )
+            }
+        )
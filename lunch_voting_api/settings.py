@@ -39,21 +39,29 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django_filters",
     "rest_framework",
     "rest_framework_simplejwt",
     "rest_framework_simplejwt.token_blacklist",
     "users",
     "restaurants",
     "votes",
+    "core",
 ]
 
 MIDDLEWARE = [
+    "services.monitoring.metrics.MetricsMiddleware",
+    "services.api.compression.CompressionMiddleware",
     "django.middleware.security.SecurityMiddleware",
+    "services.monitoring.request_timing.RequestTimingMiddleware",
+    "services.monitoring.traffic.TrafficCaptureMiddleware",
+    "services.db.replica_router.ReplicaRoutingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
+    "services.monitoring.profiling.ProfilingMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
@@ -82,17 +90,59 @@ WSGI_APPLICATION = "lunch_voting_api.wsgi.application"
 # Database
 # https://docs.djangoproject.com/en/5.1/ref/settings/#databases
 
+DB_POOL_ENABLED = os.getenv("DB_POOL_ENABLED", "True") == "True"
+
 DATABASES = {
     "default": {
-        "ENGINE": "django.db.backends.postgresql",
+        "ENGINE": (
+            "services.db.pooled_postgresql"
+            if DB_POOL_ENABLED
+            else "django.db.backends.postgresql"
+        ),
         "NAME": os.getenv("DB_NAME"),
         "USER": os.getenv("DB_USER"),
         "PASSWORD": os.getenv("DB_PASSWORD"),
         "HOST": os.getenv("DB_HOST"),
         "PORT": os.getenv("DB_PORT"),
+        # Connections are returned to the pool at the end of each request.
+        "POOL": {
+            "MIN_SIZE": int(os.getenv("DB_POOL_MIN_SIZE", "2")),
+            "MAX_SIZE": int(os.getenv("DB_POOL_MAX_SIZE", "10")),
+            "TIMEOUT": float(os.getenv("DB_POOL_TIMEOUT", "5")),
+            "MAX_IDLE": float(os.getenv("DB_POOL_MAX_IDLE", "300")),
+            "MAX_LIFETIME": float(os.getenv("DB_POOL_MAX_LIFETIME", "1800")),
+            "HEALTH_CHECK_INTERVAL": float(
+                os.getenv("DB_POOL_HEALTH_CHECK_INTERVAL", "0")
+            ),
+        },
     }
 }
 
+# Read replicas: comma separated hosts sharing the primary's credentials,
+# and/or SQLite files (local copies of a SQLite primary, for development).
+# Tests mirror them to the primary test database.
+
+DATABASE_REPLICAS = []
+for host in filter(None, os.getenv("DB_REPLICA_HOSTS", "").split(",")):
+    alias = f"replica_{len(DATABASE_REPLICAS)}"
+    DATABASES[alias] = {
+        **DATABASES["default"],
+        "HOST": host.strip(),
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(alias)
+for path in filter(None, os.getenv("DB_REPLICA_SQLITE_PATHS", "").split(",")):
+    alias = f"replica_{len(DATABASE_REPLICAS)}"
+    DATABASES[alias] = {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": path.strip(),
+        "TEST": {"MIRROR": "default"},
+    }
+    DATABASE_REPLICAS.append(alias)
+
+DATABASE_ROUTERS = ["services.db.replica_router.ReplicaRouter"]
+REPLICA_STICKY_SECONDS = int(os.getenv("REPLICA_STICKY_SECONDS", "5"))
+
 AUTH_USER_MODEL = "users.CustomUser"
 
 REST_FRAMEWORK = {
@@ -100,8 +150,140 @@ REST_FRAMEWORK = {
         "rest_framework_simplejwt.authentication.JWTAuthentication",
     ),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
+    "DEFAULT_VERSIONING_CLASS": "services.api.versioning.HeaderVersioning",
+    "DEFAULT_VERSION": "1",
+    "ALLOWED_VERSIONS": ("1", "2"),
+    "DEFAULT_RENDERER_CLASSES": (
+        "services.api.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "DEFAULT_PARSER_CLASSES": (
+        "services.api.renderers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ),
 }
 
+# Serve DailyMenuView, VoteResultsView and UserProfileView as native async
+# views. Only worth enabling under an ASGI server.
+
+ASYNC_READ_VIEWS = os.getenv("ASYNC_READ_VIEWS", "False") == "True"
+
+# Render restaurant and menu lists from .values_list() rows instead of
+# model instances and DRF fields. The output is the same either way.
+
+FAST_LIST_SERIALIZATION = os.getenv("FAST_LIST_SERIALIZATION", "True") == "True"
+
+# Vote table partitioning (PostgreSQL only)
+# Monthly partitions are created this many months ahead; `vote_partitions
+# archive` exports and drops months older than the retention window.
+
+VOTE_PARTITION_MONTHS_AHEAD = int(os.getenv("VOTE_PARTITION_MONTHS_AHEAD", "2"))
+VOTE_PARTITION_RETAIN_MONTHS = int(os.getenv("VOTE_PARTITION_RETAIN_MONTHS", "12"))
+VOTE_ARCHIVE_DIR = os.getenv("VOTE_ARCHIVE_DIR", str(BASE_DIR / "archive"))
+
+# Retention of detailed menu and vote history, and batched deletes
+# Deletes run in batches of at most DELETE_BATCH_SIZE rows, shrinking when a
+# batch takes longer than DELETE_MAX_BATCH_SECONDS.
+
+RETENTION_DAYS = int(os.getenv("RETENTION_DAYS", "365"))
+RETENTION_ARCHIVE_DIR = os.getenv(
+    "RETENTION_ARCHIVE_DIR", str(Path(VOTE_ARCHIVE_DIR) / "retention")
+)
+DELETE_BATCH_SIZE = int(os.getenv("DELETE_BATCH_SIZE", "1000"))
+DELETE_MAX_BATCH_SECONDS = float(os.getenv("DELETE_MAX_BATCH_SECONDS", "0.5"))
+
+# Background jobs
+# JOB_QUEUE_CONCURRENCY caps running jobs per queue across all workers,
+# e.g. "maintenance=1,exports=2"; unlisted queues are unlimited.
+# JOB_SCHEDULE lists tasks workers enqueue periodically, as
+# "task=seconds" pairs; a task is skipped while a job for it is pending.
+
+JOB_QUEUE_CONCURRENCY = {
+    queue: int(limit)
+    for queue, _, limit in (
+        item.partition("=")
+        for item in os.getenv("JOB_QUEUE_CONCURRENCY", "maintenance=1").split(",")
+        if item
+    )
+}
+JOB_SCHEDULE = {
+    name: float(interval)
+    for name, _, interval in (
+        item.partition("=")
+        for item in os.getenv(
+            "JOB_SCHEDULE", "votes.tasks.ensure_vote_partitions=86400"
+        ).split(",")
+        if item
+    )
+}
+JOB_RETRY_BACKOFF = float(os.getenv("JOB_RETRY_BACKOFF", "30"))
+JOB_LOCK_TIMEOUT = float(os.getenv("JOB_LOCK_TIMEOUT", "3600"))
+RESTAURANT_DELETE_IN_BACKGROUND = (
+    os.getenv("RESTAURANT_DELETE_IN_BACKGROUND", "False") == "True"
+)
+
+# Change feed of the vote/menu outbox, served in commit order.
+
+EVENT_FEED_MAX_LIMIT = int(os.getenv("EVENT_FEED_MAX_LIMIT", "1000"))
+EVENT_FEED_MAX_WAIT = float(os.getenv("EVENT_FEED_MAX_WAIT", "25"))
+EVENT_FEED_POLL_INTERVAL = float(os.getenv("EVENT_FEED_POLL_INTERVAL", "0.5"))
+
+# Restaurants kept per user by refresh_recommendations.
+
+RECOMMENDATIONS_TOP_K = int(os.getenv("RECOMMENDATIONS_TOP_K", "5"))
+
+# Idempotency-Key support on vote and menu POSTs: how long responses are
+# replayed, and how long a retry waits for the original request (seconds).
+
+IDEMPOTENCY_KEY_TTL = int(os.getenv("IDEMPOTENCY_KEY_TTL", "86400"))
+IDEMPOTENCY_LOCK_TIMEOUT = float(os.getenv("IDEMPOTENCY_LOCK_TIMEOUT", "10"))
+
+# Cache shared by every process, holding the restaurant membership index and
+# read-your-writes pins; entries dropped by one process must be gone for all.
+# Set REDIS_URL in production. Without it the database cache table is used
+# (created by `python manage.py createcachetable`).
+
+REDIS_URL = os.getenv("REDIS_URL", "")
+CACHES = {
+    "default": (
+        {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+        if REDIS_URL
+        else {
+            "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+            "LOCATION": "django_cache",
+        }
+    )
+}
+
+# Cached restaurant owners and employee ids for permission and vote checks.
+# Entries are dropped when the restaurant or its employees change.
+
+MEMBERSHIP_CACHE_SECONDS = int(os.getenv("MEMBERSHIP_CACHE_SECONDS", "300"))
+
+# Admin changelists of unfiltered tables with at least this many rows show
+# the planner's row estimate (PostgreSQL) instead of running COUNT(*).
+
+ADMIN_ESTIMATED_COUNT_THRESHOLD = int(
+    os.getenv("ADMIN_ESTIMATED_COUNT_THRESHOLD", "100000")
+)
+
+# Batch endpoint: sub-requests per batch and threads for parallel reads
+
+BATCH_MAX_REQUESTS = int(os.getenv("BATCH_MAX_REQUESTS", "20"))
+BATCH_MAX_WORKERS = int(os.getenv("BATCH_MAX_WORKERS", "4"))
+
+# Response compression (brotli when installed, otherwise gzip)
+# Bodies smaller than COMPRESSION_MIN_SIZE bytes are sent uncompressed.
+
+COMPRESSION_ENABLED = os.getenv("COMPRESSION_ENABLED", "True") == "True"
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "5"))
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(days=1),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=7),
@@ -110,6 +292,58 @@ SIMPLE_JWT = {
     "ROTATE_REFRESH_TOKENS": True,
 }
 
+# Per-request SQL and timing instrumentation
+# A sample rate of 0 disables it; budgets of 0 disable the warning.
+
+REQUEST_TIMING_SAMPLE_RATE = float(os.getenv("REQUEST_TIMING_SAMPLE_RATE", "1.0"))
+REQUEST_QUERY_BUDGET = int(os.getenv("REQUEST_QUERY_BUDGET", "20"))
+REQUEST_LATENCY_BUDGET_MS = float(os.getenv("REQUEST_LATENCY_BUDGET_MS", "500"))
+
+# Prometheus metrics
+# Worker processes share their counters through snapshot files in METRICS_DIR;
+# leave it empty when running a single process. Scrapes need METRICS_TOKEN as
+# a Bearer token; set METRICS_PUBLIC=True to serve them without one instead
+# (only where /metrics is not reachable from outside).
+
+METRICS_DIR = os.getenv("METRICS_DIR", "")
+METRICS_FLUSH_INTERVAL = float(os.getenv("METRICS_FLUSH_INTERVAL", "1"))
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+METRICS_PUBLIC = os.getenv("METRICS_PUBLIC", "False") == "True"
+
+# On-demand profiling for staff users (X-Profile header or ?profile=1)
+
+PROFILING_ENABLED = os.getenv("PROFILING_ENABLED", "True") == "True"
+PROFILE_DIR = os.getenv("PROFILE_DIR", str(BASE_DIR / "profiles"))
+PROFILE_SUMMARY_TOP_N = int(os.getenv("PROFILE_SUMMARY_TOP_N", "5"))
+
+# Anonymized request traces for benchmarks/replay_traffic.py (opt-in)
+# Each process writes TRAFFIC_CAPTURE_DIR/traffic-<pid>.jsonl, rotated and
+# gzipped every TRAFFIC_CAPTURE_MAX_BYTES; user ids are hashed with
+# TRAFFIC_CAPTURE_SALT (SECRET_KEY when empty).
+
+TRAFFIC_CAPTURE_ENABLED = os.getenv("TRAFFIC_CAPTURE_ENABLED", "False") == "True"
+TRAFFIC_CAPTURE_DIR = os.getenv("TRAFFIC_CAPTURE_DIR", str(BASE_DIR / "traffic"))
+TRAFFIC_CAPTURE_MAX_BYTES = int(os.getenv("TRAFFIC_CAPTURE_MAX_BYTES", "67108864"))
+TRAFFIC_CAPTURE_BACKUPS = int(os.getenv("TRAFFIC_CAPTURE_BACKUPS", "10"))
+TRAFFIC_CAPTURE_SALT = os.getenv("TRAFFIC_CAPTURE_SALT", "")
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "plain": {"format": "%(asctime)s %(levelname)s %(name)s %(message)s"},
+    },
+    "handlers": {
+        "console": {"class": "logging.StreamHandler", "formatter": "plain"},
+    },
+    "loggers": {
+        "lunch_voting_api": {
+            "handlers": ["console"],
+            "level": os.getenv("LOG_LEVEL", "INFO"),
+        },
+    },
+}
+
 # Password validation
 # https://docs.djangoproject.com/en/5.1/ref/settings/#auth-password-validators
 
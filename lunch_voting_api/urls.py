@@ -23,4 +23,5 @@ urlpatterns = [
     path("api/auth/", include("users.urls")),
     path("api/restaurants/", include("restaurants.urls")),
     path("api/votes/", include("votes.urls")),
+    path("", include("core.urls")),
 ]
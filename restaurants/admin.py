@@ -1,3 +1,29 @@
 from django.contrib import admin
+from services.admin.large_tables import LargeTableAdmin
+from .models import Menu, Restaurant
 
-# Register your models here.
+
+@admin.register(Restaurant)
+class RestaurantAdmin(LargeTableAdmin):
+    """
+    Admin for restaurants. Owners and employees are picked by search
+    rather than from a list of every user.
+    """
+
+    list_display = ("id", "name", "owner", "created_at")
+    list_select_related = ("owner",)
+    search_fields = ("name",)
+    autocomplete_fields = ("owner", "employees")
+
+
+@admin.register(Menu)
+class MenuAdmin(LargeTableAdmin):
+    """
+    Admin for menus, browsable by date.
+    """
+
+    list_display = ("id", "restaurant", "date", "created_at")
+    list_select_related = ("restaurant",)
+    search_fields = ("restaurant__name",)
+    autocomplete_fields = ("restaurant",)
+    date_hierarchy = "date"
@@ -1,6 +1,41 @@
 from django.apps import AppConfig
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+
+def invalidate_membership(sender, instance, **kwargs):
+    """
+    Drop the cached membership of a saved or deleted restaurant.
+    """
+    from services.restaurants.membership import invalidate
+
+    invalidate(instance.pk)
+
+
+def invalidate_employees(sender, instance, action, reverse, pk_set, **kwargs):
+    """
+    Drop the cached membership of every restaurant whose employees change,
+    whichever side of the relation the change is made from.
+    """
+    from services.restaurants.membership import invalidate
+
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            invalidate(instance.pk)
+    elif action in ("post_add", "post_remove"):
+        for restaurant_id in pk_set:
+            invalidate(restaurant_id)
+    elif action == "pre_clear":
+        for restaurant_id in instance.employee_restaurants.values_list("id", flat=True):
+            invalidate(restaurant_id)
 
 
 class RestaurantsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "restaurants"
+
+    def ready(self):
+        from restaurants.models import Restaurant
+
+        post_save.connect(invalidate_membership, sender=Restaurant)
+        post_delete.connect(invalidate_membership, sender=Restaurant)
+        m2m_changed.connect(invalidate_employees, sender=Restaurant.employees.through)
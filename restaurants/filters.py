@@ -0,0 +1,43 @@
+import django_filters
+from django.utils.timezone import now
+from .models import Menu, Restaurant
+
+
+class RestaurantFilter(django_filters.FilterSet):
+    """
+    Filters for the restaurant list. Positive filters start from an
+    index: the name search index (PostgreSQL only), the owner foreign key,
+    the employee column of the membership table and the menu date.
+    """
+
+    search = django_filters.CharFilter(method="filter_search")
+    employee = django_filters.BooleanFilter(method="filter_employee")
+    has_menu_today = django_filters.BooleanFilter(method="filter_has_menu_today")
+
+    class Meta:
+        model = Restaurant
+        fields = ["owner"]
+
+    def filter_search(self, queryset, name, value):
+        """
+        Case-insensitive substring match, served by a trigram index on
+        PostgreSQL. SQLite scans the names.
+        """
+        return queryset.filter(name__icontains=value)
+
+    def filter_employee(self, queryset, name, value):
+        """
+        Restaurants the requesting user works at (or does not).
+        """
+        mine = Restaurant.employees.through.objects.filter(
+            customuser_id=self.request.user.id
+        ).values("restaurant_id")
+        if value:
+            return queryset.filter(pk__in=mine)
+        return queryset.exclude(pk__in=mine)
+
+    def filter_has_menu_today(self, queryset, name, value):
+        today = Menu.objects.filter(date=now().date()).values("restaurant_id")
+        if value:
+            return queryset.filter(pk__in=today)
+        return queryset.exclude(pk__in=today)
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.6 on 2026-10-19 12:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("restaurants", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="menu",
+            index=models.Index(fields=["date"], name="restaurants_menu_date_idx"),
+        ),
+    ]
@@ -0,0 +1,44 @@
+from django.db import migrations
+
+POSTGRES_INDEX = "restaurants_restaurant_name_trgm"
+SQLITE_INDEX = "restaurants_restaurant_name_nocase"
+
+
+def create_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        # Django compares UPPER(name) in icontains and istartswith lookups.
+        schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        schema_editor.execute(
+            f"CREATE INDEX {POSTGRES_INDEX} ON restaurants_restaurant "
+            f"USING gin (UPPER(name) gin_trgm_ops)"
+        )
+    elif vendor == "sqlite":
+        # Lets SQLite's case-insensitive LIKE use an index for prefixes.
+        schema_editor.execute(
+            f"CREATE INDEX {SQLITE_INDEX} ON restaurants_restaurant "
+            f"(name COLLATE NOCASE)"
+        )
+
+
+def drop_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == "postgresql":
+        schema_editor.execute(f"DROP INDEX IF EXISTS {POSTGRES_INDEX}")
+    elif vendor == "sqlite":
+        schema_editor.execute(f"DROP INDEX IF EXISTS {SQLITE_INDEX}")
+
+
+class Migration(migrations.Migration):
+    """
+    Indexes restaurant names for search: a trigram index on PostgreSQL,
+    a case-insensitive prefix index on SQLite.
+    """
+
+    dependencies = [
+        ("restaurants", "0002_menu_date_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
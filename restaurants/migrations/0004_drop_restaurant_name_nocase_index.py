@@ -0,0 +1,31 @@
+from django.db import migrations
+
+SQLITE_INDEX = "restaurants_restaurant_name_nocase"
+
+
+def drop_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "sqlite":
+        schema_editor.execute(f"DROP INDEX IF EXISTS {SQLITE_INDEX}")
+
+
+def create_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "sqlite":
+        schema_editor.execute(
+            f"CREATE INDEX {SQLITE_INDEX} ON restaurants_restaurant "
+            f"(name COLLATE NOCASE)"
+        )
+
+
+class Migration(migrations.Migration):
+    """
+    Drops the SQLite prefix index: search matches substrings on every
+    database now, which it cannot serve.
+    """
+
+    dependencies = [
+        ("restaurants", "0003_restaurant_name_search_index"),
+    ]
+
+    operations = [
+        migrations.RunPython(drop_index, create_index),
+    ]
@@ -1,6 +1,11 @@
-from django.db import models
+from core.models import OutboxEvent
+from django.core.exceptions import ValidationError
+from django.db import models, transaction
 from django.conf import settings
 from django.utils import timezone
+from services.api.versions import bump_versions
+from services.events.outbox import publish
+from services.validation.validate_menu import MOVED_VOTED_MENU
 
 
 class Restaurant(models.Model):
@@ -19,6 +24,20 @@ class Restaurant(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
 
+    def save(self, *args, **kwargs):
+        with transaction.atomic(savepoint=False):
+            super().save(*args, **kwargs)
+            bump_versions(self.version_keys())
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic(savepoint=False):
+            bump_versions(self.version_keys())
+            return super().delete(*args, **kwargs)
+
+    def version_keys(self):
+        # Today's results show the restaurant's name.
+        return [f"restaurant:{self.id}", f"results:{timezone.localdate()}"]
+
     def __str__(self):
         return self.name
 
@@ -35,8 +54,69 @@ class Menu(models.Model):
     items = models.JSONField()  # Stores menu items as a list of dishes
     created_at = models.DateTimeField(auto_now_add=True)
 
+    outbox_topic = "menu"
+
     class Meta:
         unique_together = ("restaurant", "date")
+        indexes = [models.Index(fields=["date"], name="restaurants_menu_date_idx")]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        menu = super().from_db(db, field_names, values)
+        menu._remember_place()
+        return menu
+
+    def refresh_from_db(self, *args, **kwargs):
+        super().refresh_from_db(*args, **kwargs)
+        self._remember_place()
+
+    def _remember_place(self):
+        # Where the stored menu is; a move must refresh both places.
+        self._loaded = (self.__dict__.get("restaurant_id"), self.__dict__.get("date"))
+
+    def clean(self):
+        _, loaded_date = getattr(self, "_loaded", (None, None))
+        if loaded_date is not None and self.date != loaded_date and self.votes.exists():
+            raise ValidationError({"date": MOVED_VOTED_MENU})
+
+    def save(self, *args, **kwargs):
+        action = OutboxEvent.CREATED if self._state.adding else OutboxEvent.UPDATED
+        with transaction.atomic(savepoint=False):
+            super().save(*args, **kwargs)
+            publish(self, action)
+            bump_versions(self.version_keys())
+        self._remember_place()
+
+    def delete(self, *args, **kwargs):
+        """
+        Deletes the menu and, by cascade, its votes. The menu's "deleted"
+        event stands for the votes as well.
+        """
+        with transaction.atomic(savepoint=False):
+            publish(self, OutboxEvent.DELETED)
+            bump_versions(self.version_keys())
+            return super().delete(*args, **kwargs)
+
+    def outbox_payload(self):
+        return {
+            "id": self.id,
+            "restaurant": self.restaurant_id,
+            "date": self.date,
+            "items": self.items,
+        }
+
+    def version_keys(self):
+        places = [(self.restaurant_id, self.date), getattr(self, "_loaded", None)]
+        return [
+            key
+            for restaurant_id, date in filter(None, places)
+            if restaurant_id is not None and date is not None
+            for key in (
+                f"menus:{restaurant_id}",
+                f"daily-menu:{restaurant_id}:{date}",
+                f"results:{date}",
+            )
+        ]
 
     def __str__(self):
         return f"{self.restaurant.name} - {self.date}"
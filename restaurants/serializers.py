@@ -1,9 +1,13 @@
+from django.db import transaction
 from rest_framework import serializers
 from .models import Restaurant, Menu
 from users.models import CustomUser
+from services.api.fields import VersionedFieldsMixin
+from services.api.versions import bump_versions
+from services.validation.validate_menu import validate_menu_date
 
 
-class RestaurantSerializer(serializers.ModelSerializer):
+class RestaurantSerializer(VersionedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for the Restaurant model.
     """
@@ -16,9 +20,10 @@ class RestaurantSerializer(serializers.ModelSerializer):
         model = Restaurant
         fields = ["id", "name", "owner", "employees", "created_at"]
         read_only_fields = ["id", "created_at"]
+        version_fields = {"2": ["id", "name", "owner"]}
 
 
-class MenuSerializer(serializers.ModelSerializer):
+class MenuSerializer(VersionedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for the Menu model.
     """
@@ -27,6 +32,10 @@ class MenuSerializer(serializers.ModelSerializer):
         model = Menu
         fields = ["id", "restaurant", "date", "items"]
 
+    def validate_date(self, value):
+        validate_menu_date(self.instance, value)
+        return value
+
 
 class AddEmployeeSerializer(serializers.ModelSerializer):
     """
@@ -53,7 +62,7 @@ class AddEmployeeSerializer(serializers.ModelSerializer):
                 {"error": "Invalid employee ID or user is not an employee."}
             )
 
-        if employee in self.instance.employees.all():
+        if self.instance.employees.filter(id=employee.id).exists():
             raise serializers.ValidationError({"error": "Employee is already added."})
 
         data["employee"] = employee
@@ -63,5 +72,7 @@ class AddEmployeeSerializer(serializers.ModelSerializer):
         """
         Add the validated employee to the restaurant.
         """
-        instance.employees.add(validated_data["employee"])
+        with transaction.atomic(savepoint=False):
+            instance.employees.add(validated_data["employee"])
+            bump_versions([f"restaurant:{instance.id}"])
         return instance
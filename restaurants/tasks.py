@@ -0,0 +1,13 @@
+from restaurants.models import Restaurant
+from services.jobs.queue import task
+from services.restaurants.deletion import delete_restaurant as delete_now
+
+
+@task(queue="maintenance")
+def delete_restaurant(restaurant_id):
+    """
+    Delete a restaurant and its history in batches, if it still exists.
+    """
+    restaurant = Restaurant.objects.filter(id=restaurant_id).first()
+    if restaurant is not None:
+        delete_now(restaurant)
@@ -0,0 +1,117 @@
+from datetime import timedelta
+
+import pytest
+from django.utils.timezone import now
+from services.testing.query_budget import assert_query_budget
+
+BASE_URL = "/api/restaurants/"
+
+
+def list_request(dataset):
+    return dataset.client(dataset.fresh_employee()), BASE_URL, None
+
+
+def create_request(dataset):
+    owner = dataset.owner
+    payload = {"name": f"New {len(dataset.restaurants)}", "owner": owner.id}
+    return dataset.client(owner), BASE_URL, payload
+
+
+def detail_request(dataset):
+    restaurant = dataset.restaurant
+    return dataset.client(restaurant.owner), f"{BASE_URL}{restaurant.id}/", None
+
+
+def update_request(dataset):
+    restaurant = dataset.restaurant
+    payload = {"name": f"Renamed {len(dataset.restaurants)}"}
+    return dataset.client(restaurant.owner), f"{BASE_URL}{restaurant.id}/", payload
+
+
+def delete_request(dataset):
+    restaurant, _ = dataset.pop_last()
+    return dataset.client(restaurant.owner), f"{BASE_URL}{restaurant.id}/", None
+
+
+def add_employee_request(dataset):
+    restaurant = dataset.restaurant
+    payload = {"employee_id": dataset.new_employee().id}
+    return (
+        dataset.client(restaurant.owner),
+        f"{BASE_URL}{restaurant.id}/add-employee/",
+        payload,
+    )
+
+
+def menu_list_request(dataset):
+    restaurant = dataset.restaurant
+    return dataset.client(restaurant.owner), f"{BASE_URL}{restaurant.id}/menus/", None
+
+
+def menu_create_request(dataset):
+    restaurant = dataset.restaurant
+    payload = {
+        "restaurant": restaurant.id,
+        "date": str(now().date() + timedelta(days=len(dataset.restaurants))),
+        "items": {"Burger": 12},
+    }
+    return (
+        dataset.client(restaurant.owner),
+        f"{BASE_URL}{restaurant.id}/menus/",
+        payload,
+    )
+
+
+def menu_detail_request(dataset):
+    menu = dataset.menu
+    return (
+        dataset.client(menu.restaurant.owner),
+        f"{BASE_URL}{menu.restaurant_id}/menus/{menu.id}/",
+        None,
+    )
+
+
+def menu_update_request(dataset):
+    client, path, _ = menu_detail_request(dataset)
+    return client, path, {"items": {"Steak": len(dataset.restaurants)}}
+
+
+def menu_delete_request(dataset):
+    restaurant, menu = dataset.pop_last()
+    return (
+        dataset.client(restaurant.owner),
+        f"{BASE_URL}{restaurant.id}/menus/{menu.id}/",
+        None,
+    )
+
+
+def daily_menu_request(dataset):
+    restaurant = dataset.restaurant
+    return (
+        dataset.client(dataset.fresh_employee()),
+        f"{BASE_URL}{restaurant.id}/daily-menu/",
+        None,
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "url_name, method, make_request",
+    [
+        ("restaurant-list-create", "get", list_request),
+        ("restaurant-list-create", "post", create_request),
+        ("restaurant-detail", "get", detail_request),
+        ("restaurant-detail", "patch", update_request),
+        ("restaurant-detail", "delete", delete_request),
+        ("add-employee", "patch", add_employee_request),
+        ("menu-list-create", "get", menu_list_request),
+        ("menu-list-create", "post", menu_create_request),
+        ("menu-detail", "get", menu_detail_request),
+        ("menu-detail", "patch", menu_update_request),
+        ("menu-detail", "delete", menu_delete_request),
+        ("daily-menu", "get", daily_menu_request),
+    ],
+)
+def test_restaurant_query_budget(url_name, method, make_request):
+    """Test that restaurant and menu endpoints do not run N+1 queries."""
+    assert_query_budget(url_name, method, make_request)
@@ -1,9 +1,13 @@
+from datetime import timedelta
+
 import pytest
 from django.contrib.auth import get_user_model
+from django.core.exceptions import ValidationError
 from django.utils.timezone import now
 from rest_framework.test import APIClient
 from rest_framework import status
 from restaurants.models import Restaurant, Menu
+from votes.models import Vote
 
 User = get_user_model()
 
@@ -184,6 +188,32 @@ def test_update_menu(authorized_client, create_menu):
     assert response.status_code == status.HTTP_200_OK
 
 
+@pytest.mark.django_db
+def test_menu_with_votes_keeps_its_date(
+    authorized_client, create_menu, create_employee
+):
+    """Test that a voted menu cannot move to another day, and others can."""
+    client, restaurant = authorized_client
+    menu = create_menu(restaurant=restaurant)
+    url = f"{BASE_URL}{restaurant.id}/menus/{menu.id}/"
+    tomorrow = str(now().date() + timedelta(days=1))
+
+    response = client.patch(url, {"date": tomorrow}, format="json")
+    assert response.status_code == status.HTTP_200_OK
+    menu.refresh_from_db()
+
+    Vote.objects.create(user=create_employee(), menu=menu)
+    response = client.patch(url, {"date": str(now().date())}, format="json")
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert "date" in response.data
+    menu.refresh_from_db()
+    assert str(menu.date) == tomorrow == str(Vote.objects.get().date)
+
+    menu.date = now().date()
+    with pytest.raises(ValidationError):
+        menu.full_clean()
+
+
 @pytest.mark.django_db
 def test_delete_menu(authorized_client, create_menu):
     """Test deleting a menu."""
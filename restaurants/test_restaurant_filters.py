@@ -0,0 +1,110 @@
+from datetime import timedelta
+from types import SimpleNamespace
+
+import pytest
+from django.db import connection
+from django.utils.timezone import now
+from rest_framework.test import APIClient
+from restaurants.filters import RestaurantFilter
+from restaurants.models import Menu, Restaurant
+
+URL = "/api/restaurants/"
+
+
+@pytest.fixture
+def data(django_user_model):
+    """
+    Creates two owners' restaurants; the employee works at two of them and
+    two have a menu today.
+    """
+
+    def user(email, role="employee"):
+        return django_user_model.objects.create_user(
+            email=email, password="testpass123", role=role
+        )
+
+    alice = user("alice@example.com", "restaurant_admin")
+    bob = user("bob@example.com", "restaurant_admin")
+    employee = user("filter.employee@example.com")
+    restaurants = {
+        name: Restaurant.objects.create(name=name, owner=owner)
+        for name, owner in [
+            ("Pizza Place", alice),
+            ("pizzeria Napoli", bob),
+            ("Sushi Bar", alice),
+            ("Burger Joint", bob),
+        ]
+    }
+    restaurants["Pizza Place"].employees.add(employee)
+    restaurants["Sushi Bar"].employees.add(employee)
+    for name in ("Pizza Place", "Burger Joint"):
+        Menu.objects.create(restaurant=restaurants[name], date=now().date(), items={})
+    Menu.objects.create(
+        restaurant=restaurants["Sushi Bar"],
+        date=now().date() - timedelta(days=1),
+        items={},
+    )
+    client = APIClient()
+    client.force_authenticate(user=employee)
+    return client, alice, employee
+
+
+def names(client, **params):
+    response = client.get(URL, params)
+    assert response.status_code == 200, response.data
+    return sorted(r["name"] for r in response.data)
+
+
+@pytest.mark.django_db
+def test_search_matches_names_case_insensitively(data):
+    """Test that name search ignores case and matches any part of the name."""
+    client, *_ = data
+    assert names(client, search="PIZZ") == ["Pizza Place", "pizzeria Napoli"]
+    assert names(client, search="NAPOLI") == ["pizzeria Napoli"]
+    assert names(client, search="a P") == ["Pizza Place"]
+
+
+@pytest.mark.django_db
+def test_filters_combine(data):
+    """Test owner, employee and today's menu filters alone and together."""
+    client, alice, _ = data
+    assert names(client, owner=alice.id) == ["Pizza Place", "Sushi Bar"]
+    assert names(client, employee="true") == ["Pizza Place", "Sushi Bar"]
+    assert names(client, employee="false") == ["Burger Joint", "pizzeria Napoli"]
+    assert names(client, has_menu_today="true") == ["Burger Joint", "Pizza Place"]
+    assert names(client, has_menu_today="false") == ["Sushi Bar", "pizzeria Napoli"]
+    assert names(
+        client, search="pizz", owner=alice.id, employee="true", has_menu_today="true"
+    ) == ["Pizza Place"]
+
+
+@pytest.mark.django_db
+def test_invalid_owner_is_rejected(data):
+    """Test that a malformed owner id answers 400."""
+    client, *_ = data
+    assert client.get(URL, {"owner": "nobody"}).status_code == 400
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(connection.vendor != "sqlite", reason="SQLite query plans")
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"owner": "1"},
+        {"employee": "true"},
+        {"has_menu_today": "true"},
+        {"search": "pizz", "owner": "1", "employee": "true", "has_menu_today": "true"},
+    ],
+)
+def test_positive_filters_do_not_scan_restaurants(data, params):
+    """Test that every positive filter but search is answered from an index."""
+    _, _, employee = data
+    request = SimpleNamespace(user=employee)
+    queryset = RestaurantFilter(params, Restaurant.objects.all(), request=request).qs
+
+    sql, sql_params = queryset.query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN QUERY PLAN {sql}", sql_params)
+        plan = [row[-1] for row in cursor.fetchall()]
+
+    assert not [step for step in plan if step.startswith("SCAN")], plan
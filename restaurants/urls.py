@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.urls import path
 from .views import (
     RestaurantListCreateView,
@@ -6,6 +7,7 @@ from .views import (
     MenuListCreateView,
     MenuDetailView,
     DailyMenuView,
+    AsyncDailyMenuView,
 )
 
 urlpatterns = [
@@ -22,5 +24,9 @@ urlpatterns = [
         MenuDetailView.as_view(),
         name="menu-detail",
     ),
-    path("<int:restaurant_id>/daily-menu/", DailyMenuView.as_view(), name="daily-menu"),
+    path(
+        "<int:restaurant_id>/daily-menu/",
+        (AsyncDailyMenuView if settings.ASYNC_READ_VIEWS else DailyMenuView).as_view(),
+        name="daily-menu",
+    ),
 ]
@@ -1,32 +1,87 @@
-from rest_framework import generics, permissions
+from django.conf import settings
+from django.db.models import Prefetch
+from django.http import Http404
+from django_filters.rest_framework import DjangoFilterBackend
+from rest_framework import generics, permissions, status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from django.utils.timezone import now
+from .filters import RestaurantFilter
 from .models import Restaurant, Menu
+from users.models import CustomUser
 from .serializers import RestaurantSerializer, MenuSerializer, AddEmployeeSerializer
 from services.permissions.is_restaurant_owner import IsRestaurantOwner
 from services.permissions.is_menu_owner import IsMenuOwner
-
-
-class RestaurantListCreateView(generics.ListCreateAPIView):
+from services.permissions.is_authenticated import IsAuthenticated
+from services.api.async_views import AsyncAPIView
+from services.api.conditional import AsyncConditionalGetMixin, ConditionalGetMixin
+from services.api.fast_list import ValuesListMixin
+from services.api.idempotency import IdempotentPostMixin
+from services.restaurants.deletion import delete_restaurant
+from services.restaurants.membership import owner_of
+from .tasks import delete_restaurant as delete_restaurant_job
+
+# Only the ids are serialized, so avoid loading full user rows. Ordered by id
+# like the list fast path, which reads them from the through table.
+EMPLOYEE_IDS = Prefetch(
+    "employees", queryset=CustomUser.objects.only("id").order_by("id")
+)
+
+
+class RestaurantListCreateView(ValuesListMixin, generics.ListCreateAPIView):
     """
     API for creating a restaurant and listing all restaurants.
     """
 
-    queryset = Restaurant.objects.all()
     serializer_class = RestaurantSerializer
     permission_classes = [permissions.IsAuthenticated]
+    filter_backends = [DjangoFilterBackend]
+    filterset_class = RestaurantFilter
+
+    def get_queryset(self):
+        """
+        Skips loading employees when the client does not render them.
+        """
+        queryset = Restaurant.objects.all()
+        if self.serializer_class.wants_field(self.request, "employees"):
+            queryset = queryset.prefetch_related(EMPLOYEE_IDS)
+        return queryset
 
 
-class RestaurantDetailView(generics.RetrieveUpdateDestroyAPIView):
+class RestaurantDetailView(ConditionalGetMixin, generics.RetrieveUpdateDestroyAPIView):
     """
     API for retrieving, updating, or deleting a restaurant.
     """
 
-    queryset = Restaurant.objects.all()
+    queryset = Restaurant.objects.prefetch_related(EMPLOYEE_IDS)
     serializer_class = RestaurantSerializer
     permission_classes = [permissions.IsAuthenticated, IsRestaurantOwner]
 
+    def get_version_keys(self):
+        return [f"restaurant:{self.kwargs['pk']}"]
+
+    def check_conditional_permissions(self, request):
+        """
+        IsRestaurantOwner has checked ownership against the membership
+        index; a missing restaurant still answers 404 rather than 304.
+        """
+        if owner_of(self.kwargs["pk"]) is None:
+            raise Http404
+
+    def destroy(self, request, *args, **kwargs):
+        """
+        Deletes inline, or queues the deletion and answers 202 when
+        RESTAURANT_DELETE_IN_BACKGROUND is set.
+        """
+        if not settings.RESTAURANT_DELETE_IN_BACKGROUND:
+            return super().destroy(request, *args, **kwargs)
+        restaurant = self.get_object()
+        job = delete_restaurant_job.enqueue(restaurant_id=restaurant.id)
+        return Response({"job": job.id}, status=status.HTTP_202_ACCEPTED)
+
+    def perform_destroy(self, instance):
+        delete_restaurant(instance)
+
 
 class AddEmployeeView(generics.UpdateAPIView):
     """
@@ -38,7 +93,12 @@ class AddEmployeeView(generics.UpdateAPIView):
     permission_classes = [permissions.IsAuthenticated, IsRestaurantOwner]
 
 
-class MenuListCreateView(generics.ListCreateAPIView):
+class MenuListCreateView(
+    IdempotentPostMixin,
+    ConditionalGetMixin,
+    ValuesListMixin,
+    generics.ListCreateAPIView,
+):
     """
     API for listing all menus of a restaurant and adding a new menu.
     """
@@ -46,6 +106,9 @@ class MenuListCreateView(generics.ListCreateAPIView):
     serializer_class = MenuSerializer
     permission_classes = [permissions.IsAuthenticated, IsMenuOwner]
 
+    def get_version_keys(self):
+        return [f"menus:{self.kwargs['restaurant_id']}"]
+
     def get_queryset(self):
         """
         Returns all menus belonging to a specific restaurant.
@@ -58,23 +121,49 @@ class MenuDetailView(generics.RetrieveUpdateDestroyAPIView):
     API for retrieving, updating, or deleting a menu item.
     """
 
-    queryset = Menu.objects.all()
+    queryset = Menu.objects.select_related("restaurant")
     serializer_class = MenuSerializer
     permission_classes = [permissions.IsAuthenticated, IsMenuOwner]
 
 
-class DailyMenuView(APIView):
+class DailyMenuView(ConditionalGetMixin, APIView):
     """
     API for retrieving the current day's menu for a specific restaurant.
     """
 
     permission_classes = [permissions.IsAuthenticated]
 
+    def get_version_keys(self):
+        return [f"daily-menu:{self.kwargs['restaurant_id']}:{now().date()}"]
+
     def get(self, request, restaurant_id):
         """
         Fetch today's menu for the given restaurant.
         """
         today = now().date()
         menu = Menu.objects.filter(restaurant_id=restaurant_id, date=today)
-        serializer = MenuSerializer(menu, many=True)
+        serializer = MenuSerializer(menu, many=True, context={"request": request})
         return Response(serializer.data)
+
+
+class AsyncDailyMenuView(AsyncConditionalGetMixin, AsyncAPIView):
+    """
+    Async version of DailyMenuView, served when ASYNC_READ_VIEWS is enabled.
+    """
+
+    permission_classes = [IsAuthenticated]
+    get_version_keys = DailyMenuView.get_version_keys
+
+    async def get(self, request, restaurant_id):
+        """
+        Fetch today's menu for the given restaurant.
+        """
+        today = now().date()
+        menus = [
+            menu
+            async for menu in Menu.objects.filter(
+                restaurant_id=restaurant_id, date=today
+            )
+        ]
+        serializer = MenuSerializer(menus, many=True, context={"request": request})
+        return self.render(serializer.data)
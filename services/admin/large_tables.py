@@ -0,0 +1,60 @@
+from django.conf import settings
+from django.contrib import admin
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
+
+
+def estimate_rows(model, using="default"):
+    """
+    Return the planner's row estimate for a model's table, summed over its
+    partitions, or None when the database keeps no such statistics.
+    """
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        return None
+    table = model._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT SUM(GREATEST(c.reltuples, 0))::bigint
+            FROM pg_class c
+            WHERE c.oid = %s::regclass
+               OR c.oid IN (
+                   SELECT inhrelid FROM pg_inherits WHERE inhparent = %s::regclass
+               )
+            """,
+            [table, table],
+        )
+        return cursor.fetchone()[0]
+
+
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that uses the row estimate instead of COUNT(*) for unfiltered
+    lists of tables with at least ADMIN_ESTIMATED_COUNT_THRESHOLD rows.
+    Filtered lists and small tables are counted exactly.
+    """
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if not queryset.query.where:
+            estimate = estimate_rows(queryset.model, using=queryset.db)
+            if estimate is not None and (
+                estimate >= settings.ADMIN_ESTIMATED_COUNT_THRESHOLD
+            ):
+                return estimate
+        return super().count
+
+
+class LargeTableAdmin(admin.ModelAdmin):
+    """
+    Changelist defaults for tables with millions of rows: estimated counts,
+    no second COUNT(*) for the unfiltered total and newest-first ordering
+    by primary key, which an index scan serves without sorting.
+    """
+
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    ordering = ("-id",)
@@ -0,0 +1,80 @@
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpResponse
+from django.views import View
+from rest_framework import exceptions, status
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+from services.api.renderers import FastJSONRenderer
+from services.auth.async_authentication import AsyncJWTAuthentication
+
+
+class AsyncAPIView(View):
+    """
+    Async counterpart of APIView for read-only endpoints.
+
+    Authenticates JWT bearer tokens with the async ORM, applies header
+    versioning and checks permissions on the event loop when they define
+    `ahas_permission` (other permissions run in a worker thread). Handlers
+    receive a DRF Request and return `self.render(data)`.
+    """
+
+    http_method_names = ["get", "head", "options"]
+    permission_classes = []
+    authentication_class = AsyncJWTAuthentication
+    renderer = FastJSONRenderer()
+
+    async def dispatch(self, request, *args, **kwargs):
+        if request.method.lower() not in ("get", "head"):
+            return await super().dispatch(request, *args, **kwargs)
+
+        request = Request(request)
+        authenticator = self.authentication_class()
+        try:
+            await self.initial(request, authenticator)
+            return await super().dispatch(request, *args, **kwargs)
+        except exceptions.APIException as exc:
+            return self.handle_exception(request, exc, authenticator)
+
+    async def initial(self, request, authenticator):
+        versioning = api_settings.DEFAULT_VERSIONING_CLASS
+        if versioning is not None:
+            scheme = versioning()
+            request.version = scheme.determine_version(request)
+            request.versioning_scheme = scheme
+
+        forced_user = getattr(request._request, "_force_auth_user", None)
+        if forced_user is not None:
+            request.user = forced_user
+        else:
+            result = await authenticator.aauthenticate(request)
+            request.user = result[0] if result else AnonymousUser()
+
+        for permission_class in self.permission_classes:
+            permission = permission_class()
+            check = getattr(permission, "ahas_permission", None)
+            if check is not None:
+                allowed = await check(request, self)
+            else:
+                allowed = await sync_to_async(permission.has_permission)(request, self)
+            if not allowed:
+                if not request.user.is_authenticated:
+                    raise exceptions.NotAuthenticated()
+                raise exceptions.PermissionDenied(getattr(permission, "message", None))
+
+    def handle_exception(self, request, exc, authenticator):
+        if isinstance(exc.detail, (list, dict)):
+            data = exc.detail
+        else:
+            data = {"detail": exc.detail}
+        response = self.render(data, exc.status_code)
+        if exc.status_code == status.HTTP_401_UNAUTHORIZED:
+            response["WWW-Authenticate"] = authenticator.authenticate_header(request)
+        return response
+
+    def render(self, data, status_code=status.HTTP_200_OK):
+        return HttpResponse(
+            self.renderer.render(data),
+            status=status_code,
+            content_type=self.renderer.media_type,
+        )
@@ -0,0 +1,159 @@
+import contextvars
+import io
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIRequest
+from django.db import connection
+from django.http import Http404
+from django.urls import Resolver404, get_resolver
+
+logger = logging.getLogger("lunch_voting_api.batch")
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+# Response headers worth handing back to the client of a sub-request.
+RETURNED_HEADERS = ("Location", "ETag", "Last-Modified", "Retry-After", "Allow")
+# Headers of the batch request that describe the batch itself, not its
+# sub-requests; a sub-request that needs one passes it in its own headers.
+BATCH_ONLY_HEADERS = (
+    "HTTP_IDEMPOTENCY_KEY",
+    "HTTP_IF_NONE_MATCH",
+    "HTTP_IF_MATCH",
+    "HTTP_IF_MODIFIED_SINCE",
+    "HTTP_IF_UNMODIFIED_SINCE",
+)
+
+
+class SubRequestError(Exception):
+    def __init__(self, status, detail):
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+
+
+def _sub_request(request, method, path, body=None, headers=None):
+    path_info, _, query_string = path.partition("?")
+    payload = b"" if body is None else json.dumps(body).encode()
+    environ = {
+        key: value
+        for key, value in request.META.items()
+        if not key.startswith(("wsgi.", "HTTP_CONTENT_", "CONTENT_"))
+        and key not in BATCH_ONLY_HEADERS
+    }
+    for name, value in (headers or {}).items():
+        environ[f"HTTP_{name.upper().replace('-', '_')}"] = value
+    environ.update(
+        {
+            "REQUEST_METHOD": method,
+            "PATH_INFO": path_info,
+            "SCRIPT_NAME": "",
+            "QUERY_STRING": query_string,
+            "HTTP_ACCEPT": "application/json",
+            "CONTENT_TYPE": "application/json",
+            "CONTENT_LENGTH": str(len(payload)),
+            "wsgi.input": io.BytesIO(payload),
+        }
+    )
+    sub_request = WSGIRequest(environ)
+    # The batch was authenticated once; sub-requests reuse its user and
+    # token the way DRF's force_authenticate does.
+    sub_request._force_auth_user = request.user
+    sub_request._force_auth_token = request.auth
+    return sub_request
+
+
+def _body(response):
+    data = getattr(response, "data", None)
+    if data is not None or response.status_code == 204:
+        return data
+    content = (
+        b"".join(response.streaming_content) if response.streaming else response.content
+    )
+    if not content:
+        return None
+    if response.get("Content-Type", "").startswith("application/json"):
+        return json.loads(content)
+    return content.decode(response.charset or "utf-8", "replace")
+
+
+def run_one(request, sub):
+    """
+    Dispatch one sub-request to the view its path resolves to, without
+    the middleware stack, and return its status, headers and body. Views
+    whose class sets `batchable = False` are refused.
+    """
+    try:
+        if not sub["path"].startswith("/api/"):
+            raise SubRequestError(400, "Only /api/ paths can be batched.")
+        sub_request = _sub_request(
+            request, sub["method"], sub["path"], sub.get("body"), sub.get("headers")
+        )
+        try:
+            match = get_resolver().resolve(sub_request.path_info)
+        except Resolver404:
+            raise SubRequestError(404, "Not found.")
+        view = match.func
+        if not getattr(getattr(view, "view_class", None), "batchable", True):
+            raise SubRequestError(400, "This endpoint cannot be batched.")
+        sub_request.resolver_match = match
+        if iscoroutinefunction(view):
+            view = async_to_sync(view)
+        response = view(sub_request, *match.args, **match.kwargs)
+    except SubRequestError as exc:
+        return {"status": exc.status, "headers": {}, "body": {"detail": exc.detail}}
+    except Http404:
+        return {"status": 404, "headers": {}, "body": {"detail": "Not found."}}
+    except Exception:
+        logger.exception("Batched %s %s failed", sub["method"], sub["path"])
+        return {"status": 500, "headers": {}, "body": {"detail": "Server error."}}
+
+    return {
+        "status": response.status_code,
+        "headers": {
+            name: response[name]
+            for name in RETURNED_HEADERS
+            if response.has_header(name)
+        },
+        "body": _body(response),
+    }
+
+
+def _run_in_thread(context, request, sub):
+    try:
+        return context.run(run_one, request, sub)
+    finally:
+        connection.close()
+
+
+def run_batch(request, subs, parallel=False):
+    """
+    Run `subs` in order and return their results in the same order.
+
+    With `parallel`, each run of consecutive reads is spread over up to
+    BATCH_MAX_WORKERS threads (each with its own database connection);
+    writes always run alone, in order, on the request's connection.
+    """
+    results = []
+    index = 0
+    while index < len(subs):
+        end = index + 1
+        if parallel and subs[index]["method"] in SAFE_METHODS:
+            while end < len(subs) and subs[end]["method"] in SAFE_METHODS:
+                end += 1
+        group = subs[index:end]
+        if len(group) == 1:
+            results.append(run_one(request, group[0]))
+        else:
+            workers = min(len(group), settings.BATCH_MAX_WORKERS)
+            # Each thread runs in its own copy of the request's context, so
+            # context variables such as the replica routing state carry over.
+            contexts = [contextvars.copy_context() for _ in group]
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results.extend(
+                    pool.map(_run_in_thread, contexts, [request] * len(group), group)
+                )
+        index = end
+    return results
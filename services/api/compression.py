@@ -0,0 +1,119 @@
+import gzip
+import re
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_sequence
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - exercised only without brotli
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript")
+
+_coding_re = re.compile(r"\s*([\w*-]+)\s*(?:;\s*q\s*=\s*([0-9.]+))?\s*")
+
+
+def accepted_encodings(header):
+    """
+    Parse an Accept-Encoding header into {coding: quality}.
+    """
+    encodings = {}
+    for part in header.lower().split(","):
+        match = _coding_re.fullmatch(part)
+        if not match:
+            continue
+        try:
+            quality = float(match.group(2)) if match.group(2) else 1.0
+        except ValueError:
+            continue
+        encodings[match.group(1)] = quality
+    return encodings
+
+
+def choose_encoding(header):
+    """
+    Return "br", "gzip" or None for an Accept-Encoding header, preferring
+    brotli on equal quality when it is installed.
+    """
+    encodings = accepted_encodings(header)
+    wildcard = encodings.get("*", 0.0)
+    candidates = (["br"] if brotli is not None else []) + ["gzip"]
+    best, best_quality = None, 0.0
+    for coding in candidates:
+        quality = encodings.get(coding, wildcard)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def compress(content, encoding):
+    if encoding == "br":
+        return brotli.compress(content, quality=settings.COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(
+        content, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0
+    )
+
+
+class CompressionMiddleware:
+    """
+    Compresses responses with brotli or gzip as negotiated through
+    Accept-Encoding.
+
+    Bodies smaller than COMPRESSION_MIN_SIZE bytes are sent as is, since
+    the CPU cost outweighs the few bytes saved.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        return self.process_response(request, self.get_response(request))
+
+    async def __acall__(self, request):
+        return self.process_response(request, await self.get_response(request))
+
+    def process_response(self, request, response):
+        if not settings.COMPRESSION_ENABLED:
+            return response
+
+        patch_vary_headers(response, ("Accept-Encoding",))
+        if response.has_header("Content-Encoding"):
+            return response
+        content_type = response.get("Content-Type", "")
+        if not content_type.startswith(COMPRESSIBLE_TYPES):
+            return response
+        encoding = choose_encoding(request.headers.get("Accept-Encoding", ""))
+        if encoding is None:
+            return response
+
+        if response.streaming:
+            # Only buffered bodies are brotli-compressed.
+            if encoding != "gzip":
+                return response
+            response.streaming_content = compress_sequence(response.streaming_content)
+            del response.headers["Content-Length"]
+        else:
+            if len(response.content) < settings.COMPRESSION_MIN_SIZE:
+                return response
+            compressed = compress(response.content, encoding)
+            if len(compressed) >= len(response.content):
+                return response
+            response.content = compressed
+            response.headers["Content-Length"] = str(len(compressed))
+
+        # The representation changed, so a strong ETag no longer applies.
+        etag = response.get("ETag")
+        if etag and etag.startswith('"'):
+            response.headers["ETag"] = "W/" + etag
+        response.headers["Content-Encoding"] = encoding
+        return response
@@ -0,0 +1,116 @@
+import hashlib
+
+from asgiref.sync import sync_to_async
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date
+from services.api.versions import get_versions
+
+
+CONDITIONAL_HEADERS = (
+    "HTTP_IF_NONE_MATCH",
+    "HTTP_IF_MODIFIED_SINCE",
+    "HTTP_IF_MATCH",
+    "HTTP_IF_UNMODIFIED_SINCE",
+)
+
+
+class _Conditional(Exception):
+    def __init__(self, response):
+        super().__init__(response.status_code)
+        self.response = response
+
+
+class _ValidatorsMixin:
+    def get_version_keys(self):
+        raise NotImplementedError
+
+    def get_validators(self, request):
+        """
+        Return the ETag and the Last-Modified timestamp (or None).
+        """
+        versions = get_versions(self.get_version_keys())
+        fingerprint = "|".join(
+            [request.path, request.META.get("QUERY_STRING", ""), str(request.version)]
+            + [f"{key}={version}" for key, (version, _) in sorted(versions.items())]
+        )
+        etag = f'"{hashlib.md5(fingerprint.encode()).hexdigest()}"'
+        changed = [updated_at for _, updated_at in versions.values() if updated_at]
+        # HTTP dates have whole seconds; the ETag catches faster changes.
+        return etag, int(max(changed).timestamp()) if changed else None
+
+    def set_validators(self, response):
+        validators = getattr(self, "_validators", None)
+        if validators is not None and response.status_code in (200, 304):
+            etag, last_modified = validators
+            response["ETag"] = etag
+            if last_modified is not None:
+                response["Last-Modified"] = http_date(last_modified)
+        return response
+
+
+class ConditionalGetMixin(_ValidatorsMixin):
+    """
+    Adds ETag and Last-Modified to GET responses of an APIView and answers
+    304 Not Modified when the client's copy is current, right after the
+    permission checks and before the handler loads or serializes anything.
+
+    Views return the ResourceVersion keys their response depends on from
+    `get_version_keys()`. The ETag also covers the path, query string and
+    API version, so each representation gets its own.
+    """
+
+    def check_conditional_permissions(self, request):
+        """
+        Hook for object permissions that must hold before a 304 is sent.
+        Only called for requests with conditional headers; the handler
+        checks them as usual otherwise.
+        """
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if request.method not in ("GET", "HEAD"):
+            return
+        if any(header in request.META for header in CONDITIONAL_HEADERS):
+            self.check_conditional_permissions(request)
+        self._validators = etag, last_modified = self.get_validators(request)
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is not None:
+            raise _Conditional(response)
+
+    def handle_exception(self, exc):
+        if isinstance(exc, _Conditional):
+            return exc.response
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        return self.set_validators(response)
+
+
+class AsyncConditionalGetMixin(_ValidatorsMixin):
+    """
+    ConditionalGetMixin for AsyncAPIView: same validators and ETags, with
+    the versions looked up in a worker thread after the permission checks.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        try:
+            response = await super().dispatch(request, *args, **kwargs)
+        except _Conditional as conditional:
+            response = conditional.response
+        return self.set_validators(response)
+
+    async def initial(self, request, authenticator):
+        await super().initial(request, authenticator)
+        if request.method not in ("GET", "HEAD"):
+            return
+        self._validators = etag, last_modified = await sync_to_async(
+            self.get_validators
+        )(request)
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is not None:
+            raise _Conditional(response)
@@ -0,0 +1,155 @@
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.exceptions import FieldDoesNotExist
+from django.db import models
+from rest_framework import serializers
+from rest_framework.response import Response
+
+# Serializer fields that render values of these model fields unchanged.
+IDENTITY_FIELDS = (
+    (serializers.BooleanField, models.BooleanField),
+    (serializers.CharField, (models.CharField, models.TextField)),
+    (serializers.IntegerField, (models.IntegerField, models.AutoField)),
+)
+
+UNSUPPORTED = object()
+
+
+class RowEncoder:
+    """
+    Renders `.values_list()` rows as a serializer renders model instances.
+
+    Each output field is either a column, passed through or converted by
+    the serializer field's to_representation, or a many-to-many relation
+    rendered as a list of ids from one query on its through table.
+    """
+
+    def __init__(self, columns, entries, relations):
+        self.columns = columns
+        self.entries = entries
+        self.relations = relations
+
+    def encode(self, queryset):
+        rows = list(queryset.prefetch_related(None).values_list("pk", *self.columns))
+        related = {
+            name: self._related_ids(field, [row[0] for row in rows])
+            for name, field in self.relations.items()
+        }
+
+        data = []
+        for row in rows:
+            item = {}
+            for name, index, convert in self.entries:
+                if index is None:
+                    item[name] = related[name].get(row[0], [])
+                    continue
+                value = row[index]
+                item[name] = (
+                    value if convert is None or value is None else convert(value)
+                )
+            data.append(item)
+        return data
+
+    @staticmethod
+    def _related_ids(field, pks):
+        """
+        Return {pk: [related id, ...]} with ids in ascending order.
+        """
+        through = field.remote_field.through
+        source = through._meta.get_field(field.m2m_field_name()).attname
+        target = through._meta.get_field(field.m2m_reverse_field_name()).attname
+        related = {}
+        if pks:
+            pairs = (
+                through.objects.filter(**{f"{source}__in": pks})
+                .order_by(target)
+                .values_list(source, target)
+            )
+            for pk, related_id in pairs:
+                related.setdefault(pk, []).append(related_id)
+        return related
+
+
+def _column_converter(field, model_field):
+    """
+    Return the converter of a field rendered from a column, None when its
+    values pass through unchanged, or UNSUPPORTED.
+    """
+    if isinstance(field, (serializers.BaseSerializer, serializers.FileField)):
+        return UNSUPPORTED
+    if isinstance(field, serializers.PrimaryKeyRelatedField):
+        return UNSUPPORTED if field.pk_field is not None else None
+    if model_field.is_relation or isinstance(field, serializers.RelatedField):
+        return UNSUPPORTED
+    for field_class, model_field_classes in IDENTITY_FIELDS:
+        if isinstance(field, field_class) and isinstance(
+            model_field, model_field_classes
+        ):
+            return None
+    if isinstance(field, serializers.JSONField) and not field.binary:
+        return None
+    return field.to_representation
+
+
+@lru_cache(maxsize=None)
+def row_encoder(serializer_class, names=None):
+    """
+    Compile the RowEncoder for the readable fields of `serializer_class`
+    (limited to `names` when given), or return None when a field is not a
+    plain model column or a many-to-many list of primary keys.
+    """
+    opts = serializer_class.Meta.model._meta
+    columns, entries, relations = [], [], {}
+    for name, field in serializer_class().fields.items():
+        if field.write_only or (names is not None and name not in names):
+            continue
+        if len(field.source_attrs) != 1:
+            return None
+        try:
+            model_field = opts.get_field(field.source)
+        except FieldDoesNotExist:
+            return None
+
+        if isinstance(field, serializers.ManyRelatedField):
+            child = field.child_relation
+            if not (
+                model_field.many_to_many
+                and not model_field.auto_created
+                and isinstance(child, serializers.PrimaryKeyRelatedField)
+                and child.pk_field is None
+            ):
+                return None
+            relations[name] = model_field
+            entries.append((name, None, None))
+            continue
+        if not model_field.concrete:
+            return None
+
+        convert = _column_converter(field, model_field)
+        if convert is UNSUPPORTED:
+            return None
+        columns.append(model_field.attname)
+        # Position 0 of every row holds the primary key.
+        entries.append((name, len(columns), convert))
+    return RowEncoder(columns, entries, relations)
+
+
+class ValuesListMixin:
+    """
+    Serves list GETs from `.values_list()` rows through a precompiled row
+    encoder, skipping model instances and per-row serializer fields. The
+    output is the same as the serializer's; serializers the encoder cannot
+    reproduce, and paginated views, go through the serializer as usual.
+    """
+
+    def list(self, request, *args, **kwargs):
+        serializer_class = self.get_serializer_class()
+        encoder = None
+        if settings.FAST_LIST_SERIALIZATION and self.paginator is None:
+            output_fields = getattr(serializer_class, "output_fields", None)
+            names = output_fields(request) if output_fields else None
+            encoder = row_encoder(serializer_class, names)
+        if encoder is None:
+            return super().list(request, *args, **kwargs)
+        return Response(encoder.encode(self.filter_queryset(self.get_queryset())))
@@ -0,0 +1,90 @@
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework import serializers
+
+FIELDS_PARAM = "fields"
+
+
+class VersionedFieldsMixin:
+    """
+    Trims serializer output by API version and the ?fields= query parameter.
+
+    Meta.version_fields maps an API version to the fields it returns;
+    versions without an entry return every field. The maps are validated
+    and frozen once when the serializer class is defined. Only the output
+    is trimmed, so input validation is the same for every version.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        meta = getattr(cls, "Meta", None)
+        declared = set(getattr(meta, "fields", ()))
+        field_maps = {}
+        for version, names in getattr(meta, "version_fields", {}).items():
+            unknown = set(names) - declared
+            if unknown:
+                raise ImproperlyConfigured(
+                    f"{cls.__name__}.Meta.version_fields[{version!r}] lists "
+                    f"fields missing from Meta.fields: {sorted(unknown)}"
+                )
+            field_maps[version] = frozenset(names)
+        cls._version_field_maps = field_maps
+
+    @classmethod
+    def output_fields(cls, request):
+        """
+        Return the field names to render for `request`, or None for all.
+        """
+        if request is None:
+            return None
+        allowed = cls._version_field_maps.get(getattr(request, "version", None))
+        requested = request.query_params.get(FIELDS_PARAM)
+        if not requested:
+            return allowed
+
+        names = frozenset(filter(None, (n.strip() for n in requested.split(","))))
+        available = allowed or frozenset(cls.Meta.fields)
+        unknown = names - available
+        if unknown:
+            raise serializers.ValidationError(
+                {FIELDS_PARAM: [f"Unknown fields: {', '.join(sorted(unknown))}."]}
+            )
+        return names
+
+    @classmethod
+    def wants_field(cls, request, name):
+        """
+        Whether `name` is rendered for `request`, so views can skip
+        loading data for trimmed fields.
+        """
+        allowed = cls.output_fields(request)
+        return allowed is None or name in allowed
+
+    def _is_top_level(self):
+        parent = self.parent
+        if parent is None:
+            return True
+        return isinstance(parent, serializers.ListSerializer) and parent.parent is None
+
+    def _resolve_output_fields(self):
+        allowed = getattr(self, "_output_fields", ...)
+        if allowed is ...:
+            # Nested serializers always render in full.
+            allowed = self._output_fields = (
+                self.output_fields(self.context.get("request"))
+                if self._is_top_level()
+                else None
+            )
+        return allowed
+
+    def run_validation(self, data=serializers.empty):
+        # Reject a bad ?fields= before anything is saved, not when the
+        # response is rendered after the write.
+        self._resolve_output_fields()
+        return super().run_validation(data)
+
+    @property
+    def _readable_fields(self):
+        allowed = self._resolve_output_fields()
+        for name, field in self.fields.items():
+            if not field.write_only and (allowed is None or name in allowed):
+                yield field
@@ -0,0 +1,141 @@
+import hashlib
+import json
+from contextlib import contextmanager
+from datetime import timedelta
+
+from core.models import IdempotencyKey
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import IntegrityError, OperationalError, connection, transaction
+from django.utils.timezone import now
+from rest_framework import exceptions, status
+from rest_framework.response import Response
+
+HEADER = "Idempotency-Key"
+
+
+class KeyInFlight(exceptions.APIException):
+    status_code = status.HTTP_409_CONFLICT
+    default_detail = "A request with this Idempotency-Key is still being processed."
+    default_code = "idempotency_key_in_flight"
+
+
+class KeyReused(exceptions.APIException):
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+    default_detail = "This Idempotency-Key was used for a different request."
+    default_code = "idempotency_key_reused"
+
+
+def fingerprint(request):
+    """
+    Digest of everything that shapes the response: the method, the path
+    with its query string (`?fields=`...), the API version and the body.
+    """
+    body = json.dumps(request.data, sort_keys=True, cls=DjangoJSONEncoder)
+    return hashlib.sha256(
+        f"{request.method} {request.get_full_path()} {request.version}\n{body}".encode()
+    ).hexdigest()
+
+
+@contextmanager
+def _lock_timeout(seconds):
+    """
+    Bound lock waits of the statements in the block on PostgreSQL. Use it
+    inside a savepoint: an error rolls the setting back with it, otherwise
+    the previous value is restored, so the view's own statements (in the
+    same transaction) do not run under the timeout.
+    """
+    if connection.vendor != "postgresql":
+        yield
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT current_setting('lock_timeout'), "
+            "set_config('lock_timeout', %s, true)",
+            [f"{int(seconds * 1000)}ms"],
+        )
+        previous = cursor.fetchone()[0]
+    yield
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT set_config('lock_timeout', %s, true)", [previous])
+
+
+def _claim(user, key, digest):
+    """
+    Insert the key row and return None, or return the stored row when the
+    key was already used. On PostgreSQL a duplicate of a request still in
+    flight blocks on the unique index until the original commits or rolls
+    back, for at most IDEMPOTENCY_LOCK_TIMEOUT seconds.
+    """
+    expires_at = now() + timedelta(seconds=settings.IDEMPOTENCY_KEY_TTL)
+    for _ in range(2):
+        try:
+            with transaction.atomic(), _lock_timeout(settings.IDEMPOTENCY_LOCK_TIMEOUT):
+                # status_code 0 marks the response as pending; no other
+                # transaction can see the row before it is filled in.
+                IdempotencyKey.objects.create(
+                    user=user,
+                    key=key,
+                    fingerprint=digest,
+                    status_code=0,
+                    expires_at=expires_at,
+                )
+            return None
+        except IntegrityError:
+            stored = IdempotencyKey.objects.get(user=user, key=key)
+        except OperationalError:
+            raise KeyInFlight()
+        if stored.expires_at > now():
+            return stored
+        stored.delete()
+    raise KeyInFlight()
+
+
+def replay(stored):
+    response = Response(stored.body, status=stored.status_code)
+    if stored.location:
+        response["Location"] = stored.location
+    response["Idempotent-Replayed"] = "true"
+    return response
+
+
+class IdempotentPostMixin:
+    """
+    Makes POST safe to retry with an Idempotency-Key header.
+
+    The key row is inserted in the same transaction as the work it guards
+    and filled in with the response, so retries replay the first response
+    (errors included) without running validation or inserts again.
+    Server errors roll everything back and leave the key free.
+    """
+
+    def post(self, request, *args, **kwargs):
+        key = request.headers.get(HEADER)
+        if key is None:
+            return super().post(request, *args, **kwargs)
+        if not 0 < len(key) <= 255:
+            raise exceptions.ValidationError(
+                {HEADER: "Must be between 1 and 255 characters."}
+            )
+
+        digest = fingerprint(request)
+        with transaction.atomic():
+            stored = _claim(request.user, key, digest)
+            if stored is not None:
+                if stored.fingerprint != digest:
+                    raise KeyReused()
+                return replay(stored)
+
+            try:
+                response = super().post(request, *args, **kwargs)
+            except exceptions.APIException as exc:
+                response = self.handle_exception(exc)
+            if response.status_code >= 500:
+                transaction.set_rollback(True)
+                return response
+            IdempotencyKey.objects.filter(user=request.user, key=key).update(
+                status_code=response.status_code,
+                body=response.data,
+                location=response.get("Location", ""),
+            )
+        return response
@@ -0,0 +1,57 @@
+from django.utils.encoding import force_str
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+_fallback_encoder = JSONEncoder()
+
+
+def _default(obj):
+    """
+    Encode the types orjson does not know through DRF's encoder.
+    """
+    try:
+        return _fallback_encoder.default(obj)
+    except TypeError:
+        # Lazy translation strings from validation errors.
+        return force_str(obj)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer backed by orjson, falling back to the stdlib encoder
+    when orjson is not installed.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b""
+        options = orjson.OPT_NON_STR_KEYS
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            options |= orjson.OPT_INDENT_2
+        return orjson.dumps(data, default=_default, option=options)
+
+
+class FastJSONParser(JSONParser):
+    """
+    JSONParser backed by orjson, falling back to the stdlib decoder
+    when orjson is not installed.
+    """
+
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        if orjson is None:
+            return super().parse(stream, media_type, parser_context)
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
@@ -0,0 +1,93 @@
+import json
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import RequestFactory
+from django.utils.timezone import now
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+from restaurants.models import Menu, Restaurant
+from restaurants.views import AsyncDailyMenuView
+from users.views import AsyncUserProfileView
+from votes.models import Vote
+from votes.views import AsyncVoteResultsView
+
+
+@pytest.fixture
+def data(django_user_model):
+    """
+    Creates a restaurant with today's menu and one vote for it.
+    """
+    owner = django_user_model.objects.create_user(
+        email="async.owner@example.com", password="testpass123", role="restaurant_admin"
+    )
+    employee = django_user_model.objects.create_user(
+        email="async.employee@example.com", password="testpass123"
+    )
+    restaurant = Restaurant.objects.create(name="Async Bistro", owner=owner)
+    menu = Menu.objects.create(
+        restaurant=restaurant, date=now().date(), items={"Soup": 5}
+    )
+    Vote.objects.create(user=employee, menu=menu)
+    return employee, restaurant
+
+
+def call_async(view, path, user=None, **kwargs):
+    headers = {}
+    if user is not None:
+        headers["HTTP_AUTHORIZATION"] = f"Bearer {AccessToken.for_user(user)}"
+    request = RequestFactory().get(path, **headers)
+    return async_to_sync(view.as_view())(request, **kwargs)
+
+
+def call_sync(path, user):
+    client = APIClient()
+    client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}")
+    return client.get(path)
+
+
+@pytest.mark.django_db
+def test_async_views_match_sync_views(data):
+    """Test that async read views return the same payloads as sync views."""
+    employee, restaurant = data
+    cases = [
+        (
+            AsyncDailyMenuView,
+            f"/api/restaurants/{restaurant.id}/daily-menu/",
+            {"restaurant_id": restaurant.id},
+        ),
+        (AsyncVoteResultsView, "/api/votes/results/", {}),
+        (AsyncUserProfileView, "/api/auth/profile/", {}),
+    ]
+    for view, path, kwargs in cases:
+        response = call_async(view, path, employee, **kwargs)
+        expected = call_sync(path, employee)
+        assert response.status_code == 200
+        assert json.loads(response.content) == expected.json()
+
+
+@pytest.mark.django_db
+def test_async_views_require_authentication(data):
+    """Test that anonymous and invalid tokens get 401 with a challenge."""
+    response = call_async(AsyncVoteResultsView, "/api/votes/results/")
+    assert response.status_code == 401
+    assert response["WWW-Authenticate"].startswith("Bearer")
+
+    request = RequestFactory().get(
+        "/api/votes/results/", HTTP_AUTHORIZATION="Bearer not-a-token"
+    )
+    response = async_to_sync(AsyncVoteResultsView.as_view())(request)
+    assert response.status_code == 401
+
+
+@pytest.mark.django_db
+def test_async_views_apply_versioning(data):
+    """Test that async views honour X-API-Version."""
+    employee, _ = data
+    request = RequestFactory().get(
+        "/api/auth/profile/",
+        HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(employee)}",
+        HTTP_X_API_VERSION="2",
+    )
+    response = async_to_sync(AsyncUserProfileView.as_view())(request)
+    assert "created_at" not in json.loads(response.content)
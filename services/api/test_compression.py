@@ -0,0 +1,61 @@
+import gzip
+
+import pytest
+from django.test import override_settings
+from rest_framework.test import APIClient
+from restaurants.models import Menu, Restaurant
+from services.api.compression import choose_encoding
+
+
+@pytest.fixture
+def menus(django_user_model):
+    """
+    Creates one restaurant with enough menus for a compressible response.
+    """
+    owner = django_user_model.objects.create_user(
+        email="gzip@example.com", password="testpass123", role="restaurant_admin"
+    )
+    restaurant = Restaurant.objects.create(name="Gzip Diner", owner=owner)
+    Menu.objects.bulk_create(
+        Menu(
+            restaurant=restaurant,
+            date=f"2025-01-{day:02d}",
+            items={"Soup": 5, "Steak": 20, "Salad": 7},
+        )
+        for day in range(1, 29)
+    )
+    client = APIClient()
+    client.force_authenticate(user=owner)
+    return client, f"/api/restaurants/{restaurant.id}/menus/"
+
+
+def test_choose_encoding():
+    """Test Accept-Encoding negotiation with quality values."""
+    assert choose_encoding("") is None
+    assert choose_encoding("gzip, deflate") == "gzip"
+    assert choose_encoding("gzip;q=0, identity") is None
+    assert choose_encoding("*") in ("br", "gzip")
+
+
+@pytest.mark.django_db
+@override_settings(COMPRESSION_ENABLED=True, COMPRESSION_MIN_SIZE=256)
+def test_large_responses_are_gzipped(menus):
+    """Test that responses above the threshold are compressed."""
+    client, url = menus
+    plain = client.get(url)
+    response = client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+
+    assert "Content-Encoding" not in plain
+    assert response["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response["Vary"]
+    assert gzip.decompress(response.content) == plain.content
+    assert len(response.content) < len(plain.content)
+
+
+@pytest.mark.django_db
+@override_settings(COMPRESSION_ENABLED=True, COMPRESSION_MIN_SIZE=1_000_000)
+def test_small_responses_are_not_compressed(menus):
+    """Test that responses below the threshold are sent as is."""
+    client, url = menus
+    response = client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+    assert "Content-Encoding" not in response
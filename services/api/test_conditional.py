@@ -0,0 +1,235 @@
+from datetime import timedelta
+
+import pytest
+from asgiref.sync import async_to_sync
+from core.models import ResourceVersion
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+from django.utils.timezone import now
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+from restaurants.models import Menu, Restaurant
+from restaurants.views import AsyncDailyMenuView
+from services.api.versions import bump_versions, get_versions
+from votes.models import Vote
+from votes.views import AsyncVoteResultsView
+
+
+@pytest.fixture
+def data(django_user_model):
+    """
+    Creates a restaurant with an employee and today's menu.
+    """
+    owner = django_user_model.objects.create_user(
+        email="etag.owner@example.com", password="testpass123", role="restaurant_admin"
+    )
+    employee = django_user_model.objects.create_user(
+        email="etag.employee@example.com", password="testpass123"
+    )
+    restaurant = Restaurant.objects.create(name="ETag Bistro", owner=owner)
+    restaurant.employees.add(employee)
+    menu = Menu.objects.create(
+        restaurant=restaurant, date=now().date(), items={"Soup": 5}
+    )
+    return owner, employee, restaurant, menu
+
+
+def client_for(user):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+def get_sync(user, path, view, kwargs, **headers):
+    return client_for(user).get(path, **headers)
+
+
+def get_async(user, path, view, kwargs, **headers):
+    """
+    Calls the async variant of a view, as served with ASYNC_READ_VIEWS.
+    """
+    headers["HTTP_AUTHORIZATION"] = f"Bearer {AccessToken.for_user(user)}"
+    request = RequestFactory().get(path, **headers)
+    return async_to_sync(view.as_view())(request, **kwargs)
+
+
+@pytest.mark.django_db
+def test_bump_versions_creates_and_increments():
+    """Test that bumping counts every change of a key."""
+    bump_versions(["a", "b", "a"])
+    bump_versions(["a"])
+
+    assert {k: v for k, (v, _) in get_versions(["a", "b", "c"]).items()} == {
+        "a": 2,
+        "b": 1,
+        "c": 0,
+    }
+    assert ResourceVersion.objects.count() == 2
+
+
+@pytest.mark.django_db
+def test_unchanged_daily_menu_is_not_modified(data):
+    """Test that a matching ETag gets 304 from a single version lookup."""
+    _, employee, restaurant, _ = data
+    client = client_for(employee)
+    path = f"/api/restaurants/{restaurant.id}/daily-menu/"
+
+    first = client.get(path)
+    assert first.status_code == 200
+    assert first.has_header("Last-Modified")
+
+    with CaptureQueriesContext(connection) as queries:
+        second = client.get(path, HTTP_IF_NONE_MATCH=first["ETag"])
+    assert second.status_code == 304
+    assert second["ETag"] == first["ETag"]
+    assert len(queries) == 1
+
+    since = client.get(path, HTTP_IF_MODIFIED_SINCE=first["Last-Modified"])
+    assert since.status_code == 304
+
+
+@pytest.mark.django_db
+def test_changes_produce_new_etags(data):
+    """Test that menu edits, votes and new employees change the ETags."""
+    owner, employee, restaurant, menu = data
+    client = client_for(owner)
+    paths = {
+        "daily": f"/api/restaurants/{restaurant.id}/daily-menu/",
+        "menus": f"/api/restaurants/{restaurant.id}/menus/",
+        "results": "/api/votes/results/",
+        "restaurant": f"/api/restaurants/{restaurant.id}/",
+    }
+    etags = {name: client.get(path)["ETag"] for name, path in paths.items()}
+
+    def changed():
+        return {
+            name
+            for name, path in paths.items()
+            if client.get(path, HTTP_IF_NONE_MATCH=etags[name]).status_code == 200
+        }
+
+    Vote.objects.create(user=employee, menu=menu)
+    assert changed() == {"results"}
+
+    menu.items = {"Soup": 6}
+    menu.save()
+    assert changed() == {"daily", "menus", "results"}
+
+    etags = {name: client.get(path)["ETag"] for name, path in paths.items()}
+    new_employee = type(owner).objects.create_user(
+        email="etag.new@example.com", password="testpass123"
+    )
+    response = client.patch(
+        f"/api/restaurants/{restaurant.id}/add-employee/",
+        {"employee_id": new_employee.id},
+        format="json",
+    )
+    assert response.status_code == 200
+    assert changed() == {"restaurant"}
+
+
+@pytest.mark.django_db
+def test_bulk_vote_deletes_change_results(data, django_user_model):
+    """Test that cascades and queryset deletes invalidate the results."""
+    owner, employee, restaurant, menu = data
+    voter = django_user_model.objects.create_user(
+        email="etag.voter@example.com", password="testpass123"
+    )
+    restaurant.employees.add(voter)
+    Vote.objects.create(user=voter, menu=menu)
+    Vote.objects.create(user=employee, menu=menu)
+    client = client_for(owner)
+    results = "/api/votes/results/"
+    key = f"results:{menu.date}"
+
+    etag = client.get(results)["ETag"]
+    version = get_versions([key])[key][0]
+    voter.delete()
+    assert client.get(results, HTTP_IF_NONE_MATCH=etag).status_code == 200
+    assert get_versions([key])[key][0] == version + 1
+
+    etag = client.get(results)["ETag"]
+    Vote.objects.all().delete()
+    response = client.get(results, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response.data[0]["votes"] == 0
+
+
+@pytest.mark.django_db
+def test_moving_a_menu_changes_both_days(data):
+    """Test that a date change invalidates the old day as well as the new."""
+    owner, employee, restaurant, menu = data
+    client = client_for(employee)
+    today = f"/api/restaurants/{restaurant.id}/daily-menu/"
+    results = "/api/votes/results/"
+    etags = {path: client.get(path)["ETag"] for path in (today, results)}
+
+    response = client_for(owner).patch(
+        f"/api/restaurants/{restaurant.id}/menus/{menu.id}/",
+        {"date": str(now().date() + timedelta(days=1))},
+        format="json",
+    )
+    assert response.status_code == 200
+    for path, etag in etags.items():
+        response = client.get(path, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == 200
+        assert response.data == []
+
+
+@pytest.mark.django_db
+def test_etag_varies_with_representation(data):
+    """Test that API versions and sparse fieldsets get their own ETags."""
+    _, employee, restaurant, _ = data
+    client = client_for(employee)
+    path = f"/api/restaurants/{restaurant.id}/daily-menu/"
+
+    etags = {
+        client.get(path)["ETag"],
+        client.get(path, {"fields": "id"})["ETag"],
+        client.get(path, HTTP_X_API_VERSION="2")["ETag"],
+    }
+    assert len(etags) == 3
+
+
+@pytest.mark.django_db
+def test_not_modified_still_checks_permissions(data):
+    """Test that only the owner can get a 304 for the restaurant."""
+    owner, employee, restaurant, _ = data
+    path = f"/api/restaurants/{restaurant.id}/"
+    etag = client_for(owner).get(path)["ETag"]
+
+    assert client_for(employee).get(path, HTTP_IF_NONE_MATCH=etag).status_code == 403
+    assert client_for(owner).get(path, HTTP_IF_NONE_MATCH=etag).status_code == 304
+    missing = client_for(owner).get("/api/restaurants/0/", HTTP_IF_NONE_MATCH=etag)
+    assert missing.status_code == 404
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("get", [get_sync, get_async], ids=["sync", "async"])
+def test_read_views_are_conditional(data, get):
+    """Test ETags, 304s and invalidation on both variants of the read views."""
+    _, employee, restaurant, menu = data
+    views = {
+        f"/api/restaurants/{restaurant.id}/daily-menu/": (
+            AsyncDailyMenuView,
+            {"restaurant_id": restaurant.id},
+        ),
+        "/api/votes/results/": (AsyncVoteResultsView, {}),
+    }
+    etags = {}
+    for path, view in views.items():
+        first = get(employee, path, *view)
+        assert first.status_code == 200
+        assert first.has_header("Last-Modified")
+        etags[path] = first["ETag"]
+        cached = get(employee, path, *view, HTTP_IF_NONE_MATCH=first["ETag"])
+        assert cached.status_code == 304
+        assert cached["ETag"] == first["ETag"]
+
+    menu.items = {"Soup": 6}
+    menu.save()
+    for path, view in views.items():
+        changed = get(employee, path, *view, HTTP_IF_NONE_MATCH=etags[path])
+        assert changed.status_code == 200
+        assert changed["ETag"] != etags[path]
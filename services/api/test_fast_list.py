@@ -0,0 +1,137 @@
+from datetime import datetime, timezone as dt_timezone
+from unittest import mock
+
+import pytest
+from django.test import override_settings
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.test import APIClient
+from restaurants.models import Menu, Restaurant
+from restaurants.serializers import MenuSerializer, RestaurantSerializer
+from services.api.fast_list import RowEncoder, row_encoder
+from services.api.renderers import FastJSONRenderer
+from users.models import CustomUser
+
+
+@pytest.fixture
+def data(django_user_model):
+    """
+    Creates restaurants with employees added out of id order, unicode
+    names, microsecond timestamps and menus with nested items.
+    """
+    owner = django_user_model.objects.create_user(
+        email="fast.owner@example.com", password="testpass123", role="restaurant_admin"
+    )
+    employees = [
+        django_user_model.objects.create_user(
+            email=f"fast.employee{i}@example.com", password="testpass123"
+        )
+        for i in range(4)
+    ]
+    cafe = Restaurant.objects.create(name="Кафе «Смак» ☕", owner=owner)
+    cafe.employees.add(employees[2], employees[0], employees[3])
+    Restaurant.objects.filter(id=cafe.id).update(
+        created_at=datetime(2025, 3, 30, 23, 59, 59, 123456, tzinfo=dt_timezone.utc)
+    )
+    Restaurant.objects.create(name="Empty Diner", owner=owner)
+    Menu.objects.create(
+        restaurant=cafe,
+        date="2025-03-31",
+        items={"Борщ": 5, "Combo": {"price": 12.5, "sides": ["fries", None]}},
+    )
+    Menu.objects.create(restaurant=cafe, date="2025-04-01", items=[])
+    client = APIClient()
+    client.force_authenticate(user=owner)
+    return client, cafe
+
+
+def requests_for(cafe):
+    paths = [
+        "/api/restaurants/",
+        "/api/restaurants/?fields=id,employees",
+        "/api/restaurants/?fields=created_at",
+        f"/api/restaurants/{cafe.id}/menus/",
+        f"/api/restaurants/{cafe.id}/menus/?fields=items,date",
+    ]
+    return [(path, version) for path in paths for version in ("1", "2")]
+
+
+@pytest.mark.django_db
+def test_list_responses_match_the_serializers_byte_for_byte(data):
+    """Test that every list shape is identical with and without the fast path."""
+    client, cafe = data
+    for path, version in requests_for(cafe):
+        with mock.patch.object(
+            RowEncoder, "encode", autospec=True, side_effect=RowEncoder.encode
+        ) as encode:
+            fast = client.get(path, HTTP_X_API_VERSION=version)
+        with override_settings(FAST_LIST_SERIALIZATION=False):
+            slow = client.get(path, HTTP_X_API_VERSION=version)
+
+        # Version 2 does not offer employees, so some requests answer 400.
+        assert encode.called == (fast.status_code == 200)
+        assert fast.status_code == slow.status_code
+        assert fast.content == slow.content, (path, version)
+
+
+@pytest.mark.django_db
+def test_unknown_fields_are_rejected_the_same_way(data):
+    """Test that ?fields= errors are unchanged."""
+    client, _ = data
+    fast = client.get("/api/restaurants/?fields=id,menus")
+    with override_settings(FAST_LIST_SERIALIZATION=False):
+        slow = client.get("/api/restaurants/?fields=id,menus")
+
+    assert fast.status_code == slow.status_code == 400
+    assert fast.content == slow.content
+
+
+def render(data):
+    return FastJSONRenderer().render(data)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("serializer_class", [RestaurantSerializer, MenuSerializer])
+@pytest.mark.parametrize("zone", ["UTC", "America/Caracas"])
+def test_row_encoders_match_their_serializers(data, serializer_class, zone):
+    """Test that encoders render querysets exactly as the serializers do."""
+    queryset = serializer_class.Meta.model.objects.order_by("id")
+    with timezone.override(zone):
+        expected = render(serializer_class(queryset, many=True).data)
+        assert render(row_encoder(serializer_class).encode(queryset)) == expected
+
+
+class UserSerializer(serializers.ModelSerializer):
+    joined = serializers.DateTimeField(source="created_at", format="%d.%m.%Y %H:%M")
+    login = serializers.CharField(source="id")
+
+    class Meta:
+        model = CustomUser
+        fields = ["id", "email", "role", "is_staff", "last_login", "joined", "login"]
+
+
+@pytest.mark.django_db
+def test_row_encoder_converts_like_the_fields(data):
+    """Test formats, renamed sources, type coercion and null values."""
+    queryset = CustomUser.objects.order_by("id")
+    expected = render(UserSerializer(queryset, many=True).data)
+    assert render(row_encoder(UserSerializer).encode(queryset)) == expected
+
+
+class AnnotatedSerializer(serializers.ModelSerializer):
+    owner_email = serializers.CharField(source="owner.email")
+    menu_count = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Restaurant
+        fields = ["id", "owner_email", "menu_count"]
+
+    def get_menu_count(self, obj):
+        return 0
+
+
+def test_fields_not_backed_by_columns_fall_back():
+    """Test that nested sources and method fields are left to DRF."""
+    assert row_encoder(AnnotatedSerializer) is None
+    assert row_encoder(AnnotatedSerializer, frozenset({"id", "owner_email"})) is None
+    assert row_encoder(AnnotatedSerializer, frozenset({"id"})) is not None
@@ -0,0 +1,99 @@
+import pytest
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework import serializers
+from rest_framework.test import APIClient
+from django.utils.timezone import now
+from restaurants.models import Menu, Restaurant
+from services.api.fields import VersionedFieldsMixin
+from services.testing.query_budget import count_request_queries
+
+URL = "/api/restaurants/"
+
+
+@pytest.fixture
+def client(django_user_model):
+    """
+    Returns a client for an owner with one restaurant and one employee.
+    """
+    owner = django_user_model.objects.create_user(
+        email="sparse@example.com", password="testpass123", role="restaurant_admin"
+    )
+    employee = django_user_model.objects.create_user(
+        email="sparse.employee@example.com", password="testpass123"
+    )
+    Restaurant.objects.create(name="Sparse Cafe", owner=owner).employees.add(employee)
+    client = APIClient()
+    client.force_authenticate(user=owner)
+    return client
+
+
+@pytest.mark.django_db
+def test_default_version_returns_full_shape(client):
+    """Test that clients without a version header get every field."""
+    response = client.get(URL)
+    assert set(response.data[0]) == {"id", "name", "owner", "employees", "created_at"}
+
+
+@pytest.mark.django_db
+def test_compact_version_skips_employees(client):
+    """Test that version 2 returns compact rows without loading employees."""
+    full, full_queries = count_request_queries(client, "get", URL)
+    client.credentials(HTTP_X_API_VERSION="2")
+    compact, compact_queries = count_request_queries(client, "get", URL)
+
+    assert set(compact.data[0]) == {"id", "name", "owner"}
+    assert compact_queries == full_queries - 1
+
+
+@pytest.mark.django_db
+def test_sparse_fieldsets(client):
+    """Test ?fields= selection and rejection of unknown fields."""
+    response = client.get(URL, {"fields": "id,name"})
+    assert set(response.data[0]) == {"id", "name"}
+
+    response = client.get(URL, {"fields": "id,secret"})
+    assert response.status_code == 400
+    assert "secret" in str(response.data["fields"])
+
+    client.credentials(HTTP_X_API_VERSION="2")
+    response = client.get(URL, {"fields": "id,employees"})
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_unknown_fields_are_rejected_before_saving(client):
+    """Test that a POST with a bad ?fields= is rejected without a write."""
+    response = client.post(f"{URL}?fields=bogus", {"name": "Ghost"}, format="json")
+    assert response.status_code == 400
+    assert not Restaurant.objects.filter(name="Ghost").exists()
+
+    restaurant = Restaurant.objects.get(name="Sparse Cafe")
+    path = f"{URL}{restaurant.id}/menus/?fields=bogus"
+    payload = {"restaurant": restaurant.id, "date": str(now().date()), "items": {}}
+    response = client.post(path, payload, format="json", HTTP_IDEMPOTENCY_KEY="k1")
+    assert response.status_code == 400
+    assert not Menu.objects.exists()
+
+    response = client.post(
+        path.replace("bogus", "id"), payload, format="json", HTTP_IDEMPOTENCY_KEY="k2"
+    )
+    assert response.status_code == 201
+    assert response.data == {"id": Menu.objects.get().id}
+
+
+@pytest.mark.django_db
+def test_unknown_version_is_rejected(client):
+    """Test that unsupported versions get 406 Not Acceptable."""
+    client.credentials(HTTP_X_API_VERSION="99")
+    assert client.get(URL).status_code == 406
+
+
+def test_version_fields_must_be_declared():
+    """Test that version maps are validated when the class is defined."""
+    with pytest.raises(ImproperlyConfigured):
+
+        class BrokenSerializer(VersionedFieldsMixin, serializers.ModelSerializer):
+            class Meta:
+                model = Restaurant
+                fields = ["id", "name"]
+                version_fields = {"2": ["id", "owner"]}
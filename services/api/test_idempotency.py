@@ -0,0 +1,167 @@
+from datetime import timedelta
+from unittest import mock
+
+import pytest
+from core.models import IdempotencyKey
+from django.db import OperationalError
+from django.utils.timezone import now
+from rest_framework.test import APIClient
+from restaurants.models import Menu, Restaurant
+from votes.models import Vote
+
+
+@pytest.fixture
+def data(django_user_model):
+    """
+    Creates a restaurant with today's menu and one of its employees.
+    """
+    owner = django_user_model.objects.create_user(
+        email="idem.owner@example.com", password="testpass123", role="restaurant_admin"
+    )
+    employee = django_user_model.objects.create_user(
+        email="idem.employee@example.com", password="testpass123"
+    )
+    restaurant = Restaurant.objects.create(name="Idempotent Deli", owner=owner)
+    restaurant.employees.add(employee)
+    menu = Menu.objects.create(
+        restaurant=restaurant, date=now().date(), items={"Soup": 5}
+    )
+    return owner, employee, restaurant, menu
+
+
+def client_for(user):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+def vote(client, menu, key="vote-1"):
+    return client.post(
+        "/api/votes/vote/",
+        {"menu": menu.id},
+        format="json",
+        HTTP_IDEMPOTENCY_KEY=key,
+    )
+
+
+@pytest.mark.django_db
+def test_retried_vote_replays_the_first_response(data):
+    """Test that a retry gets the original 201 instead of a 400."""
+    _, employee, _, menu = data
+    client = client_for(employee)
+
+    first = vote(client, menu)
+    with mock.patch("votes.serializers.validate_user_vote") as validate:
+        retry = vote(client, menu)
+
+    assert first.status_code == retry.status_code == 201
+    assert retry.data == first.data
+    assert retry["Idempotent-Replayed"] == "true"
+    validate.assert_not_called()
+    assert Vote.objects.count() == 1
+
+    assert vote(client, menu, key="vote-2").status_code == 400
+
+
+@pytest.mark.django_db
+def test_errors_are_replayed_too(data):
+    """Test that a rejected request is answered the same way on retry."""
+    _, employee, _, _ = data
+    client = client_for(employee)
+
+    first = client.post(
+        "/api/votes/vote/", {"menu": 0}, format="json", HTTP_IDEMPOTENCY_KEY="bad"
+    )
+    retry = client.post(
+        "/api/votes/vote/", {"menu": 0}, format="json", HTTP_IDEMPOTENCY_KEY="bad"
+    )
+
+    assert first.status_code == retry.status_code == 400
+    assert retry.data == first.data
+
+
+@pytest.mark.django_db
+def test_key_reused_for_another_request(data):
+    """Test that a key cannot be reused with a different body."""
+    owner, employee, restaurant, menu = data
+    restaurant.employees.add(owner)
+    client = client_for(employee)
+    vote(client, menu)
+    other = Menu.objects.create(
+        restaurant=restaurant, date=now().date() + timedelta(days=1), items={}
+    )
+
+    assert vote(client, other).status_code == 422
+    assert vote(client_for(owner), other).status_code == 201
+
+
+@pytest.mark.django_db
+def test_key_reused_for_another_representation(data):
+    """Test that a retry asking for another shape is refused, not replayed."""
+    _, employee, _, menu = data
+    client = client_for(employee)
+    vote(client, menu)
+
+    for path, headers in [
+        ("/api/votes/vote/?fields=id", {}),
+        ("/api/votes/vote/", {"HTTP_X_API_VERSION": "2"}),
+    ]:
+        response = client.post(
+            path,
+            {"menu": menu.id},
+            format="json",
+            HTTP_IDEMPOTENCY_KEY="vote-1",
+            **headers,
+        )
+        assert response.status_code == 422
+
+
+@pytest.mark.django_db
+def test_expired_key_runs_again(data):
+    """Test that an expired key is treated as new."""
+    _, employee, _, menu = data
+    client = client_for(employee)
+    vote(client, menu)
+    IdempotencyKey.objects.update(expires_at=now())
+    Vote.objects.all().delete()
+
+    response = vote(client, menu)
+
+    assert response.status_code == 201
+    assert not response.has_header("Idempotent-Replayed")
+    assert Vote.objects.count() == 1
+
+
+@pytest.mark.django_db
+def test_menu_creation_is_idempotent(data):
+    """Test that retried menu creation creates one menu."""
+    owner, _, restaurant, _ = data
+    client = client_for(owner)
+    path = f"/api/restaurants/{restaurant.id}/menus/"
+    payload = {
+        "restaurant": restaurant.id,
+        "date": str(now().date() + timedelta(days=3)),
+        "items": {"Soup": 5},
+    }
+
+    responses = [
+        client.post(path, payload, format="json", HTTP_IDEMPOTENCY_KEY="menu-1")
+        for _ in range(2)
+    ]
+
+    assert [r.status_code for r in responses] == [201, 201]
+    assert Menu.objects.filter(date=payload["date"]).count() == 1
+
+
+@pytest.mark.django_db
+def test_in_flight_duplicate_times_out_with_conflict(data):
+    """Test that a retry giving up on the original gets 409."""
+    _, employee, _, menu = data
+
+    with mock.patch.object(
+        IdempotencyKey.objects, "create", side_effect=OperationalError
+    ):
+        response = vote(client_for(employee), menu)
+
+    assert response.status_code == 409
+    assert not Vote.objects.exists()
@@ -0,0 +1,32 @@
+import json
+from datetime import date
+from decimal import Decimal
+from io import BytesIO
+
+import pytest
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+from services.api.renderers import FastJSONParser, FastJSONRenderer
+
+
+def test_renderer_matches_stdlib_output():
+    """Test that the fast renderer encodes DRF payloads like JSONRenderer."""
+    data = {
+        "id": 1,
+        "date": date(2025, 3, 1),
+        "price": Decimal("12.50"),
+        "items": {"Borscht": 5, "Варенички": 7},
+        "error": [gettext_lazy("This field is required.")],
+    }
+    fast = json.loads(FastJSONRenderer().render(data))
+    stdlib = json.loads(JSONRenderer().render(data))
+    assert fast == stdlib
+
+
+def test_parser_round_trip_and_errors():
+    """Test that the fast parser decodes JSON and reports invalid bodies."""
+    parser = FastJSONParser()
+    assert parser.parse(BytesIO(b'{"menu": 3}')) == {"menu": 3}
+    with pytest.raises(ParseError):
+        parser.parse(BytesIO(b"{not json"))
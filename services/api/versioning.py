@@ -0,0 +1,21 @@
+from rest_framework import exceptions
+from rest_framework.versioning import BaseVersioning
+
+VERSION_HEADER = "X-API-Version"
+
+
+class HeaderVersioning(BaseVersioning):
+    """
+    Reads the API version from the X-API-Version request header.
+
+    Clients that do not send the header get DEFAULT_VERSION, so existing
+    mobile apps keep the full response shape.
+    """
+
+    invalid_version_message = f"Invalid version in {VERSION_HEADER} header."
+
+    def determine_version(self, request, *args, **kwargs):
+        version = request.headers.get(VERSION_HEADER, self.default_version)
+        if not self.is_allowed_version(version):
+            raise exceptions.NotAcceptable(self.invalid_version_message)
+        return version
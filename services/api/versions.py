@@ -0,0 +1,42 @@
+from core.models import ResourceVersion
+from django.db import connection
+from django.utils.timezone import now
+
+_table = ResourceVersion._meta.db_table
+
+
+def bump_versions(keys):
+    """
+    Increment the version of every key with one upsert, creating missing
+    keys at version 1. Call it at the end of the transaction that changes
+    the resources: the rows stay locked until it commits.
+    """
+    keys = sorted(set(keys))
+    if not keys:
+        return
+    # Sorted keys make concurrent bumps lock rows in the same order.
+    table, key, version, updated_at = map(
+        connection.ops.quote_name, (_table, "key", "version", "updated_at")
+    )
+    values = ", ".join(["(%s, 1, %s)"] * len(keys))
+    timestamp = connection.ops.adapt_datetimefield_value(now())
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {table} ({key}, {version}, {updated_at}) VALUES {values} "
+            f"ON CONFLICT ({key}) DO UPDATE SET {version} = {table}.{version} + 1, "
+            f"{updated_at} = excluded.{updated_at}",
+            [param for k in keys for param in (k, timestamp)],
+        )
+
+
+def get_versions(keys):
+    """
+    Return {key: (version, updated_at)}; keys never bumped are at version 0.
+    """
+    found = {
+        key: (version, updated_at)
+        for key, version, updated_at in ResourceVersion.objects.filter(
+            key__in=keys
+        ).values_list("key", "version", "updated_at")
+    }
+    return {key: found.get(key, (0, None)) for key in keys}
@@ -0,0 +1,55 @@
+import time
+
+from django.db import transaction
+
+MIN_BATCH_SIZE = 10
+
+
+def delete_in_batches(
+    queryset, batch_size=1_000, max_batch_seconds=0.5, pause=0.0, on_batch=None
+):
+    """
+    Delete the rows of `queryset` in primary key order, one short
+    transaction per batch, so no lock is held for long.
+
+    Batches shrink when one takes longer than `max_batch_seconds` and grow
+    back towards `batch_size` when they are fast. `on_batch(rows)` receives
+    each batch as dicts of column values before it is deleted, inside the
+    same transaction. Returns the number of rows deleted.
+    """
+    model = queryset.model
+    using = queryset.db
+    columns = [field.attname for field in model._meta.concrete_fields]
+    pk = model._meta.pk.attname
+    queryset = queryset.order_by("pk")
+    size = batch_size
+    last_pk = None
+    deleted = 0
+
+    while True:
+        page = queryset if last_pk is None else queryset.filter(pk__gt=last_pk)
+        started = time.monotonic()
+        with transaction.atomic(using=using):
+            if on_batch is not None:
+                rows = list(page.values(*columns)[:size])
+                ids = [row[pk] for row in rows]
+            else:
+                ids = list(page.values_list("pk", flat=True)[:size])
+            if not ids:
+                break
+            if on_batch is not None:
+                on_batch(rows)
+            model._base_manager.using(using).filter(pk__in=ids).delete()
+        elapsed = time.monotonic() - started
+
+        deleted += len(ids)
+        last_pk = ids[-1]
+        if len(ids) < size:
+            break
+        if elapsed > max_batch_seconds:
+            size = max(MIN_BATCH_SIZE, size // 2)
+        elif elapsed < max_batch_seconds / 4:
+            size = min(batch_size, size * 2)
+        if pause:
+            time.sleep(pause)
+    return deleted
@@ -0,0 +1,287 @@
+import os
+import threading
+import time
+from collections import deque
+
+
+class PoolTimeout(Exception):
+    """
+    Raised when no connection could be checked out within the pool timeout.
+    """
+
+
+class PooledConnection:
+    """
+    Bookkeeping wrapper for a raw connection held by the pool.
+    """
+
+    __slots__ = ("raw", "created_at", "last_used_at")
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.created_at = time.monotonic()
+        self.last_used_at = self.created_at
+
+
+class ConnectionPool:
+    """
+    Thread-safe LIFO connection pool with min/max size and health checks.
+
+    `connect` opens a new raw connection, `check` returns True if an idle
+    connection is still usable, `reset` returns True if a connection that is
+    being returned can be reused and `close` disposes of a raw connection.
+    """
+
+    def __init__(
+        self,
+        connect,
+        check=None,
+        reset=None,
+        close=None,
+        min_size=0,
+        max_size=10,
+        timeout=5.0,
+        max_idle=300.0,
+        max_lifetime=1800.0,
+        health_check_interval=0.0,
+    ):
+        if max_size < 1 or min_size < 0 or min_size > max_size:
+            raise ValueError("Pool sizes must satisfy 0 <= min_size <= max_size >= 1")
+
+        self._connect = connect
+        self._check = check
+        self._reset = reset
+        self._close = close or (lambda raw: raw.close())
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.max_lifetime = max_lifetime
+        self.health_check_interval = health_check_interval
+
+        self.pid = os.getpid()
+        self._lock = threading.Condition(threading.Lock())
+        self._idle = deque()
+        self._in_use = {}
+        self._opening = 0
+        self._closed = False
+        self._stats = {
+            "checkouts": 0,
+            "checkins": 0,
+            "connections_opened": 0,
+            "connections_closed": 0,
+            "health_check_failures": 0,
+            "waits": 0,
+            "wait_time": 0.0,
+            "timeouts": 0,
+        }
+
+    @property
+    def size(self):
+        return len(self._idle) + len(self._in_use) + self._opening
+
+    def checkout(self):
+        """
+        Return a healthy raw connection, opening one if the pool is not full.
+        """
+        deadline = time.monotonic() + self.timeout
+        waited = False
+
+        while True:
+            pooled = None
+            with self._lock:
+                if self._closed:
+                    raise PoolTimeout("Connection pool is closed.")
+                if self._idle:
+                    pooled = self._idle.pop()
+                elif self.size < self.max_size:
+                    self._opening += 1
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        self._stats["timeouts"] += 1
+                        raise PoolTimeout(
+                            f"No connection available within {self.timeout}s "
+                            f"(max_size={self.max_size})."
+                        )
+                    if not waited:
+                        self._stats["waits"] += 1
+                        waited = True
+                    started = time.monotonic()
+                    self._lock.wait(remaining)
+                    self._stats["wait_time"] += time.monotonic() - started
+                    continue
+
+            opened = pooled is None
+            if opened:
+                pooled = self._open()
+            elif not self._is_healthy(pooled):
+                self._discard(pooled)
+                continue
+
+            with self._lock:
+                self._in_use[id(pooled.raw)] = pooled
+                self._stats["checkouts"] += 1
+            if opened:
+                self._fill_to_min_size()
+            return pooled.raw
+
+    def checkin(self, raw, reuse=True):
+        """
+        Return a connection to the pool, closing it if it cannot be reused.
+        """
+        with self._lock:
+            pooled = self._in_use.pop(id(raw), None)
+        if pooled is None:
+            self._close_raw(raw)
+            return
+
+        now = time.monotonic()
+        reusable = (
+            reuse and not self._closed and now - pooled.created_at < self.max_lifetime
+        )
+        if reusable and self._reset is not None:
+            try:
+                reusable = self._reset(raw)
+            except Exception:
+                reusable = False
+
+        if not reusable:
+            self._close_raw(raw)
+            with self._lock:
+                self._lock.notify()
+            return
+
+        pooled.last_used_at = now
+        with self._lock:
+            self._idle.append(pooled)
+            self._stats["checkins"] += 1
+            self._lock.notify()
+
+    def close(self):
+        """
+        Close all idle connections and refuse further checkouts.
+        In-use connections are closed when they are checked back in.
+        """
+        with self._lock:
+            self._closed = True
+            idle, self._idle = list(self._idle), deque()
+            self._lock.notify_all()
+        for pooled in idle:
+            self._close_raw(pooled.raw)
+
+    def stats(self):
+        """
+        Return a snapshot of the pool counters for this worker process.
+        """
+        with self._lock:
+            return {
+                "pid": self.pid,
+                "size": self.size,
+                "idle": len(self._idle),
+                "in_use": len(self._in_use),
+                "min_size": self.min_size,
+                "max_size": self.max_size,
+                **self._stats,
+            }
+
+    def _open(self):
+        try:
+            raw = self._connect()
+        except Exception:
+            with self._lock:
+                self._opening -= 1
+                self._lock.notify()
+            raise
+        with self._lock:
+            self._opening -= 1
+            self._stats["connections_opened"] += 1
+        return PooledConnection(raw)
+
+    def _fill_to_min_size(self):
+        while True:
+            with self._lock:
+                if self._closed or self.size >= self.min_size:
+                    return
+                self._opening += 1
+            try:
+                pooled = self._open()
+            except Exception:
+                return
+            with self._lock:
+                self._idle.appendleft(pooled)
+                self._lock.notify()
+
+    def _is_healthy(self, pooled):
+        now = time.monotonic()
+        if now - pooled.created_at >= self.max_lifetime:
+            return False
+        idle_for = now - pooled.last_used_at
+        if idle_for >= self.max_idle:
+            return False
+        if self._check is None or idle_for < self.health_check_interval:
+            return True
+        try:
+            healthy = self._check(pooled.raw)
+        except Exception:
+            healthy = False
+        if not healthy:
+            with self._lock:
+                self._stats["health_check_failures"] += 1
+        return healthy
+
+    def _discard(self, pooled):
+        self._close_raw(pooled.raw)
+        with self._lock:
+            self._lock.notify()
+
+    def _close_raw(self, raw):
+        try:
+            self._close(raw)
+        except Exception:
+            pass
+        with self._lock:
+            self._stats["connections_closed"] += 1
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(key, factory):
+    """
+    Return the pool registered under `key` for the current process,
+    creating it with `factory()` on first use. Pools are never shared
+    across a fork.
+    """
+    pid = os.getpid()
+    pool = _pools.get(key)
+    if pool is not None and pool.pid == pid:
+        return pool
+    with _pools_lock:
+        pool = _pools.get(key)
+        if pool is None or pool.pid != pid:
+            pool = _pools[key] = factory()
+        return pool
+
+
+def close_pools(predicate=None):
+    """
+    Close and forget every pool whose key matches `predicate`.
+    """
+    with _pools_lock:
+        keys = [key for key in _pools if predicate is None or predicate(key)]
+        pools = [_pools.pop(key) for key in keys]
+    for pool in pools:
+        pool.close()
+
+
+def get_pool_stats():
+    """
+    Return the statistics of every pool owned by the current worker process,
+    keyed by database alias.
+    """
+    pid = os.getpid()
+    return {
+        key[0]: pool.stats() for key, pool in list(_pools.items()) if pool.pid == pid
+    }
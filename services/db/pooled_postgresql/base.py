@@ -0,0 +1,116 @@
+"""
+PostgreSQL backend that checks connections out of a per-process pool.
+
+Configure it through the "POOL" key of a database in settings.DATABASES.
+Django still opens and closes a connection per request (CONN_MAX_AGE=0);
+closing hands the connection back to the pool instead of tearing it down.
+"""
+
+import psycopg2
+import psycopg2.extensions
+from django.db.backends.base.base import NO_DB_ALIAS
+from django.db.backends.postgresql import base
+
+from services.db.connection_pool import (
+    ConnectionPool,
+    PoolTimeout,
+    close_pools,
+    get_pool,
+)
+from .creation import DatabaseCreation
+
+
+def _check_connection(raw):
+    """
+    Run a trivial query to make sure an idle connection is still alive.
+    """
+    if raw.closed:
+        return False
+    with raw.cursor() as cursor:
+        cursor.execute("SELECT 1")
+    if not raw.autocommit:
+        raw.rollback()
+    return True
+
+
+def _reset_connection(raw):
+    """
+    Roll back any open transaction before the connection is reused.
+    """
+    if raw.closed:
+        return False
+    status = raw.get_transaction_status()
+    if status == psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN:
+        return False
+    if status != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+        raw.rollback()
+    return True
+
+
+class DatabaseWrapper(base.DatabaseWrapper):
+    creation_class = DatabaseCreation
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._connection_pool = None
+
+    def _pool_key(self, conn_params):
+        return (
+            self.alias,
+            conn_params.get("host"),
+            conn_params.get("port"),
+            conn_params.get("dbname"),
+            conn_params.get("user"),
+        )
+
+    def _get_pool(self, conn_params):
+        options = self.settings_dict.get("POOL") or {}
+
+        def connect():
+            return base.DatabaseWrapper.get_new_connection(self, conn_params)
+
+        return get_pool(
+            self._pool_key(conn_params),
+            lambda: ConnectionPool(
+                connect,
+                check=_check_connection,
+                reset=_reset_connection,
+                min_size=options.get("MIN_SIZE", 0),
+                max_size=options.get("MAX_SIZE", 10),
+                timeout=options.get("TIMEOUT", 5.0),
+                max_idle=options.get("MAX_IDLE", 300.0),
+                max_lifetime=options.get("MAX_LIFETIME", 1800.0),
+                health_check_interval=options.get("HEALTH_CHECK_INTERVAL", 0.0),
+            ),
+        )
+
+    def get_new_connection(self, conn_params):
+        if self.alias == NO_DB_ALIAS:
+            return super().get_new_connection(conn_params)
+
+        pool = self._get_pool(conn_params)
+        try:
+            connection = pool.checkout()
+        except PoolTimeout as exc:
+            raise psycopg2.OperationalError(str(exc)) from exc
+        self._connection_pool = pool
+        # The parent sets this as a side effect of connecting; reused
+        # connections keep the isolation level they were opened with.
+        self.isolation_level = base.IsolationLevel(
+            self.settings_dict["OPTIONS"].get(
+                "isolation_level", base.IsolationLevel.READ_COMMITTED
+            )
+        )
+        return connection
+
+    def _close(self):
+        pool, self._connection_pool = self._connection_pool, None
+        if pool is None or self.connection is None:
+            return super()._close()
+        with self.wrap_database_errors:
+            # A connection closed inside an atomic block stays referenced by
+            # Django until the block exits, so it must not be handed out again.
+            pool.checkin(self.connection, reuse=not self.in_atomic_block)
+
+    def close_pool(self):
+        close_pools(lambda key: key[0] == self.alias)
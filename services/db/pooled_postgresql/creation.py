@@ -0,0 +1,15 @@
+from django.db.backends.postgresql.creation import (
+    DatabaseCreation as PostgresDatabaseCreation,
+)
+
+from services.db.connection_pool import close_pools
+
+
+class DatabaseCreation(PostgresDatabaseCreation):
+    """
+    Close pooled connections to the test database before dropping it.
+    """
+
+    def _destroy_test_db(self, test_database_name, verbosity):
+        close_pools(lambda key: key[3] == test_database_name)
+        super()._destroy_test_db(test_database_name, verbosity)
@@ -0,0 +1,145 @@
+import base64
+import json
+import random
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework_simplejwt.settings import api_settings as jwt_settings
+
+PIN_CACHE_KEY = "replica-pin:{}"
+# The app label of DatabaseCache's internal cache entry model.
+CACHE_APP_LABEL = "django_cache"
+
+
+class RoutingState:
+    """
+    Per-request routing flags shared by the middleware and the router.
+    """
+
+    __slots__ = ("primary_only", "wrote")
+
+    def __init__(self, primary_only=False):
+        self.primary_only = primary_only
+        self.wrote = False
+
+
+_routing_state = ContextVar("replica_routing_state", default=None)
+
+
+def _client_key(request):
+    """
+    Identify the client for read-your-writes stickiness.
+
+    The JWT payload is decoded without verifying it: the key only decides
+    whether reads go to the primary, it never grants access.
+    """
+    header = request.headers.get("Authorization", "")
+    parts = header.split()
+    if len(parts) == 2 and parts[0] in jwt_settings.AUTH_HEADER_TYPES:
+        try:
+            payload = parts[1].split(".")[1]
+            claims = json.loads(
+                base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4))
+            )
+            return f"user:{claims[jwt_settings.USER_ID_CLAIM]}"
+        except (IndexError, KeyError, TypeError, ValueError):
+            return None
+    session_key = request.COOKIES.get(settings.SESSION_COOKIE_NAME)
+    return f"session:{session_key}" if session_key else None
+
+
+class ReplicaRouter:
+    """
+    Sends writes to the primary and safe reads to a random replica.
+
+    Reads stay on the primary inside transactions, for the rest of a request
+    that has written, for unsafe HTTP methods and for REPLICA_STICKY_SECONDS
+    after the same client wrote, so a voter immediately sees their own vote.
+    """
+
+    def db_for_read(self, model, **hints):
+        replicas = settings.DATABASE_REPLICAS
+        if not replicas:
+            return None
+        if model._meta.app_label == CACHE_APP_LABEL:
+            # The database cache must not lag behind its invalidations.
+            return DEFAULT_DB_ALIAS
+        state = _routing_state.get()
+        if state is not None and (state.primary_only or state.wrote):
+            return DEFAULT_DB_ALIAS
+        if connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        return random.choice(replicas)
+
+    def db_for_write(self, model, **hints):
+        state = _routing_state.get()
+        # Filling the database cache on a read is not a write of the client.
+        if state is not None and model._meta.app_label != CACHE_APP_LABEL:
+            state.wrote = True
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        databases = {DEFAULT_DB_ALIAS, *settings.DATABASE_REPLICAS}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db not in settings.DATABASE_REPLICAS
+
+
+class ReplicaRoutingMiddleware:
+    """
+    Tracks writes per request and pins the client to the primary for a
+    short window after it wrote.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not settings.DATABASE_REPLICAS:
+            return self.get_response(request)
+
+        key = _client_key(request)
+        pinned = bool(key) and cache.get(PIN_CACHE_KEY.format(key)) is not None
+        state = RoutingState(primary_only=pinned or request.method not in SAFE_METHODS)
+        token = _routing_state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _routing_state.reset(token)
+
+        if state.wrote and key:
+            cache.set(PIN_CACHE_KEY.format(key), 1, settings.REPLICA_STICKY_SECONDS)
+        return response
+
+    async def __acall__(self, request):
+        if not settings.DATABASE_REPLICAS:
+            return await self.get_response(request)
+
+        key = _client_key(request)
+        pinned = bool(key) and await cache.aget(PIN_CACHE_KEY.format(key)) is not None
+        state = RoutingState(primary_only=pinned or request.method not in SAFE_METHODS)
+        token = _routing_state.set(state)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _routing_state.reset(token)
+
+        if state.wrote and key:
+            await cache.aset(
+                PIN_CACHE_KEY.format(key), 1, settings.REPLICA_STICKY_SECONDS
+            )
+        return response
@@ -0,0 +1,113 @@
+import threading
+
+import pytest
+
+from services.db.connection_pool import ConnectionPool, PoolTimeout
+
+
+class FakeConnection:
+    """A stand-in for a raw DB-API connection."""
+
+    def __init__(self):
+        self.closed = False
+        self.healthy = True
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def make_pool():
+    """
+    Fixture to build a pool of fake connections.
+    """
+
+    def _make_pool(**kwargs):
+        opened = []
+
+        def connect():
+            connection = FakeConnection()
+            opened.append(connection)
+            return connection
+
+        kwargs.setdefault("check", lambda raw: raw.healthy)
+        return ConnectionPool(connect, **kwargs), opened
+
+    return _make_pool
+
+
+def test_checkout_reuses_returned_connection(make_pool):
+    """Test that a checked-in connection is handed out again."""
+    pool, opened = make_pool(max_size=2)
+
+    first = pool.checkout()
+    pool.checkin(first)
+    second = pool.checkout()
+
+    assert first is second
+    assert len(opened) == 1
+    assert pool.stats()["checkouts"] == 2
+
+
+def test_pool_fills_to_min_size(make_pool):
+    """Test that the first checkout opens min_size connections."""
+    pool, opened = make_pool(min_size=3, max_size=5)
+
+    pool.checkout()
+
+    stats = pool.stats()
+    assert len(opened) == 3
+    assert stats["in_use"] == 1
+    assert stats["idle"] == 2
+
+
+def test_unhealthy_connection_is_replaced(make_pool):
+    """Test that a connection failing the health check is discarded."""
+    pool, opened = make_pool(max_size=1)
+
+    first = pool.checkout()
+    pool.checkin(first)
+    first.healthy = False
+    second = pool.checkout()
+
+    assert second is not first
+    assert first.closed
+    assert pool.stats()["health_check_failures"] == 1
+
+
+def test_checkout_times_out_when_exhausted(make_pool):
+    """Test that checkout fails once max_size connections are in use."""
+    pool, _ = make_pool(max_size=1, timeout=0.05)
+    pool.checkout()
+
+    with pytest.raises(PoolTimeout):
+        pool.checkout()
+
+    assert pool.stats()["timeouts"] == 1
+
+
+def test_waiting_checkout_gets_released_connection(make_pool):
+    """Test that a blocked checkout is woken up by a checkin."""
+    pool, opened = make_pool(max_size=1, timeout=2)
+    held = pool.checkout()
+    result = {}
+
+    waiter = threading.Thread(target=lambda: result.update(raw=pool.checkout()))
+    waiter.start()
+    pool.checkin(held)
+    waiter.join(timeout=2)
+
+    assert result["raw"] is held
+    assert len(opened) == 1
+    assert pool.stats()["waits"] == 1
+
+
+def test_connection_not_reused_when_reset_fails(make_pool):
+    """Test that a connection whose reset fails is closed on checkin."""
+    pool, _ = make_pool(max_size=1, reset=lambda raw: False)
+
+    raw = pool.checkout()
+    pool.checkin(raw)
+
+    assert raw.closed
+    assert pool.stats()["idle"] == 0
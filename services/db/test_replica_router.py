@@ -0,0 +1,178 @@
+import sqlite3
+
+import pytest
+from django.core.cache import cache
+from django.core.cache.backends.db import DatabaseCache
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+from django.db.backends.sqlite3.base import DatabaseWrapper
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from rest_framework_simplejwt.tokens import AccessToken
+from restaurants.models import Restaurant
+from services.db.replica_router import ReplicaRouter, ReplicaRoutingMiddleware
+
+REPLICAS = ["replica_0", "replica_1"]
+DATABASE_CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "django_cache",
+    }
+}
+
+
+@pytest.fixture
+def router():
+    return ReplicaRouter()
+
+
+@pytest.fixture
+def sqlite_replica(tmp_path):
+    """
+    Registers replica_0 as a SQLite copy of the primary taken now, which
+    then lags behind it like a real replica.
+    """
+    primary = connections[DEFAULT_DB_ALIAS]
+    if primary.vendor != "sqlite":
+        pytest.skip("SQLite replicas copy a SQLite primary.")
+    path = tmp_path / "replica.sqlite3"
+    primary.ensure_connection()
+    target = sqlite3.connect(path)
+    primary.connection.backup(target)
+    target.close()
+    config = connections.configure_settings(
+        {
+            DEFAULT_DB_ALIAS: connections.settings[DEFAULT_DB_ALIAS],
+            "replica_0": {"ENGINE": "django.db.backends.sqlite3", "NAME": str(path)},
+        }
+    )["replica_0"]
+    connections["replica_0"] = DatabaseWrapper(config, "replica_0")
+    yield "replica_0"
+    connections["replica_0"].close()
+    del connections["replica_0"]
+
+
+@pytest.fixture
+def user(django_user_model):
+    return django_user_model.objects.create_user(
+        email="replica@example.com", password="testpass123"
+    )
+
+
+def run_request(method, user=None, work=None):
+    """
+    Passes a request through the middleware and returns the read aliases
+    chosen while handling it.
+    """
+    router = ReplicaRouter()
+    reads = []
+
+    def get_response(request):
+        if work == "write":
+            router.db_for_write(Restaurant)
+        reads.append(router.db_for_read(Restaurant))
+        return HttpResponse()
+
+    headers = {}
+    if user is not None:
+        headers["HTTP_AUTHORIZATION"] = f"Bearer {AccessToken.for_user(user)}"
+    request = getattr(RequestFactory(), method)("/api/restaurants/", **headers)
+    ReplicaRoutingMiddleware(get_response)(request)
+    return reads
+
+
+@override_settings(DATABASE_REPLICAS=[])
+def test_no_replicas_uses_default(router):
+    """Test that routing is a no-op when no replicas are configured."""
+    assert router.db_for_read(Restaurant) is None
+    assert router.db_for_write(Restaurant) == "default"
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(DATABASE_REPLICAS=REPLICAS)
+def test_reads_go_to_replicas_outside_transactions(router):
+    """Test that reads use replicas unless a transaction is open."""
+    assert router.db_for_read(Restaurant) in REPLICAS
+    assert router.db_for_write(Restaurant) == "default"
+    assert router.allow_migrate("replica_0", "restaurants") is False
+    cache_entry = DatabaseCache("django_cache", {}).cache_model_class
+    assert router.db_for_read(cache_entry) == "default"
+    assert router.allow_migrate("default", "restaurants") is True
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(DATABASE_REPLICAS=REPLICAS)
+def test_reads_inside_atomic_use_primary(router):
+    """Test that reads inside a transaction stay on the primary."""
+    with transaction.atomic():
+        assert router.db_for_read(Restaurant) == "default"
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(DATABASE_REPLICAS=REPLICAS, REPLICA_STICKY_SECONDS=5)
+def test_client_sees_own_writes(user):
+    """Test that a client is pinned to the primary after it writes."""
+    cache.clear()
+    assert run_request("get", user)[0] in REPLICAS
+    assert run_request("post", user, work="write") == ["default"]
+    assert run_request("get", user) == ["default"]
+    assert run_request("get")[0] in REPLICAS
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(
+    DATABASE_REPLICAS=REPLICAS, REPLICA_STICKY_SECONDS=5, CACHES=DATABASE_CACHES
+)
+def test_cache_fills_do_not_pin_readers(user):
+    """Test that a GET filling the database cache is not taken for a write."""
+    cache.clear()
+
+    def get_response(request):
+        if cache.get("membership:1") is None:
+            cache.set("membership:1", (user.id, []))
+        return HttpResponse()
+
+    request = RequestFactory().get(
+        "/api/restaurants/",
+        HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}",
+    )
+    ReplicaRoutingMiddleware(get_response)(request)
+
+    assert cache.get("membership:1") is not None
+    assert run_request("get", user)[0] in REPLICAS
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(DATABASE_REPLICAS=REPLICAS, REPLICA_STICKY_SECONDS=5)
+def test_unsafe_methods_read_primary(user):
+    """Test that reads during unsafe requests never go to a replica."""
+    cache.clear()
+    assert run_request("post", user) == ["default"]
+    assert run_request("get", user)[0] in REPLICAS
+
+
+@pytest.mark.django_db(transaction=True)
+@override_settings(DATABASE_REPLICAS=["replica_0"], REPLICA_STICKY_SECONDS=5)
+def test_reads_go_through_a_sqlite_replica(user, sqlite_replica):
+    """Test that reads hit a real replica and writers are pinned to the primary."""
+    cache.clear()
+    Restaurant.objects.create(name="Written after the copy", owner=user)
+    restaurant = Restaurant.objects.filter(name="Written after the copy")
+
+    def names_read(method, work=None):
+        found = []
+
+        def get_response(request):
+            if work == "write":
+                ReplicaRouter().db_for_write(Restaurant)
+            found.append(restaurant.exists())
+            return HttpResponse()
+
+        headers = {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(user)}"}
+        request = getattr(RequestFactory(), method)("/api/restaurants/", **headers)
+        ReplicaRoutingMiddleware(get_response)(request)
+        return found[0]
+
+    assert Restaurant.objects.using(sqlite_replica).filter(owner=user).count() == 0
+    assert names_read("get") is False
+    assert names_read("post", work="write") is True
+    assert names_read("get") is True
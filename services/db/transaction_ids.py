@@ -0,0 +1,31 @@
+from django.db.models import BigIntegerField, Func
+
+
+class CurrentTransactionId(Func):
+    """
+    The id of the transaction running the statement. On other databases
+    than PostgreSQL it is 0: their writers commit one at a time, in the
+    order their ids were handed out.
+    """
+
+    template = "0"
+    arity = 0
+    output_field = BigIntegerField()
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        return "(pg_current_xact_id()::text::bigint)", []
+
+
+class OldestRunningTransactionId(Func):
+    """
+    The lowest transaction id still running when the statement starts.
+    Every transaction with a lower id has committed or rolled back, so rows
+    stamped with one can no longer appear. Unbounded on other databases.
+    """
+
+    template = "9223372036854775807"
+    arity = 0
+    output_field = BigIntegerField()
+
+    def as_postgresql(self, compiler, connection, **extra_context):
+        return "(pg_snapshot_xmin(pg_current_snapshot())::text::bigint)", []
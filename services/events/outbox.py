@@ -0,0 +1,96 @@
+import asyncio
+
+from core.models import OutboxEvent
+from django.conf import settings
+from django.db.models import Q
+from rest_framework.fields import DateTimeField
+from services.db.transaction_ids import OldestRunningTransactionId
+
+START = (0, 0)
+# Renders timestamps the way every serializer of the API does.
+_timestamp = DateTimeField()
+
+
+def _event(instance, action):
+    return OutboxEvent(
+        topic=instance.outbox_topic,
+        action=action,
+        object_id=instance.pk,
+        payload=instance.outbox_payload(),
+    )
+
+
+def publish(instance, action):
+    """
+    Append a change of `instance` to the outbox. Call it inside the
+    transaction that makes the change, so both commit or neither does.
+    """
+    return _event(instance, action).save()
+
+
+def publish_many(instances, action):
+    """
+    Append the same change of several instances with a single insert.
+    """
+    return OutboxEvent.objects.bulk_create(
+        [_event(instance, action) for instance in instances]
+    )
+
+
+def _feed_query(after, limit):
+    # Ids and transaction ids are handed out before commit, so events can
+    # become visible out of order. Events of transactions still running
+    # are invisible, and new ones may still get a (txid, id) below theirs,
+    # so only events of transactions older than the oldest running one are
+    # served, in (txid, id) order.
+    txid, event_id = after
+    return OutboxEvent.objects.filter(
+        Q(txid__gt=txid) | Q(txid=txid, id__gt=event_id),
+        txid__lt=OldestRunningTransactionId(),
+    ).order_by("txid", "id")[:limit]
+
+
+def cursor(txid, event_id):
+    """
+    The feed position after the event (txid, event_id), as passed in `after`.
+    """
+    return f"{txid}-{event_id}"
+
+
+def parse_cursor(value):
+    """
+    Return the (txid, id) position of a cursor, or None if it is invalid.
+    "0" is the start of the feed.
+    """
+    if value == "0":
+        return START
+    txid, _, event_id = value.partition("-")
+    if not (txid.isdigit() and event_id.isdigit()):
+        return None
+    return int(txid), int(event_id)
+
+
+def serialize(event):
+    return {
+        "id": event.id,
+        "topic": event.topic,
+        "action": event.action,
+        "object_id": event.object_id,
+        "payload": event.payload,
+        "created_at": _timestamp.to_representation(event.created_at),
+    }
+
+
+async def wait_for_events(after=START, limit=100, wait=0.0):
+    """
+    Return up to `limit` events after the `after` position, polling for up
+    to `wait` seconds while there are none.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait
+    while True:
+        events = [event async for event in _feed_query(after, limit)]
+        remaining = deadline - loop.time()
+        if events or remaining <= 0:
+            return events
+        await asyncio.sleep(min(settings.EVENT_FEED_POLL_INTERVAL, remaining))
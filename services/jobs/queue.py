@@ -0,0 +1,205 @@
+import traceback
+from datetime import timedelta
+
+from core.models import Job
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import Q
+from django.utils.timezone import now
+
+_tasks = {}
+
+
+class Task:
+    """
+    A function that can run now or be enqueued for a worker.
+    """
+
+    def __init__(self, func, name, queue, max_attempts):
+        self.func = func
+        self.name = name
+        self.queue = queue
+        self.max_attempts = max_attempts
+
+    def __call__(self, **kwargs):
+        return self.func(**kwargs)
+
+    def enqueue(self, run_at=None, delay=None, queue=None, **kwargs):
+        """
+        Store a job for this task. It joins the caller's transaction, so
+        it only becomes visible to workers if that transaction commits.
+        """
+        if delay is not None:
+            run_at = now() + timedelta(seconds=delay)
+        return Job.objects.create(
+            task=self.name,
+            queue=queue or self.queue,
+            kwargs=kwargs,
+            max_attempts=self.max_attempts,
+            run_at=run_at or now(),
+        )
+
+
+def task(queue="default", max_attempts=3, name=None):
+    """
+    Register a function as a background task. Keyword arguments passed to
+    `enqueue` must be JSON serializable.
+    """
+
+    def register(func):
+        task_name = name or f"{func.__module__}.{func.__name__}"
+        _tasks[task_name] = Task(func, task_name, queue, max_attempts)
+        return _tasks[task_name]
+
+    return register
+
+
+def get_task(name):
+    return _tasks[name]
+
+
+def queue_limit(queue):
+    """
+    Maximum number of jobs of `queue` running at once across all workers,
+    or None when unlimited.
+    """
+    return settings.JOB_QUEUE_CONCURRENCY.get(queue)
+
+
+def claim(queues, worker_id):
+    """
+    Mark the next due job of the first queue that has one, and room under
+    its concurrency limit, as running and return it.
+
+    Competing workers skip rows another worker has locked instead of
+    waiting on them. On PostgreSQL an advisory lock per limited queue makes
+    counting running jobs and claiming one atomic across workers.
+    """
+    for queue in queues:
+        with transaction.atomic():
+            limit = queue_limit(queue)
+            if limit is not None:
+                if connection.vendor == "postgresql":
+                    with connection.cursor() as cursor:
+                        cursor.execute(
+                            "SELECT pg_advisory_xact_lock(hashtext(%s))",
+                            [f"jobs:{queue}"],
+                        )
+                running = Job.objects.filter(queue=queue, status=Job.RUNNING).count()
+                if running >= limit:
+                    continue
+
+            job = (
+                Job.objects.select_for_update(skip_locked=True)
+                .filter(queue=queue, status=Job.QUEUED, run_at__lte=now())
+                .order_by("run_at", "id")
+                .first()
+            )
+            if job is None:
+                continue
+            job.status = Job.RUNNING
+            job.attempts += 1
+            job.locked_at = now()
+            job.locked_by = worker_id
+            job.save(update_fields=["status", "attempts", "locked_at", "locked_by"])
+            return job
+    return None
+
+
+def retry_delay(attempts):
+    """
+    Exponential backoff before the next attempt, in seconds.
+    """
+    return settings.JOB_RETRY_BACKOFF * 2 ** (attempts - 1)
+
+
+def finish(job, error=None):
+    """
+    Record the outcome of a claimed job, scheduling a retry on failure
+    while attempts remain.
+    """
+    job.locked_at = None
+    job.locked_by = ""
+    if error is None:
+        job.status = Job.SUCCEEDED
+        job.last_error = ""
+        job.finished_at = now()
+    elif job.attempts < job.max_attempts:
+        job.status = Job.QUEUED
+        job.last_error = error
+        job.run_at = now() + timedelta(seconds=retry_delay(job.attempts))
+    else:
+        job.status = Job.FAILED
+        job.last_error = error
+        job.finished_at = now()
+    job.save(
+        update_fields=[
+            "status",
+            "last_error",
+            "run_at",
+            "finished_at",
+            "locked_at",
+            "locked_by",
+        ]
+    )
+
+
+def run(job):
+    """
+    Run a claimed job and record its outcome. Returns the final status.
+    """
+    try:
+        get_task(job.task)(**job.kwargs)
+    except Exception:
+        finish(job, traceback.format_exc())
+    else:
+        finish(job)
+    return job.status
+
+
+def requeue_stale(timeout=None):
+    """
+    Give jobs whose worker died while running them back to the queue (or
+    fail them when out of attempts). Returns the number of jobs touched.
+    """
+    timeout = settings.JOB_LOCK_TIMEOUT if timeout is None else timeout
+    stale = Job.objects.filter(
+        status=Job.RUNNING, locked_at__lt=now() - timedelta(seconds=timeout)
+    )
+    touched = 0
+    with transaction.atomic():
+        for job in stale.select_for_update(skip_locked=True):
+            finish(job, f"Worker {job.locked_by} did not finish within {timeout}s.")
+            touched += 1
+    return touched
+
+
+def schedule_periodic(queues):
+    """
+    Enqueue each task of `settings.JOB_SCHEDULE` that runs on one of
+    `queues` unless it is already waiting or running, or was enqueued less
+    than its interval ago. Returns the names of the tasks enqueued.
+
+    On PostgreSQL an advisory lock keeps workers that check at the same
+    time from enqueueing a task twice.
+    """
+    enqueued = []
+    for name, interval in settings.JOB_SCHEDULE.items():
+        periodic = get_task(name)
+        if periodic.queue not in queues:
+            continue
+        with transaction.atomic():
+            if connection.vendor == "postgresql":
+                with connection.cursor() as cursor:
+                    cursor.execute(
+                        "SELECT pg_advisory_xact_lock(hashtext(%s))",
+                        [f"jobs:schedule:{name}"],
+                    )
+            pending = Job.objects.filter(task=name).filter(
+                Q(status__in=[Job.QUEUED, Job.RUNNING])
+                | Q(created_at__gt=now() - timedelta(seconds=interval))
+            )
+            if not pending.exists():
+                periodic.enqueue()
+                enqueued.append(name)
+    return enqueued
@@ -0,0 +1,93 @@
+import logging
+import os
+import socket
+import threading
+import time
+
+from django.db import close_old_connections, connection
+from services.jobs.queue import claim, requeue_stale, run, schedule_periodic
+from services.monitoring.metrics import record_job, registry
+
+logger = logging.getLogger("lunch_voting_api.jobs")
+
+
+class Worker:
+    """
+    Runs jobs from `queues`, in priority order, on `concurrency` threads.
+
+    In burst mode each thread exits once no job is due; otherwise threads
+    poll every `poll_interval` seconds until `stop()` is called. Every
+    `reap_interval` seconds the first thread requeues stale jobs and
+    enqueues the due `JOB_SCHEDULE` tasks of its queues.
+    """
+
+    def __init__(
+        self, queues, concurrency=1, poll_interval=1.0, burst=False, reap_interval=60
+    ):
+        self.queues = list(queues)
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.burst = burst
+        self.reap_interval = reap_interval
+        self.processed = 0
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        self._name = f"{socket.gethostname()}:{os.getpid()}"
+
+    def stop(self):
+        self._stop.set()
+
+    def run(self):
+        threads = [
+            threading.Thread(target=self._loop, args=(index,), daemon=True)
+            for index in range(self.concurrency)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        registry.flush(force=True)
+        return self.processed
+
+    def _loop(self, index):
+        worker_id = f"{self._name}:{index}"
+        next_reap = 0.0
+        try:
+            while not self._stop.is_set():
+                close_old_connections()
+                if index == 0 and time.monotonic() >= next_reap:
+                    if requeue_stale():
+                        logger.warning("Requeued stale jobs.")
+                    for name in schedule_periodic(self.queues):
+                        logger.info("Scheduled periodic job %s.", name)
+                    next_reap = time.monotonic() + self.reap_interval
+
+                job = claim(self.queues, worker_id)
+                if job is None:
+                    if self.burst:
+                        return
+                    self._stop.wait(self.poll_interval)
+                    continue
+                self._run(job)
+        finally:
+            connection.close()
+
+    def _run(self, job):
+        started = time.perf_counter()
+        status = run(job)
+        elapsed = time.perf_counter() - started
+        record_job(job.queue, job.task, status, elapsed)
+        registry.flush()
+        with self._lock:
+            self.processed += 1
+        log = logger.info if status != job.FAILED else logger.error
+        log(
+            "Job %s %s on %s: %s after %.3fs (attempt %s/%s)",
+            job.id,
+            job.task,
+            job.queue,
+            status,
+            elapsed,
+            job.attempts,
+            job.max_attempts,
+        )
@@ -0,0 +1,427 @@
+import fcntl
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+# Files in METRICS_DIR next to the per-process snapshots.
+LOCK_FILE = "metrics.lock"
+RETIRED_FILE = "retired.json"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+METRICS = {
+    "lunch_http_request_duration_seconds": (
+        "histogram",
+        "Request latency by URL name.",
+    ),
+    "lunch_http_responses_total": ("counter", "Responses by URL name and status."),
+    "lunch_votes_accepted_total": ("counter", "Votes accepted."),
+    "lunch_votes_accepted_last_minute": (
+        "gauge",
+        "Votes accepted during the last complete minute.",
+    ),
+    "lunch_cache_requests_total": ("counter", "Cache lookups by cache and result."),
+    "lunch_cache_hit_ratio": ("gauge", "Cache hit ratio since process start."),
+    "lunch_db_pool_connections": (
+        "gauge",
+        "Pooled DB connections by alias and state.",
+    ),
+    "lunch_db_pool_checkouts_total": ("counter", "Pooled DB connection checkouts."),
+    "lunch_db_pool_timeouts_total": ("counter", "Pooled DB checkout timeouts."),
+    "lunch_job_duration_seconds": (
+        "histogram",
+        "Background job run time by queue, task and outcome.",
+    ),
+}
+
+
+class _Shard:
+    """
+    Metric values written by a single thread.
+    """
+
+    __slots__ = ("counters", "histograms", "minutes")
+
+    def __init__(self):
+        self.counters = {}
+        self.histograms = {}
+        self.minutes = {}
+
+
+class MetricsRegistry:
+    """
+    Per-process metric storage.
+
+    Every thread writes only to its own shard, so recording a value never
+    takes a lock; shards are merged when a snapshot is taken. Snapshots of
+    all worker processes are exchanged through files in METRICS_DIR.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards = []
+        self._shards_lock = threading.Lock()
+        self._gauge_callbacks = []
+        self._counter_callbacks = []
+        self._flush_lock = threading.Lock()
+        self._last_flush = 0.0
+
+    def _shard(self):
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = _Shard()
+            with self._shards_lock:
+                self._shards.append(shard)
+        return shard
+
+    def inc(self, name, labels=(), value=1):
+        counters = self._shard().counters
+        key = (name, labels)
+        counters[key] = counters.get(key, 0) + value
+
+    def observe(self, name, value, labels=(), buckets=LATENCY_BUCKETS):
+        histograms = self._shard().histograms
+        key = (name, labels)
+        values = histograms.get(key)
+        if values is None:
+            # One slot per bucket, one for +Inf, then sum and count.
+            values = histograms[key] = [0] * (len(buckets) + 1) + [0.0, 0]
+        values[bisect_left(buckets, value)] += 1
+        values[-2] += value
+        values[-1] += 1
+
+    def inc_per_minute(self, name, value=1):
+        minutes = self._shard().minutes
+        minute = int(time.time() // 60)
+        key = (name, minute)
+        minutes[key] = minutes.get(key, 0) + value
+        if len(minutes) > 8:
+            for stale in [k for k in minutes if k[1] < minute - 1]:
+                del minutes[stale]
+
+    def register_gauge(self, callback):
+        """
+        Register a callable returning (name, labels, value) tuples.
+        """
+        self._gauge_callbacks.append(callback)
+
+    def register_counter(self, callback):
+        """
+        Register a callable returning (name, labels, value) tuples of
+        totals this process keeps itself.
+        """
+        self._counter_callbacks.append(callback)
+
+    def snapshot(self):
+        """
+        Merge all thread shards into a JSON-serializable snapshot.
+        """
+        counters, histograms, minutes = {}, {}, {}
+        with self._shards_lock:
+            shards = list(self._shards)
+        for shard in shards:
+            for key, value in shard.counters.copy().items():
+                counters[key] = counters.get(key, 0) + value
+            for key, values in shard.histograms.copy().items():
+                merged = histograms.setdefault(key, [0] * len(values))
+                for i, value in enumerate(list(values)):
+                    merged[i] += value
+            for key, value in shard.minutes.copy().items():
+                minutes[key] = minutes.get(key, 0) + value
+        for callback in self._counter_callbacks:
+            for name, labels, value in callback():
+                counters[(name, labels)] = counters.get((name, labels), 0) + value
+
+        gauges = []
+        for callback in self._gauge_callbacks:
+            gauges.extend(callback())
+
+        def rows(items):
+            return [[name, list(map(list, labels)), v] for (name, labels), v in items]
+
+        return {
+            "pid": os.getpid(),
+            "counters": rows(counters.items()),
+            "histograms": rows(histograms.items()),
+            "minutes": [[name, m, v] for (name, m), v in minutes.items()],
+            "gauges": rows(((name, labels), v) for name, labels, v in gauges),
+        }
+
+    def flush(self, force=False):
+        """
+        Write this process' snapshot to METRICS_DIR, at most once per
+        METRICS_FLUSH_INTERVAL seconds unless `force` is set.
+        """
+        directory = settings.METRICS_DIR
+        if not directory:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_flush < settings.METRICS_FLUSH_INTERVAL:
+            return
+        if not self._flush_lock.acquire(blocking=force):
+            return
+        try:
+            self._last_flush = now
+            path = Path(directory)
+            path.mkdir(parents=True, exist_ok=True)
+            target = path / f"metrics_{os.getpid()}.json"
+            tmp = target.with_suffix(".tmp")
+            tmp.write_text(json.dumps(self.snapshot()))
+            os.replace(tmp, target)
+        finally:
+            self._flush_lock.release()
+
+    def collect(self):
+        """
+        Return the snapshots of every live worker process, including this
+        one, plus the retired totals of workers that exited.
+
+        Snapshots of exited workers are folded into RETIRED_FILE and deleted,
+        under a lock so concurrent scrapes cannot fold them twice.
+        """
+        directory = settings.METRICS_DIR
+        if not directory:
+            return [self.snapshot()]
+
+        self.flush(force=True)
+        path = Path(directory)
+        snapshots, dead = [], []
+        with open(path / LOCK_FILE, "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            for file in path.glob("metrics_*.json"):
+                try:
+                    snapshot = json.loads(file.read_text())
+                except (OSError, ValueError):
+                    continue
+                if _pid_alive(snapshot["pid"]):
+                    snapshots.append(snapshot)
+                else:
+                    dead.append((file, snapshot))
+
+            retired_path = path / RETIRED_FILE
+            try:
+                retired = json.loads(retired_path.read_text())
+            except (OSError, ValueError):
+                retired = _merge_snapshots([])
+            if dead:
+                retired = _merge_snapshots([retired, *(snap for _, snap in dead)])
+                tmp = retired_path.with_suffix(".tmp")
+                tmp.write_text(json.dumps(retired))
+                os.replace(tmp, retired_path)
+                for file, _ in dead:
+                    file.unlink(missing_ok=True)
+        snapshots.append(retired)
+        return snapshots
+
+
+def _merge_snapshots(snapshots):
+    """
+    Sum the counters, histograms and recent minutes of `snapshots` into one
+    snapshot without gauges, which only describe live processes.
+    """
+    counters, histograms, minutes = {}, {}, {}
+    recent = int(time.time() // 60) - 1
+    for snapshot in snapshots:
+        for name, labels, value in snapshot["counters"]:
+            key = (name, tuple(map(tuple, labels)))
+            counters[key] = counters.get(key, 0) + value
+        for name, labels, values in snapshot["histograms"]:
+            key = (name, tuple(map(tuple, labels)))
+            merged = histograms.setdefault(key, [0] * len(values))
+            for i, value in enumerate(values):
+                merged[i] += value
+        for name, minute, value in snapshot["minutes"]:
+            if minute >= recent:
+                minutes[(name, minute)] = minutes.get((name, minute), 0) + value
+
+    def rows(items):
+        return [[name, list(map(list, labels)), v] for (name, labels), v in items]
+
+    return {
+        "pid": None,
+        "counters": rows(counters.items()),
+        "histograms": rows(histograms.items()),
+        "minutes": [[name, m, v] for (name, m), v in minutes.items()],
+        "gauges": [],
+    }
+
+
+registry = MetricsRegistry()
+
+
+def _pid_alive(pid):
+    if pid == os.getpid():
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _format_labels(labels, extra=()):
+    pairs = [*labels, *extra]
+    if not pairs:
+        return ""
+    body = ",".join(
+        '{}="{}"'.format(k, str(v).replace("\\", "\\\\").replace('"', '\\"'))
+        for k, v in pairs
+    )
+    return "{" + body + "}"
+
+
+def render_metrics():
+    """
+    Aggregate all worker snapshots into the Prometheus text format.
+    """
+    snapshots = registry.collect()
+    current_minute = int(time.time() // 60)
+
+    counters, histograms, gauges = {}, {}, {}
+    for snapshot in snapshots:
+        for name, labels, value in snapshot["counters"]:
+            key = (name, tuple(map(tuple, labels)))
+            counters[key] = counters.get(key, 0) + value
+        for name, labels, values in snapshot["histograms"]:
+            key = (name, tuple(map(tuple, labels)))
+            merged = histograms.setdefault(key, [0] * len(values))
+            for i, value in enumerate(values):
+                merged[i] += value
+        for name, minute, value in snapshot["minutes"]:
+            if minute == current_minute - 1:
+                key = (f"{name}_last_minute", ())
+                gauges[key] = gauges.get(key, 0) + value
+        for name, labels, value in snapshot["gauges"]:
+            key = (name, tuple(map(tuple, labels)))
+            gauges[key] = gauges.get(key, 0) + value
+
+    gauges.setdefault(("lunch_votes_accepted_last_minute", ()), 0)
+    cache_totals = {}
+    for (name, labels), value in counters.items():
+        if name == "lunch_cache_requests_total":
+            label_map = dict(labels)
+            hits, total = cache_totals.get(label_map["cache"], (0, 0))
+            hit = value if label_map["result"] == "hit" else 0
+            cache_totals[label_map["cache"]] = (hits + hit, total + value)
+    for cache, (hits, total) in cache_totals.items():
+        gauges[("lunch_cache_hit_ratio", (("cache", cache),))] = (
+            hits / total if total else 0.0
+        )
+
+    lines = []
+    by_name = {}
+    for (name, labels), value in counters.items():
+        by_name.setdefault(name, []).append((labels, value))
+    for (name, labels), value in gauges.items():
+        by_name.setdefault(name, []).append((labels, value))
+    for (name, labels), value in histograms.items():
+        by_name.setdefault(name, []).append((labels, value))
+
+    for name in sorted(by_name):
+        kind, help_text = METRICS.get(name, ("untyped", name))
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        for labels, value in sorted(by_name[name]):
+            if kind != "histogram":
+                lines.append(f"{name}{_format_labels(labels)} {value}")
+                continue
+            cumulative = 0
+            for bound, count in zip((*LATENCY_BUCKETS, "+Inf"), value[:-2]):
+                cumulative += count
+                le = (("le", bound),)
+                lines.append(f"{name}_bucket{_format_labels(labels, le)} {cumulative}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {value[-2]}")
+            lines.append(f"{name}_count{_format_labels(labels)} {value[-1]}")
+    return "\n".join(lines) + "\n"
+
+
+def record_cache_lookup(cache, hit):
+    """
+    Count a cache hit or miss for the hit ratio metrics.
+    """
+    result = "hit" if hit else "miss"
+    registry.inc("lunch_cache_requests_total", (("cache", cache), ("result", result)))
+
+
+def record_vote_accepted():
+    registry.inc("lunch_votes_accepted_total")
+    registry.inc_per_minute("lunch_votes_accepted")
+
+
+def record_job(queue, task, status, elapsed):
+    registry.observe(
+        "lunch_job_duration_seconds",
+        elapsed,
+        (("queue", queue), ("task", task), ("status", status)),
+    )
+
+
+def _pool_gauges():
+    from services.db.connection_pool import get_pool_stats
+
+    for alias, stats in get_pool_stats().items():
+        labels = (("alias", alias),)
+        yield "lunch_db_pool_connections", labels + (("state", "idle"),), stats["idle"]
+        yield "lunch_db_pool_connections", labels + (("state", "in_use"),), stats[
+            "in_use"
+        ]
+
+
+def _pool_counters():
+    from services.db.connection_pool import get_pool_stats
+
+    for alias, stats in get_pool_stats().items():
+        labels = (("alias", alias),)
+        yield "lunch_db_pool_checkouts_total", labels, stats["checkouts"]
+        yield "lunch_db_pool_timeouts_total", labels, stats["timeouts"]
+
+
+registry.register_gauge(_pool_gauges)
+registry.register_counter(_pool_counters)
+
+
+class MetricsMiddleware:
+    """
+    Records request latency and response status per URL name.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        started = time.perf_counter()
+        response = self.get_response(request)
+        return self.record(request, response, time.perf_counter() - started)
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        response = await self.get_response(request)
+        return self.record(request, response, time.perf_counter() - started)
+
+    def record(self, request, response, elapsed):
+        match = request.resolver_match
+        url_name = (match.url_name if match else None) or "unmatched"
+        registry.observe(
+            "lunch_http_request_duration_seconds", elapsed, (("url_name", url_name),)
+        )
+        registry.inc(
+            "lunch_http_responses_total",
+            (("url_name", url_name), ("status", str(response.status_code))),
+        )
+        registry.flush()
+        return response
@@ -0,0 +1,114 @@
+import cProfile
+import io
+import pstats
+from datetime import datetime
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from django.conf import settings
+from django.utils.timezone import now
+from rest_framework.exceptions import APIException
+from rest_framework.fields import BooleanField
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+PROFILE_HEADER = "X-Profile"
+SUMMARY_HEADER = "X-Profile-Summary"
+
+
+def _is_staff(request):
+    """
+    Resolve the user from the session or the JWT and check the staff flag.
+    """
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated:
+        return user.is_staff
+    try:
+        result = JWTAuthentication().authenticate(request)
+    except APIException:
+        return False
+    return bool(result and result[0].is_staff)
+
+
+def summarize_profile(profiler, top_n):
+    """
+    Return a one-line summary of the `top_n` functions by cumulative time.
+    """
+    stats = pstats.Stats(profiler, stream=io.StringIO())
+    stats.sort_stats(pstats.SortKey.CUMULATIVE)
+    entries = []
+    for func in stats.fcn_list[:top_n]:
+        _, calls, _, cumtime, _ = stats.stats[func]
+        filename, line, name = func
+        entries.append(
+            f"{Path(filename).name}:{line}({name});"
+            f"calls={calls};cum_ms={cumtime * 1000:.2f}"
+        )
+    return ", ".join(entries)
+
+
+class ProfilingMiddleware:
+    """
+    Runs a request under cProfile when a staff user asks for it with a true
+    `X-Profile` header or `profile` query parameter ("1", "true", "yes"...).
+
+    Stats are written to PROFILE_DIR as `<url_name>-<timestamp>.prof`; a top-N
+    summary is returned in `X-Profile-Summary` when PROFILE_SUMMARY_TOP_N > 0.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.enabled = settings.PROFILING_ENABLED
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def requested(self, request):
+        flags = (request.headers.get(PROFILE_HEADER), request.GET.get("profile"))
+        return self.enabled and any(
+            flag is not None and flag.strip() in BooleanField.TRUE_VALUES
+            for flag in flags
+        )
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not self.requested(request) or not _is_staff(request):
+            return self.get_response(request)
+
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            response = self.get_response(request)
+        finally:
+            profiler.disable()
+        return self.save(request, response, profiler)
+
+    async def __acall__(self, request):
+        if not self.requested(request) or not await sync_to_async(_is_staff)(request):
+            return await self.get_response(request)
+
+        # Only the event loop thread is profiled; ORM calls that run in
+        # worker threads show up as time spent awaiting them.
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            response = await self.get_response(request)
+        finally:
+            profiler.disable()
+        return self.save(request, response, profiler)
+
+    def save(self, request, response, profiler):
+        match = request.resolver_match
+        url_name = (match.url_name if match else None) or "unmatched"
+        directory = Path(settings.PROFILE_DIR)
+        directory.mkdir(parents=True, exist_ok=True)
+        timestamp = datetime.strftime(now(), "%Y%m%dT%H%M%S%f")
+        profiler.dump_stats(directory / f"{url_name}-{timestamp}.prof")
+
+        if settings.PROFILE_SUMMARY_TOP_N:
+            response[SUMMARY_HEADER] = summarize_profile(
+                profiler, settings.PROFILE_SUMMARY_TOP_N
+            )
+        return response
@@ -0,0 +1,146 @@
+import json
+import logging
+import random
+import time
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+logger = logging.getLogger("lunch_voting_api.requests")
+
+_recorder = ContextVar("query_recorder", default=None)
+
+
+class QueryRecorder:
+    """
+    Database execute wrapper that counts queries and accumulates their time.
+    """
+
+    __slots__ = ("count", "duration")
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started
+            self.count += 1
+
+
+def record_query(execute, sql, params, many, context):
+    """
+    Execute wrapper installed on every connection, passing queries to the
+    recorder of the request being timed, if any. The recorder is found
+    through a context variable, so queries run by sync_to_async in another
+    thread (with that thread's connections) still reach it.
+    """
+    recorder = _recorder.get()
+    if recorder is None:
+        return execute(sql, params, many, context)
+    return recorder(execute, sql, params, many, context)
+
+
+def install_query_recorder(sender, connection, **kwargs):
+    """
+    connection_created receiver adding record_query to a new connection.
+    It goes first in the list so `execute_wrapper()` blocks that are open
+    while the connection is made still pop their own wrapper.
+    """
+    if record_query not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, record_query)
+
+
+class RequestTimingMiddleware:
+    """
+    Records query count, DB time and view time for a sample of requests.
+
+    Sampled requests get a `Server-Timing` header and a structured log line;
+    requests over the configured query or latency budget are logged as
+    warnings. Unsampled requests only pay for one random() call.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.sample_rate = settings.REQUEST_TIMING_SAMPLE_RATE
+        self.query_budget = settings.REQUEST_QUERY_BUDGET
+        self.latency_budget_ms = settings.REQUEST_LATENCY_BUDGET_MS
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def sampled(self):
+        return self.sample_rate >= 1 or (
+            self.sample_rate > 0 and random.random() < self.sample_rate
+        )
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if not self.sampled():
+            return self.get_response(request)
+
+        recorder = QueryRecorder()
+        token = _recorder.set(recorder)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _recorder.reset(token)
+        return self.finish(request, response, recorder, started)
+
+    async def __acall__(self, request):
+        if not self.sampled():
+            return await self.get_response(request)
+
+        recorder = QueryRecorder()
+        token = _recorder.set(recorder)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _recorder.reset(token)
+        return self.finish(request, response, recorder, started)
+
+    def finish(self, request, response, recorder, started):
+        view_ms = (time.perf_counter() - started) * 1000
+        db_ms = recorder.duration * 1000
+
+        response["Server-Timing"] = (
+            f'db;dur={db_ms:.3f};desc="{recorder.count} queries", '
+            f"view;dur={view_ms:.3f}"
+        )
+        self.log(request, response, recorder.count, db_ms, view_ms)
+        return response
+
+    def log(self, request, response, query_count, db_ms, view_ms):
+        """
+        Emit one JSON log line per sampled request.
+        """
+        exceeded = []
+        if self.query_budget and query_count > self.query_budget:
+            exceeded.append("queries")
+        if self.latency_budget_ms and view_ms > self.latency_budget_ms:
+            exceeded.append("latency")
+
+        match = request.resolver_match
+        record = {
+            "method": request.method,
+            "path": request.path,
+            "url_name": match.url_name if match else None,
+            "status": response.status_code,
+            "queries": query_count,
+            "db_ms": round(db_ms, 3),
+            "view_ms": round(view_ms, 3),
+        }
+        if exceeded:
+            record["budget_exceeded"] = exceeded
+            logger.warning(json.dumps(record))
+        else:
+            logger.info(json.dumps(record))
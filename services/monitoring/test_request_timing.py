@@ -0,0 +1,84 @@
+import json
+import logging
+
+import pytest
+from asgiref.sync import async_to_sync, sync_to_async
+from django.contrib.auth import get_user_model
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+from rest_framework.test import APIClient
+from restaurants.models import Restaurant
+from services.monitoring.request_timing import RequestTimingMiddleware
+
+User = get_user_model()
+
+PROFILE_URL = "/api/auth/profile/"
+
+
+@pytest.fixture
+def client():
+    """
+    Returns an API client authenticated as an employee.
+    """
+    client = APIClient()
+    user = User.objects.create_user(email="timing@example.com", password="testpass123")
+    client.force_authenticate(user=user)
+    return client
+
+
+@pytest.mark.django_db
+@override_settings(REQUEST_TIMING_SAMPLE_RATE=1.0)
+def test_server_timing_header(client, caplog):
+    """Test that sampled requests report DB and view timings."""
+    with caplog.at_level(logging.INFO, logger="lunch_voting_api.requests"):
+        response = client.get(PROFILE_URL)
+
+    assert response.status_code == 200
+    assert response["Server-Timing"].startswith("db;dur=")
+    assert "view;dur=" in response["Server-Timing"]
+    records = [r for r in caplog.records if r.name == "lunch_voting_api.requests"]
+    record = json.loads(records[-1].getMessage())
+    assert record["url_name"] == "user_profile"
+    assert record["queries"] >= 0
+
+
+@pytest.mark.django_db
+@override_settings(REQUEST_TIMING_SAMPLE_RATE=1.0, REQUEST_QUERY_BUDGET=1)
+def test_query_budget_exceeded_is_flagged(client, caplog):
+    """Test that requests over the query budget are logged as warnings."""
+    owner = User.objects.create_user(
+        email="owner@example.com", password="testpass123", role="restaurant_admin"
+    )
+    Restaurant.objects.create(name="Budget Bistro", owner=owner)
+
+    with caplog.at_level(logging.INFO, logger="lunch_voting_api.requests"):
+        client.get("/api/restaurants/")
+
+    records = [r for r in caplog.records if r.name == "lunch_voting_api.requests"]
+    assert records[-1].levelno == logging.WARNING
+    assert json.loads(records[-1].getMessage())["budget_exceeded"] == ["queries"]
+
+
+@pytest.mark.django_db
+@override_settings(REQUEST_TIMING_SAMPLE_RATE=0)
+def test_sampling_disabled(client):
+    """Test that no header is added when sampling is disabled."""
+    response = client.get(PROFILE_URL)
+
+    assert response.status_code == 200
+    assert "Server-Timing" not in response
+
+
+@pytest.mark.django_db
+@override_settings(REQUEST_TIMING_SAMPLE_RATE=1.0)
+def test_async_views_count_queries_from_worker_threads():
+    """Test that ORM calls run through sync_to_async are recorded."""
+
+    async def view(request):
+        await sync_to_async(lambda: list(Restaurant.objects.all()))()
+        return HttpResponse()
+
+    middleware = RequestTimingMiddleware(view)
+    response = async_to_sync(middleware)(RequestFactory().get("/"))
+
+    assert 'desc="1 queries"' in response["Server-Timing"]
@@ -0,0 +1,133 @@
+import gzip
+from datetime import timedelta
+
+import orjson
+import pytest
+from django.test import override_settings
+from django.utils.timezone import localdate
+from rest_framework.test import APIClient
+from restaurants.models import Menu, Restaurant
+from services.monitoring.traffic import (
+    anonymize,
+    build_request,
+    read_traces,
+    user_hash,
+)
+
+
+@pytest.fixture
+def capture(tmp_path):
+    with override_settings(
+        TRAFFIC_CAPTURE_ENABLED=True, TRAFFIC_CAPTURE_DIR=str(tmp_path)
+    ):
+        yield tmp_path
+
+
+@pytest.fixture
+def data(django_user_model):
+    """
+    Creates a restaurant with today's menu and an authenticated employee.
+    """
+    owner = django_user_model.objects.create_user(
+        email="trace.owner@example.com", password="testpass123", role="restaurant_admin"
+    )
+    employee = django_user_model.objects.create_user(
+        email="trace.employee@example.com", password="testpass123"
+    )
+    restaurant = Restaurant.objects.create(name="Traced Diner", owner=owner)
+    restaurant.employees.add(employee)
+    menu = Menu.objects.create(restaurant=restaurant, date=localdate(), items={})
+    client = APIClient()
+    client.force_authenticate(user=employee)
+    return client, employee, restaurant, menu
+
+
+@pytest.mark.django_db
+def test_requests_are_traced_anonymized(capture, data):
+    """Test that traces keep the request shape but no user data."""
+    client, employee, restaurant, menu = data
+    client.get(
+        "/api/restaurants/",
+        {"search": "Traced", "owner": restaurant.owner_id},
+        HTTP_X_API_VERSION="2",
+    )
+    client.post("/api/votes/vote/", {"menu": menu.id}, format="json")
+    client.get(f"/api/restaurants/{restaurant.id}/daily-menu/")
+
+    raw = b"".join(path.read_bytes() for path in capture.iterdir())
+    assert b"Traced" not in raw and b"example.com" not in raw
+    listing, vote, daily = read_traces([capture])
+    assert listing["r"] == "restaurant-list-create"
+    assert listing["q"] == {"search": ["@s:6"], "owner": [str(restaurant.owner_id)]}
+    assert listing["h"] == {"v": "2"}
+    assert listing["u"] == user_hash(employee.id)
+    assert listing["ro"] == "employee"
+    assert (vote["m"], vote["b"], vote["s"]) == ("POST", {"menu": menu.id}, 201)
+    assert daily["k"] == {"restaurant_id": restaurant.id}
+
+
+@pytest.mark.django_db
+def test_numeric_secrets_are_not_traced(capture):
+    """Test that digit-only passwords and phone numbers are reduced too."""
+    client = APIClient()
+    client.post(
+        "/api/auth/register/",
+        {"email": "pin@example.com", "password": "482915", "name": "5550123"},
+        format="json",
+    )
+    client.post(
+        "/api/auth/login/",
+        {"email": "pin@example.com", "password": "482915"},
+        format="json",
+    )
+
+    raw = b"".join(path.read_bytes() for path in capture.iterdir())
+    assert b"482915" not in raw and b"5550123" not in raw
+    register, login = read_traces([capture])
+    assert register["b"]["password"] == "@s:6"
+    assert register["b"]["name"] == "@s:7"
+    assert login["b"]["password"] == "@s:6"
+    assert anonymize({"token": ["abc"], "menu": 7}, localdate()) == {
+        "token": ["@s:3"],
+        "menu": 7,
+    }
+
+
+@pytest.mark.django_db
+def test_capture_is_off_by_default(tmp_path, data):
+    """Test that nothing is written unless capture is enabled."""
+    client, *_ = data
+    with override_settings(TRAFFIC_CAPTURE_DIR=str(tmp_path)):
+        client.get("/api/restaurants/")
+    assert not any(tmp_path.iterdir())
+
+
+def test_dates_replay_relative_to_today():
+    """Test that recorded dates keep their distance from the capture day."""
+    captured = localdate() - timedelta(days=30)
+    trace = {
+        "t": 0,
+        "m": "POST",
+        "r": "menu-list-create",
+        "k": {"restaurant_id": 7},
+        "q": {"day": [anonymize(str(captured - timedelta(days=1)), captured)]},
+        "b": anonymize({"date": str(captured), "items": {"Soup": 5}}, captured),
+        "h": {"e": "gzip"},
+    }
+    assert trace["b"] == {"date": "@d:0", "items": {"Soup": 5}}
+
+    method, path, body, headers = build_request(trace)
+    yesterday = localdate() - timedelta(days=1)
+    assert (method, path) == ("POST", f"/api/restaurants/7/menus/?day={yesterday}")
+    assert orjson.loads(body) == {"date": str(localdate()), "items": {"Soup": 5}}
+    assert headers == {"Content-Type": "application/json", "Accept-Encoding": "gzip"}
+
+
+def test_rotated_traces_are_merged_in_order(tmp_path):
+    """Test that gzipped rotations and live files are read in time order."""
+    with gzip.open(tmp_path / "traffic-1.jsonl.1.gz", "wb") as rotated:
+        rotated.write(b'{"t":1.0,"m":"GET","r":"metrics"}\n')
+    (tmp_path / "traffic-1.jsonl").write_bytes(b'{"t":3.0,"m":"GET","r":"metrics"}\n')
+    (tmp_path / "traffic-2.jsonl").write_bytes(b'{"t":2.0,"m":"GET","r":"metrics"}\n')
+
+    assert [trace["t"] for trace in read_traces([tmp_path])] == [1.0, 2.0, 3.0]
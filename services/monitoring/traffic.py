@@ -0,0 +1,243 @@
+import gzip
+import hashlib
+import hmac
+import logging
+import os
+import re
+import time
+from datetime import datetime, timedelta
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+from urllib.parse import urlencode
+
+import orjson
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed, RequestDataTooBig
+from django.urls import reverse
+from django.utils.timezone import localdate
+from services.api.versioning import VERSION_HEADER
+
+_handlers = {}
+
+DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+NUMBER_RE = re.compile(r"^-?\d+$")
+PLAIN_VALUES = ("true", "false", "True", "False")
+# Keys whose values are replaced by their length whatever they hold.
+SENSITIVE_KEYS = frozenset(
+    ("password", "password2", "old_password", "token", "refresh", "access")
+)
+
+
+def user_hash(user_id):
+    """
+    Keyed hash of a user id: stable within a deployment, not reversible
+    without TRAFFIC_CAPTURE_SALT (or SECRET_KEY when it is empty).
+    """
+    key = (settings.TRAFFIC_CAPTURE_SALT or settings.SECRET_KEY).encode()
+    return hmac.new(key, str(user_id).encode(), hashlib.sha256).hexdigest()[:16]
+
+
+def anonymize(value, today, numeric_strings=False):
+    """
+    Reduce a query or body value to its shape. Numbers and booleans are
+    kept; dates become "@d:<days from today>" and other strings
+    "@s:<length>". Digit-only strings (ids in a query string) are kept only
+    with `numeric_strings`, and never under a SENSITIVE_KEYS key.
+    """
+    if isinstance(value, dict):
+        return {
+            key: (
+                _redact(item)
+                if key in SENSITIVE_KEYS
+                else anonymize(item, today, numeric_strings)
+            )
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [anonymize(item, today, numeric_strings) for item in value]
+    if not isinstance(value, str) or value in PLAIN_VALUES:
+        return value
+    if numeric_strings and NUMBER_RE.match(value):
+        return value
+    if DATE_RE.match(value):
+        try:
+            return f"@d:{(datetime.strptime(value, '%Y-%m-%d').date() - today).days}"
+        except ValueError:
+            pass
+    return f"@s:{len(value)}"
+
+
+def _redact(value):
+    if isinstance(value, list):
+        return [_redact(item) for item in value]
+    return f"@s:{len(str(value))}"
+
+
+def materialize(value, today):
+    """
+    Turn a shape recorded by `anonymize` back into a concrete value,
+    with dates relative to `today`.
+    """
+    if isinstance(value, dict):
+        return {key: materialize(item, today) for key, item in value.items()}
+    if isinstance(value, list):
+        return [materialize(item, today) for item in value]
+    if isinstance(value, str) and value.startswith("@d:"):
+        return (today + timedelta(days=int(value[3:]))).isoformat()
+    if isinstance(value, str) and value.startswith("@s:"):
+        return "x" * int(value[3:])
+    return value
+
+
+def _gzip_rotator(source, dest):
+    with open(source, "rb") as raw, gzip.open(dest, "wb") as compressed:
+        compressed.writelines(raw)
+    os.remove(source)
+
+
+def _trace_handler():
+    """
+    The size-rotated handler of this process's trace file, shared by every
+    middleware instance writing to it; rotated files are gzipped.
+    """
+    path = Path(settings.TRAFFIC_CAPTURE_DIR) / f"traffic-{os.getpid()}.jsonl"
+    handler = _handlers.get(path)
+    if handler is not None:
+        return handler
+    path.parent.mkdir(parents=True, exist_ok=True)
+    handler = _handlers[path] = RotatingFileHandler(
+        path,
+        maxBytes=settings.TRAFFIC_CAPTURE_MAX_BYTES,
+        backupCount=settings.TRAFFIC_CAPTURE_BACKUPS,
+        delay=True,
+    )
+    handler.namer = lambda name: f"{name}.gz"
+    handler.rotator = _gzip_rotator
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    return handler
+
+
+class TrafficCaptureMiddleware:
+    """
+    Records an anonymized trace of every routed request for replay.
+
+    Each request becomes one JSON line with its timestamp, route, path
+    arguments, the shape of its query string and JSON body, a few headers
+    that change the work done (API version, compression, conditional GET),
+    a keyed hash of the user id, the user's role and the response status.
+    Admin pages and unrouted requests are skipped. Disabled unless
+    TRAFFIC_CAPTURE_ENABLED is set.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        if not settings.TRAFFIC_CAPTURE_ENABLED:
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.handler = _trace_handler()
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        started, body = time.time(), self.body_shape(request)
+        response = self.get_response(request)
+        self.record(request, response, started, body)
+        return response
+
+    async def __acall__(self, request):
+        started, body = time.time(), self.body_shape(request)
+        response = await self.get_response(request)
+        self.record(request, response, started, body)
+        return response
+
+    @staticmethod
+    def body_shape(request):
+        """
+        Read the JSON body before the view consumes the stream.
+        """
+        if request.content_type != "application/json":
+            return None
+        try:
+            return orjson.loads(request.body) if request.body else None
+        except (orjson.JSONDecodeError, RequestDataTooBig):
+            return None
+
+    def record(self, request, response, started, body):
+        match = request.resolver_match
+        if match is None or "admin" in match.namespaces:
+            return
+        today = localdate()
+        trace = {"t": round(started, 3), "m": request.method, "r": match.view_name}
+        if match.kwargs:
+            trace["k"] = anonymize(match.kwargs, today, numeric_strings=True)
+        if request.GET:
+            trace["q"] = anonymize(
+                dict(request.GET.lists()), today, numeric_strings=True
+            )
+        if body is not None:
+            trace["b"] = anonymize(body, today)
+
+        headers = {}
+        if VERSION_HEADER in request.headers:
+            headers["v"] = request.headers[VERSION_HEADER]
+        if "Accept-Encoding" in request.headers:
+            headers["e"] = request.headers["Accept-Encoding"]
+        if "If-None-Match" in request.headers:
+            headers["c"] = 1
+        if headers:
+            trace["h"] = headers
+
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated:
+            trace["u"] = user_hash(user.pk)
+            trace["ro"] = getattr(user, "role", "")
+        trace["s"] = response.status_code
+        self.handler.handle(
+            logging.makeLogRecord({"msg": orjson.dumps(trace).decode()})
+        )
+
+
+def read_traces(paths):
+    """
+    Load trace records from files and directories of trace files (plain
+    or gzipped), ordered by timestamp.
+    """
+    files = []
+    for path in map(Path, paths):
+        files.extend(sorted(path.glob("traffic-*.jsonl*")) if path.is_dir() else [path])
+    traces = []
+    for file in files:
+        opener = gzip.open if file.suffix == ".gz" else open
+        with opener(file, "rb") as lines:
+            traces.extend(orjson.loads(line) for line in lines if line.strip())
+    traces.sort(key=lambda trace: trace["t"])
+    return traces
+
+
+def build_request(trace, today=None):
+    """
+    Return (method, path with query string, JSON body bytes or None,
+    headers) to re-issue a trace. Recorded dates keep their distance from
+    the capture day, counted from `today`.
+    """
+    today = today or localdate()
+    path = reverse(trace["r"], kwargs=materialize(trace.get("k", {}), today))
+    if "q" in trace:
+        query = materialize(trace["q"], today)
+        path = f"{path}?{urlencode(query, doseq=True)}"
+    body = None
+    headers = {}
+    if "b" in trace:
+        body = orjson.dumps(materialize(trace["b"], today))
+        headers["Content-Type"] = "application/json"
+    recorded = trace.get("h", {})
+    if "v" in recorded:
+        headers[VERSION_HEADER] = recorded["v"]
+    if "e" in recorded:
+        headers["Accept-Encoding"] = recorded["e"]
+    return trace["m"], path, body, headers
@@ -0,0 +1,10 @@
+from rest_framework import permissions
+
+
+class IsAuthenticated(permissions.IsAuthenticated):
+    """
+    IsAuthenticated that async views can check on the event loop.
+    """
+
+    async def ahas_permission(self, request, view):
+        return self.has_permission(request, view)
@@ -1,11 +1,26 @@
 from rest_framework.permissions import BasePermission
-from restaurants.models import Restaurant
+from services.restaurants.membership import owner_of
 
 
 class IsMenuOwner(BasePermission):
     """
     Permission to check if the user is the owner of the menu's restaurant.
+    Owners are looked up in the membership index instead of the database.
     """
 
+    def has_permission(self, request, view):
+        """
+        Only the owner may add a menu to a restaurant. Requests naming a
+        missing or malformed restaurant are left to the serializer.
+        """
+        if request.method != "POST":
+            return True
+        try:
+            restaurant_id = int(request.data.get("restaurant"))
+        except (TypeError, ValueError):
+            return True
+        owner_id = owner_of(restaurant_id)
+        return owner_id is None or owner_id == request.user.id
+
     def has_object_permission(self, request, view, obj):
-        return obj.restaurant.owner == request.user
+        return owner_of(obj.restaurant_id) == request.user.id
@@ -1,5 +1,5 @@
 from rest_framework.permissions import BasePermission
-from restaurants.models import Restaurant
+from services.restaurants.membership import owner_of
 
 
 class IsRestaurantOwner(BasePermission):
@@ -7,5 +7,13 @@ class IsRestaurantOwner(BasePermission):
     Permission to check if the user is the owner of the restaurant.
     """
 
+    def has_permission(self, request, view):
+        """
+        Rejects other users before the restaurant is loaded, using the
+        membership index. A missing restaurant is left to get_object.
+        """
+        owner_id = owner_of(view.kwargs["pk"])
+        return owner_id is None or owner_id == request.user.id
+
     def has_object_permission(self, request, view, obj):
-        return obj.owner == request.user
+        return obj.owner_id == request.user.id
@@ -0,0 +1,38 @@
+from functools import partial
+
+from django.conf import settings
+from core.models import OutboxEvent
+from django.db import transaction
+from restaurants.models import Menu
+from services.db.batch_delete import delete_in_batches
+from services.api.versions import bump_versions
+from services.events.outbox import publish_many
+from votes.models import Vote
+
+
+def _publish_deletes(model, rows):
+    instances = [model(**row) for row in rows]
+    publish_many(instances, OutboxEvent.DELETED)
+    bump_versions(key for instance in instances for key in instance.version_keys())
+
+
+def delete_restaurant(restaurant):
+    """
+    Delete a restaurant and its history in short batches instead of one
+    cascading transaction that locks every vote and menu it touches.
+    Each batch publishes its deletions to the outbox and bumps the
+    versions of the resources it changes as it goes.
+    """
+    options = {
+        "batch_size": settings.DELETE_BATCH_SIZE,
+        "max_batch_seconds": settings.DELETE_MAX_BATCH_SECONDS,
+    }
+    for queryset in (
+        Vote.objects.filter(menu__restaurant=restaurant),
+        Menu.objects.filter(restaurant=restaurant),
+    ):
+        delete_in_batches(
+            queryset, on_batch=partial(_publish_deletes, queryset.model), **options
+        )
+    with transaction.atomic():
+        restaurant.delete()
@@ -0,0 +1,75 @@
+from array import array
+from bisect import bisect_left
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from services.monitoring.metrics import record_cache_lookup
+
+CACHE_KEY = "membership:{}"
+
+
+class Membership:
+    """
+    The owner and the sorted employee ids of one restaurant.
+    """
+
+    __slots__ = ("owner_id", "employee_ids")
+
+    def __init__(self, owner_id, employee_ids):
+        self.owner_id = owner_id
+        self.employee_ids = employee_ids
+
+    def has_employee(self, user_id):
+        index = bisect_left(self.employee_ids, user_id)
+        return index < len(self.employee_ids) and self.employee_ids[index] == user_id
+
+
+def _load(restaurant_id):
+    from restaurants.models import Restaurant
+
+    rows = Restaurant.objects.filter(id=restaurant_id).values_list(
+        "owner_id", "employees"
+    )
+    if not rows:
+        return None
+    employee_ids = sorted(user_id for _, user_id in rows if user_id is not None)
+    return rows[0][0], array("q", employee_ids)
+
+
+def get_membership(restaurant_id):
+    """
+    Return the Membership of a restaurant, or None if it does not exist.
+
+    Entries are loaded on first use with a single query and kept in the
+    cache as an int64 array until the restaurant or its employees change.
+    """
+    key = CACHE_KEY.format(restaurant_id)
+    entry = cache.get(key)
+    record_cache_lookup("membership", entry is not None)
+    if entry is None:
+        entry = _load(restaurant_id)
+        if entry is None:
+            return None
+        cache.set(key, entry, settings.MEMBERSHIP_CACHE_SECONDS)
+    return Membership(*entry)
+
+
+def owner_of(restaurant_id):
+    membership = get_membership(restaurant_id)
+    return membership and membership.owner_id
+
+
+def is_employee(restaurant_id, user_id):
+    membership = get_membership(restaurant_id)
+    return membership is not None and membership.has_employee(user_id)
+
+
+def invalidate(restaurant_id):
+    """
+    Drop a restaurant's entry now and again once the transaction commits,
+    so a request that read the old rows in the meantime cannot keep them.
+    """
+    key = CACHE_KEY.format(restaurant_id)
+    cache.delete(key)
+    transaction.on_commit(lambda: cache.delete(key))
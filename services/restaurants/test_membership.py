@@ -0,0 +1,95 @@
+import pytest
+from django.conf import settings
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from restaurants.models import Restaurant
+from services.restaurants.membership import get_membership, is_employee, owner_of
+from services.testing.query_budget import budget_caches
+
+
+@pytest.fixture
+def restaurant(django_user_model):
+    owner = django_user_model.objects.create_user(
+        email="member.owner@example.com",
+        password="testpass123",
+        role="restaurant_admin",
+    )
+    return Restaurant.objects.create(name="Member Bistro", owner=owner)
+
+
+@pytest.fixture
+def employee(django_user_model):
+    return django_user_model.objects.create_user(
+        email="member.employee@example.com", password="testpass123"
+    )
+
+
+def test_default_cache_is_shared_between_processes():
+    """Test that invalidations reach every process through the cache."""
+    backend = settings.CACHES["default"]["BACKEND"]
+    assert not backend.endswith(("LocMemCache", "DummyCache"))
+
+
+@pytest.mark.django_db
+@budget_caches()
+def test_membership_is_loaded_once(restaurant, employee):
+    """Test that repeated checks are answered from the cache."""
+    restaurant.employees.add(employee)
+    assert is_employee(restaurant.id, employee.id)
+
+    with CaptureQueriesContext(connection) as queries:
+        assert is_employee(restaurant.id, employee.id)
+        assert not is_employee(restaurant.id, restaurant.owner_id)
+        assert owner_of(restaurant.id) == restaurant.owner_id
+
+    assert len(queries) == 0
+
+
+@pytest.mark.django_db
+def test_membership_follows_employee_changes(restaurant, employee):
+    """Test that adding and removing employees from either side is seen."""
+    assert not is_employee(restaurant.id, employee.id)
+
+    restaurant.employees.add(employee)
+    assert is_employee(restaurant.id, employee.id)
+
+    employee.employee_restaurants.clear()
+    assert not is_employee(restaurant.id, employee.id)
+
+    employee.employee_restaurants.add(restaurant)
+    assert is_employee(restaurant.id, employee.id)
+
+    restaurant.employees.remove(employee)
+    assert not is_employee(restaurant.id, employee.id)
+
+
+@pytest.mark.django_db
+def test_membership_follows_restaurant_changes(restaurant, employee):
+    """Test that a new owner and a deleted restaurant are seen."""
+    assert owner_of(restaurant.id) == restaurant.owner_id
+
+    restaurant.owner = employee
+    restaurant.save()
+    assert owner_of(restaurant.id) == employee.id
+
+    restaurant_id = restaurant.id
+    restaurant.delete()
+    assert get_membership(restaurant_id) is None
+
+
+@pytest.mark.django_db
+def test_add_employee_endpoint_updates_membership(restaurant, employee):
+    """Test that an employee added through the API can vote right away."""
+    assert not is_employee(restaurant.id, employee.id)
+    client = APIClient()
+    client.force_authenticate(user=restaurant.owner)
+
+    response = client.patch(
+        f"/api/restaurants/{restaurant.id}/add-employee/",
+        {"employee_id": employee.id},
+        format="json",
+    )
+
+    assert response.status_code == 200
+    assert is_employee(restaurant.id, employee.id)
@@ -0,0 +1,91 @@
+import gzip
+import json
+import os
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.timezone import now
+from restaurants.models import Menu
+from services.db.batch_delete import delete_in_batches
+from votes.models import Vote
+
+
+class NDJSONArchive:
+    """
+    Writes rows as gzip-compressed newline-delimited JSON.
+
+    The file only appears under its final name once it is closed, and is
+    removed if no row was written.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.rows = 0
+        self._tmp = self.path.with_name(self.path.name + ".tmp")
+        self._file = None
+
+    def __enter__(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = gzip.open(self._tmp, "wt", encoding="utf-8")
+        return self
+
+    def write(self, rows):
+        for row in rows:
+            self._file.write(json.dumps(row, cls=DjangoJSONEncoder))
+            self._file.write("\n")
+        self.rows += len(rows)
+
+    def __exit__(self, exc_type, exc, tb):
+        self._file.close()
+        if self.rows:
+            os.replace(self._tmp, self.path)
+        else:
+            self._tmp.unlink()
+
+
+def expired(days=None, today=None):
+    """
+    Return the querysets of rows older than the retention window, in the
+    order they must be deleted.
+    """
+    days = settings.RETENTION_DAYS if days is None else days
+    cutoff = (today or now().date()) - timedelta(days=days)
+    # Votes share their menu's date, so they go before their menus.
+    return cutoff, [
+        Vote.objects.filter(date__lt=cutoff),
+        Menu.objects.filter(date__lt=cutoff),
+    ]
+
+
+def apply_retention(
+    directory=None,
+    days=None,
+    batch_size=1_000,
+    max_batch_seconds=0.5,
+    pause=0.0,
+    today=None,
+):
+    """
+    Archive expired votes and menus to `<table>-before-<cutoff>-<run>.ndjson.gz`
+    files and delete them in batches. Returns {table: (rows, path)}.
+    """
+    directory = Path(directory or settings.RETENTION_ARCHIVE_DIR)
+    cutoff, querysets = expired(days, today)
+    run = now().strftime("%Y%m%dT%H%M%S")
+
+    results = {}
+    for queryset in querysets:
+        table = queryset.model._meta.db_table
+        path = directory / f"{table}-before-{cutoff}-{run}.ndjson.gz"
+        with NDJSONArchive(path) as archive:
+            deleted = delete_in_batches(
+                queryset,
+                batch_size=batch_size,
+                max_batch_seconds=max_batch_seconds,
+                pause=pause,
+                on_batch=archive.write,
+            )
+        results[table] = (deleted, path if deleted else None)
+    return results
@@ -0,0 +1,253 @@
+import csv
+import io
+import json
+import random
+from datetime import datetime, time, timedelta, timezone
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.color import no_style
+from django.db import connection
+from django.db.models import JSONField, Max
+from django.utils.timezone import now
+from restaurants.models import Menu, Restaurant
+from votes.models import Vote
+
+User = get_user_model()
+
+DISHES = [
+    "Borscht", "Varenyky", "Pizza", "Pasta", "Burger", "Salad", "Steak",
+    "Soup", "Sushi", "Ramen", "Curry", "Tacos", "Falafel", "Pho", "Risotto",
+]  # fmt: skip
+
+USER_COLUMNS = (
+    "id",
+    "password",
+    "email",
+    "name",
+    "surname",
+    "role",
+    "is_active",
+    "is_staff",
+    "is_superuser",
+    "created_at",
+)
+RESTAURANT_COLUMNS = ("id", "name", "owner_id", "created_at")
+MEMBERSHIP_COLUMNS = ("id", "restaurant_id", "customuser_id")
+MENU_COLUMNS = ("id", "restaurant_id", "date", "items", "created_at")
+VOTE_COLUMNS = ("id", "user_id", "menu_id", "date", "created_at")
+
+
+class CopyLoader:
+    """
+    Streams rows into PostgreSQL with COPY ... FROM STDIN.
+    """
+
+    name = "copy"
+
+    def __init__(self, batch_size):
+        self.batch_size = batch_size
+
+    def load(self, model, columns, rows):
+        fields = {f.attname: f for f in model._meta.concrete_fields}
+        table = connection.ops.quote_name(model._meta.db_table)
+        column_sql = ", ".join(
+            connection.ops.quote_name(fields[c].column) for c in columns
+        )
+        sql = f"COPY {table} ({column_sql}) FROM STDIN WITH (FORMAT csv)"
+        json_positions = [
+            i for i, c in enumerate(columns) if isinstance(fields[c], JSONField)
+        ]
+
+        total = 0
+        with connection.cursor() as cursor:
+            for chunk in _chunks(rows, self.batch_size):
+                if json_positions:
+                    chunk = [list(row) for row in chunk]
+                    for row in chunk:
+                        for i in json_positions:
+                            row[i] = json.dumps(row[i])
+                buffer = io.StringIO()
+                csv.writer(buffer).writerows(chunk)
+                buffer.seek(0)
+                cursor.copy_expert(sql, buffer)
+                total += len(chunk)
+        return total
+
+
+class BulkCreateLoader:
+    """
+    Inserts rows with batched bulk_create on databases without COPY.
+    """
+
+    name = "bulk_create"
+
+    def __init__(self, batch_size):
+        self.batch_size = batch_size
+
+    def load(self, model, columns, rows):
+        total = 0
+        for chunk in _chunks(rows, self.batch_size):
+            model.objects.bulk_create(
+                [model(**dict(zip(columns, row))) for row in chunk],
+                batch_size=self.batch_size,
+            )
+            total += len(chunk)
+        return total
+
+
+def _chunks(rows, size):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def get_loader(method="auto", batch_size=10_000):
+    """
+    Return the COPY loader on PostgreSQL and bulk_create elsewhere.
+    """
+    if method == "auto":
+        method = "copy" if connection.vendor == "postgresql" else "bulk_create"
+    if method == "copy":
+        return CopyLoader(batch_size)
+    return BulkCreateLoader(batch_size)
+
+
+def _next_id(model):
+    return (model.objects.aggregate(last=Max("id"))["last"] or 0) + 1
+
+
+def _reset_sequences(models):
+    statements = connection.ops.sequence_reset_sql(no_style(), models)
+    if statements:
+        with connection.cursor() as cursor:
+            for sql in statements:
+                cursor.execute(sql)
+
+
+def generate(
+    users=1_000,
+    restaurants=50,
+    memberships_per_user=3,
+    days=30,
+    vote_ratio=0.8,
+    seed=0,
+    password="password123",
+    loader=None,
+    today=None,
+):
+    """
+    Generate a deterministic dataset: restaurant owners, employees,
+    memberships, one menu per restaurant per day (ending today) and a vote
+    from most employees on every past day.
+
+    Every user shares one precomputed password hash, and ids are assigned
+    up front so related rows can be streamed without reading them back.
+    """
+    loader = loader or get_loader()
+    rng = random.Random(seed)
+    today = today or now().date()
+    created = now()
+    password_hash = make_password(password)
+    prefix = f"s{seed}"
+
+    if User.objects.filter(email=f"{prefix}.owner0@seed.example.com").exists():
+        raise ValueError(f"Seed {seed} has already been loaded into this database.")
+
+    first_user = _next_id(User)
+    owner_ids = range(first_user, first_user + restaurants)
+    employee_ids = range(owner_ids.stop, owner_ids.stop + users)
+    first_restaurant = _next_id(Restaurant)
+    restaurant_ids = range(first_restaurant, first_restaurant + restaurants)
+
+    def user_rows():
+        for i, user_id in enumerate(owner_ids):
+            yield (
+                user_id, password_hash, f"{prefix}.owner{i}@seed.example.com",
+                "Owner", str(i), "restaurant_admin", True, False, False, created,
+            )  # fmt: skip
+        for i, user_id in enumerate(employee_ids):
+            yield (
+                user_id, password_hash, f"{prefix}.employee{i}@seed.example.com",
+                "Employee", str(i), "employee", True, False, False, created,
+            )  # fmt: skip
+
+    counts = {"users": loader.load(User, USER_COLUMNS, user_rows())}
+    counts["restaurants"] = loader.load(
+        Restaurant,
+        RESTAURANT_COLUMNS,
+        (
+            (rid, f"Seed {seed} Restaurant {i}", owner_ids[i], created)
+            for i, rid in enumerate(restaurant_ids)
+        ),
+    )
+
+    groups_per_user = min(memberships_per_user, restaurants)
+    memberships = {
+        user_id: rng.sample(restaurant_ids, groups_per_user) for user_id in employee_ids
+    }
+    Membership = Restaurant.employees.through
+    first_membership = _next_id(Membership)
+    counts["memberships"] = loader.load(
+        Membership,
+        MEMBERSHIP_COLUMNS,
+        (
+            (first_membership + n, rid, user_id)
+            for n, (user_id, rid) in enumerate(
+                (user_id, rid)
+                for user_id, groups in memberships.items()
+                for rid in groups
+            )
+        ),
+    )
+
+    dates = [today - timedelta(days=d) for d in range(days, -1, -1)]
+    first_menu = _next_id(Menu)
+    menu_id = {}
+    for day_index, date in enumerate(dates):
+        for r_index, rid in enumerate(restaurant_ids):
+            menu_id[(rid, date)] = first_menu + day_index * restaurants + r_index
+
+    def menu_rows():
+        for date in dates:
+            for rid in restaurant_ids:
+                items = {dish: rng.randint(3, 20) for dish in rng.sample(DISHES, 3)}
+                yield menu_id[(rid, date)], rid, date, items, created
+
+    counts["menus"] = loader.load(Menu, MENU_COLUMNS, menu_rows())
+
+    first_vote = _next_id(Vote)
+
+    def vote_rows():
+        vote_id = first_vote
+        random_ = rng.random
+        for date in dates[:-1]:
+            noon = datetime.combine(date, time(11, 30), tzinfo=timezone.utc)
+            for user_id, groups in memberships.items():
+                if random_() >= vote_ratio:
+                    continue
+                rid = groups[int(random_() * groups_per_user)]
+                voted_at = noon + timedelta(seconds=int(random_() * 3600))
+                yield vote_id, user_id, menu_id[(rid, date)], date, voted_at
+                vote_id += 1
+
+    counts["votes"] = loader.load(
+        Vote, VOTE_COLUMNS, vote_rows() if groups_per_user else ()
+    )
+
+    _reset_sequences([User, Restaurant, Membership, Menu, Vote])
+
+    return {
+        "counts": counts,
+        "owner_ids": list(owner_ids),
+        "employee_ids": list(employee_ids),
+        "restaurant_ids": list(restaurant_ids),
+        "memberships": memberships,
+        "today_menus": {rid: menu_id[(rid, today)] for rid in restaurant_ids},
+        "email_prefix": prefix,
+    }
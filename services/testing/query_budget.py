@@ -0,0 +1,275 @@
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils.timezone import now
+from rest_framework.test import APIClient
+from restaurants.models import Menu, Restaurant
+from services.restaurants.membership import get_membership, invalidate
+from votes.models import Vote
+
+User = get_user_model()
+
+DATASET_SIZES = (1, 10, 100)
+
+# Maximum number of queries per request, keyed by URL name and method.
+# Requests are made with force_authenticate, so JWT user lookups are excluded.
+# Vote, menu and restaurant writes also bump their resource versions (and
+# vote and menu writes insert an outbox event); conditional GETs read the
+# versions of what they serve.
+QUERY_BUDGETS = {
+    ("register", "post"): 2,
+    ("login", "post"): 3,
+    ("logout", "post"): 6,
+    ("token_refresh", "post"): 7,
+    ("user_profile", "get"): 0,
+    ("restaurant-list-create", "get"): 2,
+    ("restaurant-list-create", "post"): 5,
+    ("restaurant-detail", "get"): 3,
+    ("restaurant-detail", "patch"): 6,
+    # Votes, menus and the restaurant (with its rollups, vote preferences
+    # and recommendations) are deleted in separate batches. Deleted votes
+    # are loaded for their post_delete receiver, which bumps their results.
+    ("restaurant-detail", "delete"): 27,
+    # The membership index listens to m2m_changed, which makes add() look up
+    # the existing rows before inserting.
+    ("add-employee", "patch"): 7,
+    ("menu-list-create", "get"): 2,
+    ("menu-list-create", "post"): 5,
+    ("menu-detail", "get"): 1,
+    ("menu-detail", "patch"): 4,
+    # The cascade loads the votes for their post_delete receiver.
+    ("menu-detail", "delete"): 7,
+    ("daily-menu", "get"): 2,
+    ("vote-create", "post"): 5,
+    ("vote-results", "get"): 2,
+    ("vote-events", "get"): 1,
+    ("analytics-wins", "get"): 1,
+    ("analytics-trend", "get"): 2,
+    ("analytics-weekdays", "get"): 1,
+    ("vote-recommendations", "get"): 1,
+    ("metrics", "get"): 0,
+    # Profile plus the restaurant list (with its employees prefetch).
+    ("batch", "post"): 2,
+}
+
+# Budgets are asserted under both cache backends a deployment can use:
+# Redis (stood in for by an in-process cache, whose lookups cost no queries)
+# and the database cache table used without REDIS_URL.
+BUDGET_CACHES = {
+    "locmem": {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    "database": {
+        "default": {
+            "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+            "LOCATION": "django_cache",
+        }
+    },
+}
+
+# Queries the database cache adds to a request's budget, keyed like
+# QUERY_BUDGETS: a SELECT per warm membership lookup and a DELETE per
+# invalidation (the repeat after commit never runs inside a test).
+DATABASE_CACHE_QUERIES = {
+    ("restaurant-list-create", "post"): 1,
+    ("restaurant-detail", "get"): 1,
+    ("restaurant-detail", "patch"): 2,
+    ("restaurant-detail", "delete"): 2,
+    ("add-employee", "patch"): 2,
+    ("menu-list-create", "post"): 1,
+    ("menu-detail", "get"): 1,
+    ("menu-detail", "patch"): 1,
+    ("menu-detail", "delete"): 1,
+    ("vote-create", "post"): 1,
+    ("vote-recommendations", "get"): 1,
+}
+
+
+class budget_caches(override_settings):
+    """
+    Switch to the BUDGET_CACHES of `backend`, emptied first: unlike the
+    database cache, the in-process cache outlives each test's rollback, and
+    ids get reused.
+    """
+
+    def __init__(self, backend="locmem"):
+        self.backend = backend
+        super().__init__(CACHES=BUDGET_CACHES[backend])
+
+    def enable(self):
+        super().enable()
+        if self.backend == "database":
+            # The table only exists when the test settings use this backend.
+            call_command("createcachetable", verbosity=0)
+        cache.clear()
+
+
+class BudgetDataset:
+    """
+    A dataset that grows to a given number of restaurants, each with an
+    owner, employees, today's menu and a vote from every employee.
+    """
+
+    def __init__(self, employees_per_restaurant=3):
+        self.employees_per_restaurant = employees_per_restaurant
+        self.password = make_password("testpass123")
+        self.restaurants = []
+        self.menus = []
+        self._users = 0
+
+    def _new_users(self, count, role):
+        users = [
+            User(
+                email=f"budget{self._users + i}@example.com",
+                name="Budget",
+                surname=str(self._users + i),
+                role=role,
+                password=self.password,
+            )
+            for i in range(count)
+        ]
+        self._users += count
+        return User.objects.bulk_create(users)
+
+    def grow(self, size):
+        """
+        Add restaurants until the dataset holds `size` of them.
+        """
+        missing = size - len(self.restaurants)
+        if missing <= 0:
+            return self
+        owners = self._new_users(missing, "restaurant_admin")
+        restaurants = Restaurant.objects.bulk_create(
+            Restaurant(name=f"Budget Restaurant {owner.id}", owner=owner)
+            for owner in owners
+        )
+        menus = Menu.objects.bulk_create(
+            Menu(restaurant=r, date=now().date(), items={"Soup": 5})
+            for r in restaurants
+        )
+        employees = self._new_users(missing * self.employees_per_restaurant, "employee")
+        memberships, votes = [], []
+        for i, (restaurant, menu) in enumerate(zip(restaurants, menus)):
+            group = employees[
+                i
+                * self.employees_per_restaurant : (i + 1)
+                * self.employees_per_restaurant
+            ]
+            for employee in group:
+                memberships.append(
+                    Restaurant.employees.through(
+                        restaurant_id=restaurant.id, customuser_id=employee.id
+                    )
+                )
+                votes.append(Vote(user=employee, menu=menu, date=menu.date))
+        Restaurant.employees.through.objects.bulk_create(memberships)
+        Vote.objects.bulk_create(votes)
+        # Bulk inserts send no signals, so drop entries left by earlier tests.
+        for restaurant in restaurants:
+            invalidate(restaurant.id)
+        self.restaurants.extend(restaurants)
+        self.menus.extend(menus)
+        return self
+
+    @property
+    def restaurant(self):
+        return self.restaurants[0]
+
+    @property
+    def owner(self):
+        return self.restaurant.owner
+
+    @property
+    def menu(self):
+        return self.menus[0]
+
+    def new_employee(self):
+        """
+        Return a new employee who does not belong to any restaurant.
+        """
+        return self._new_users(1, "employee")[0]
+
+    def fresh_employee(self, restaurant=None):
+        """
+        Return a new employee who belongs to `restaurant` and has not voted.
+        """
+        employee = self.new_employee()
+        (restaurant or self.restaurant).employees.add(employee)
+        return employee
+
+    def warm_caches(self):
+        """
+        Load the membership index of every restaurant, as a running
+        server would have after its first requests.
+        """
+        for restaurant in self.restaurants:
+            get_membership(restaurant.id)
+
+    def pop_last(self):
+        """
+        Detach the newest restaurant and its menu so a test can delete them.
+        """
+        restaurant, menu = self.restaurants.pop(), self.menus.pop()
+        get_membership(restaurant.id)
+        return restaurant, menu
+
+    def client(self, user=None):
+        client = APIClient()
+        if user is not None:
+            client.force_authenticate(user=user)
+        return client
+
+
+def count_request_queries(client, method, path, data=None):
+    """
+    Perform a request and return the response with its query count.
+    """
+    with CaptureQueriesContext(connection) as queries:
+        response = getattr(client, method)(path, data, format="json")
+    return response, len(queries)
+
+
+def assert_query_budget(url_name, method, make_request, sizes=DATASET_SIZES):
+    """
+    Run a request against datasets of increasing size and fail if it
+    exceeds its budget or if its query count grows with the data size.
+    Requests are measured with warm caches, once per backend of
+    BUDGET_CACHES; each run's data is rolled back before the next.
+
+    `make_request(dataset)` returns `(client, path, data)` for one request.
+    """
+    budgets = {
+        "locmem": QUERY_BUDGETS[(url_name, method)],
+        "database": QUERY_BUDGETS[(url_name, method)]
+        + DATABASE_CACHE_QUERIES.get((url_name, method), 0),
+    }
+    results = {}
+    for backend, budget in budgets.items():
+        counts = results[backend] = {}
+        with transaction.atomic(), budget_caches(backend):
+            dataset = BudgetDataset()
+            for size in sizes:
+                dataset.grow(size)
+                client, path, data = make_request(dataset)
+                dataset.warm_caches()
+                response, counts[size] = count_request_queries(
+                    client, method, path, data
+                )
+                assert response.status_code < 400, (
+                    f"{method.upper()} {url_name} failed with "
+                    f"{response.status_code} ({backend} cache): "
+                    f"{getattr(response, 'data', response.content)}"
+                )
+            transaction.set_rollback(True)
+
+        assert len(set(counts.values())) == 1, (
+            f"{method.upper()} {url_name} query count grows with data size "
+            f"({backend} cache, restaurants -> queries): {counts}"
+        )
+        assert max(counts.values()) <= budget, (
+            f"{method.upper()} {url_name} ran {max(counts.values())} queries "
+            f"with the {backend} cache, budget is {budget}"
+        )
+    return results
@@ -0,0 +1,12 @@
+from rest_framework.exceptions import ValidationError
+
+MOVED_VOTED_MENU = "The date of a menu that has votes cannot be changed."
+
+
+def validate_menu_date(menu, date):
+    """
+    Validate that a menu with votes keeps its date, since its votes are
+    counted (and on PostgreSQL partitioned) by the date they were cast for.
+    """
+    if menu is not None and date != menu.date and menu.votes.exists():
+        raise ValidationError(MOVED_VOTED_MENU)
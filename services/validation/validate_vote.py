@@ -1,10 +1,19 @@
 from votes.models import Vote
 from rest_framework.exceptions import ValidationError
+from services.restaurants.membership import is_employee
+
+
+def validate_vote_eligibility(user, menu):
+    """
+    Validate that the user is an employee of the menu's restaurant.
+    """
+    if not is_employee(menu.restaurant_id, user.id):
+        raise ValidationError("You are not an employee of this restaurant.")
 
 
 def validate_user_vote(user, menu):
     """
     Validate that the user has not already voted for the given menu.
     """
-    if Vote.objects.filter(user=user, menu=menu).exists():
+    if Vote.objects.filter(user=user, menu=menu, date=menu.date).exists():
         raise ValidationError("You have already voted for this menu.")
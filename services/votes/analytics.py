@@ -0,0 +1,194 @@
+from collections import defaultdict
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import (
+    Avg,
+    Count,
+    F,
+    Max,
+    Min,
+    OuterRef,
+    Q,
+    Subquery,
+    Sum,
+    Window,
+)
+from django.db.models.functions import Coalesce, ExtractIsoWeekDay, Rank
+from django.db.models.expressions import RowRange
+from django.utils.timezone import now
+from restaurants.models import Menu
+from votes.models import DailyRestaurantVotes, DailyVoteTotal, Vote
+
+CHUNK_DAYS = 31
+
+
+def _day_query(start, end):
+    votes = (
+        Vote.objects.filter(menu=OuterRef("pk"), date=OuterRef("date"))
+        .order_by()
+        .values("menu")
+        .annotate(count=Count("*"))
+        .values("count")
+    )
+    day = F("date")
+    return (
+        Menu.objects.filter(date__gte=start, date__lt=end)
+        .annotate(vote_count=Coalesce(Subquery(votes), 0))
+        .annotate(
+            day_votes=Window(Sum("vote_count"), partition_by=day),
+            rank=Window(Rank(), partition_by=day, order_by=F("vote_count").desc()),
+        )
+        .values_list("date", "restaurant_id", "vote_count", "day_votes", "rank")
+    )
+
+
+def _rollup(start, end):
+    restaurant_rows = []
+    totals = defaultdict(lambda: [0, 0])
+    for date, restaurant_id, votes, day_votes, rank in _day_query(start, end):
+        restaurant_rows.append(
+            DailyRestaurantVotes(
+                restaurant_id=restaurant_id,
+                date=date,
+                votes=votes,
+                share=votes / day_votes if day_votes else 0.0,
+                rank=rank,
+            )
+        )
+        totals[date][0] += votes
+        totals[date][1] += 1
+
+    days = (end - start).days
+    DailyRestaurantVotes.objects.bulk_create(restaurant_rows, batch_size=1_000)
+    # Days without menus get a row too, so the next run starts after them.
+    DailyVoteTotal.objects.bulk_create(
+        DailyVoteTotal(date=date, votes=totals[date][0], menus=totals[date][1])
+        for date in (start + timedelta(days=i) for i in range(days))
+    )
+    return days
+
+
+def refresh_rollups(today=None, since=None):
+    """
+    Aggregate every closed day (before `today`) that has not been rolled
+    up yet, in transactions of up to CHUNK_DAYS days. Votes are counted
+    once, when their day closes.
+
+    `since` first deletes the rollups from that date on, so late changes
+    can be recounted. Returns the number of days processed.
+    """
+    today = today or now().date()
+    if since is not None:
+        with transaction.atomic():
+            DailyRestaurantVotes.objects.filter(date__gte=since).delete()
+            DailyVoteTotal.objects.filter(date__gte=since).delete()
+
+    last = DailyVoteTotal.objects.aggregate(last=Max("date"))["last"]
+    if last is not None:
+        start = last + timedelta(days=1)
+    else:
+        start = Menu.objects.aggregate(first=Min("date"))["first"]
+        if start is None:
+            return 0
+
+    processed = 0
+    while start < today:
+        end = min(start + timedelta(days=CHUNK_DAYS), today)
+        with transaction.atomic():
+            processed += _rollup(start, end)
+        start = end
+    return processed
+
+
+def win_counts(start, end, limit=None):
+    """
+    Days with a menu, wins (first place with at least one vote, shared on
+    ties) and win rate per restaurant between `start` and `end`.
+    """
+    rows = (
+        DailyRestaurantVotes.objects.filter(date__gte=start, date__lte=end)
+        .values("restaurant_id", "restaurant__name")
+        .annotate(
+            days=Count("id"),
+            wins=Count("id", filter=Q(rank=1, votes__gt=0)),
+            total_votes=Sum("votes"),
+        )
+        .annotate(position=Window(Rank(), order_by=F("wins").desc()))
+        .order_by("position", "-total_votes", "restaurant_id")
+    )
+    if limit is not None:
+        rows = rows[:limit]
+    return [
+        {
+            "position": row["position"],
+            "restaurant": row["restaurant_id"],
+            "name": row["restaurant__name"],
+            "days": row["days"],
+            "wins": row["wins"],
+            "win_rate": round(row["wins"] / row["days"], 4),
+            "votes": row["total_votes"],
+        }
+        for row in rows
+    ]
+
+
+def vote_trend(restaurant_id, start, end, window=7):
+    """
+    A restaurant's daily votes and vote share between `start` and `end`,
+    with their averages over its last `window` menu days.
+    """
+    frame = RowRange(start=-(window - 1), end=0)
+    order = F("date").asc()
+    # Earlier days feed the first rolling averages, so the lower bound is
+    # applied after the window functions have run.
+    rows = (
+        DailyRestaurantVotes.objects.filter(restaurant_id=restaurant_id, date__lte=end)
+        .annotate(
+            rolling_votes=Window(Avg("votes"), order_by=order, frame=frame),
+            rolling_share=Window(Avg("share"), order_by=order, frame=frame),
+        )
+        .order_by("date")
+        .values("date", "votes", "share", "rank", "rolling_votes", "rolling_share")
+    )
+    return [
+        {
+            "date": row["date"],
+            "votes": row["votes"],
+            "share": round(row["share"], 4),
+            "rank": row["rank"],
+            "rolling_votes": round(row["rolling_votes"], 2),
+            "rolling_share": round(row["rolling_share"], 4),
+        }
+        for row in rows
+        if row["date"] >= start
+    ]
+
+
+def weekday_distribution(start, end, restaurant_id=None):
+    """
+    Votes per ISO weekday (1 is Monday) between `start` and `end`, for all
+    restaurants or one of them, over the days that had menus.
+    """
+    if restaurant_id is None:
+        days = DailyVoteTotal.objects.filter(menus__gt=0)
+    else:
+        days = DailyRestaurantVotes.objects.filter(restaurant_id=restaurant_id)
+    rows = list(
+        days.filter(date__gte=start, date__lte=end)
+        .annotate(weekday=ExtractIsoWeekDay("date"))
+        .values("weekday")
+        .annotate(days=Count("id"), total_votes=Sum("votes"))
+        .order_by("weekday")
+    )
+    total = sum(row["total_votes"] for row in rows)
+    return [
+        {
+            "weekday": row["weekday"],
+            "days": row["days"],
+            "votes": row["total_votes"],
+            "average": round(row["total_votes"] / row["days"], 2),
+            "share": round(row["total_votes"] / total, 4) if total else 0.0,
+        }
+        for row in rows
+    ]
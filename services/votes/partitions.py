@@ -0,0 +1,204 @@
+import gzip
+import os
+import re
+from datetime import date
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils.timezone import now
+
+TABLE = "votes_vote"
+DEFAULT_PARTITION = f"{TABLE}_default"
+COLUMNS = "id, created_at, date, menu_id, user_id"
+
+_partition_re = re.compile(rf"^{TABLE}_p(\d{{4}})(\d{{2}})$")
+
+
+def month_start(day):
+    return day.replace(day=1)
+
+
+def add_months(month, count):
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month):
+    return f"{TABLE}_p{month:%Y%m}"
+
+
+def is_partitioned():
+    """
+    Whether votes_vote is a partitioned PostgreSQL table.
+    """
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT 1 FROM pg_partitioned_table WHERE partrelid = %s::regclass",
+            [TABLE],
+        )
+        return cursor.fetchone() is not None
+
+
+def partition_table(schema_editor):
+    """
+    Rebuild votes_vote as a table range-partitioned by `date`, keeping the
+    existing rows in a default partition until ensure_partitions moves them
+    into monthly partitions.
+
+    Unique constraints on a partitioned table must include the partition
+    key, so the primary key becomes (id, date) and the vote uniqueness
+    (user, menu, date). A menu has a single date, so both still mean what
+    they did before.
+    """
+    if schema_editor.connection.vendor != "postgresql":
+        return
+
+    legacy = f"{TABLE}_unpartitioned"
+    sequence = f"{TABLE}_partitioned_id_seq"
+    execute = schema_editor.execute
+    execute(f"ALTER TABLE {TABLE} RENAME TO {legacy}")
+    execute(f"CREATE SEQUENCE {sequence}")
+    execute(
+        f"""
+        CREATE TABLE {TABLE} (
+            id bigint NOT NULL DEFAULT nextval('{sequence}'),
+            created_at timestamp with time zone NOT NULL,
+            date date NOT NULL,
+            menu_id bigint NOT NULL,
+            user_id bigint NOT NULL,
+            CONSTRAINT {TABLE}_id_date_pk PRIMARY KEY (id, date),
+            CONSTRAINT {TABLE}_user_menu_date_uniq UNIQUE (user_id, menu_id, date),
+            CONSTRAINT {TABLE}_menu_id_fk FOREIGN KEY (menu_id)
+                REFERENCES restaurants_menu (id) DEFERRABLE INITIALLY DEFERRED,
+            CONSTRAINT {TABLE}_user_id_fk FOREIGN KEY (user_id)
+                REFERENCES users_customuser (id) DEFERRABLE INITIALLY DEFERRED
+        ) PARTITION BY RANGE (date)
+        """
+    )
+    execute(f"CREATE INDEX {TABLE}_menu_id_part_idx ON {TABLE} (menu_id)")
+    execute(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {TABLE} DEFAULT")
+    # Check foreign keys as rows are copied, not at commit, so no trigger
+    # events are pending when the old table is dropped.
+    execute("SET CONSTRAINTS ALL IMMEDIATE")
+    execute(f"INSERT INTO {TABLE} ({COLUMNS}) SELECT {COLUMNS} FROM {legacy}")
+    execute(
+        f"SELECT setval('{sequence}', COALESCE(MAX(id), 1), MAX(id) IS NOT NULL) "
+        f"FROM {TABLE}"
+    )
+    execute(f"DROP TABLE {legacy}")
+    execute(f"ALTER SEQUENCE {sequence} RENAME TO {TABLE}_id_seq")
+    execute(f"ALTER SEQUENCE {TABLE}_id_seq OWNED BY {TABLE}.id")
+
+
+def list_partitions():
+    """
+    Return the attached monthly partitions, oldest first, as dicts with
+    the partition name, its month and the planner's row estimate.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(
+            """
+            SELECT c.relname, c.reltuples::bigint
+            FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = %s::regclass
+            """,
+            [TABLE],
+        )
+        rows = cursor.fetchall()
+
+    partitions = []
+    for name, estimate in rows:
+        match = _partition_re.match(name)
+        if match:
+            month = date(int(match.group(1)), int(match.group(2)), 1)
+            partitions.append({"name": name, "month": month, "rows": max(estimate, 0)})
+    return sorted(partitions, key=lambda p: p["month"])
+
+
+def create_partition(month):
+    """
+    Create and attach the partition for `month`, moving any of its rows
+    out of the default partition first.
+    """
+    name = partition_name(month)
+    start, end = month, add_months(month, 1)
+    with transaction.atomic(), connection.cursor() as cursor:
+        # ATTACH refuses tables with deferred foreign key checks pending.
+        cursor.execute("SET CONSTRAINTS ALL IMMEDIATE")
+        cursor.execute(f"CREATE TABLE {name} (LIKE {TABLE} INCLUDING DEFAULTS)")
+        cursor.execute(
+            f"""
+            WITH moved AS (
+                DELETE FROM {DEFAULT_PARTITION}
+                WHERE date >= %s AND date < %s
+                RETURNING {COLUMNS}
+            )
+            INSERT INTO {name} ({COLUMNS}) SELECT {COLUMNS} FROM moved
+            """,
+            [start, end],
+        )
+        # A matching CHECK constraint lets ATTACH skip its validation scan.
+        cursor.execute(
+            f"ALTER TABLE {name} ADD CONSTRAINT {name}_bounds "
+            f"CHECK (date >= %s AND date < %s)",
+            [start, end],
+        )
+        cursor.execute(
+            f"ALTER TABLE {TABLE} ATTACH PARTITION {name} "
+            f"FOR VALUES FROM (%s) TO (%s)",
+            [start, end],
+        )
+        cursor.execute("SET CONSTRAINTS ALL DEFERRED")
+    return name
+
+
+def ensure_partitions(months_ahead=None, today=None):
+    """
+    Create the partitions for the current month, the next `months_ahead`
+    months and any month that has rows stranded in the default partition.
+    Returns the names of the partitions created.
+    """
+    if not is_partitioned():
+        return []
+    if months_ahead is None:
+        months_ahead = settings.VOTE_PARTITION_MONTHS_AHEAD
+    current = month_start(today or now().date())
+
+    months = {add_months(current, i) for i in range(months_ahead + 1)}
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"SELECT DISTINCT date_trunc('month', date)::date FROM {DEFAULT_PARTITION}"
+        )
+        months.update(row[0] for row in cursor.fetchall())
+    existing = {p["month"] for p in list_partitions()}
+    return [create_partition(month) for month in sorted(months - existing)]
+
+
+def archive_partition(month, directory, drop=True):
+    """
+    Export a closed month to `<directory>/<partition>.csv.gz`, then detach
+    the partition and drop it (or keep it as a standalone table).
+
+    The export runs while the partition is still attached, so a failed
+    export leaves the votes in place. Returns the archive path.
+    """
+    name = partition_name(month)
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{name}.csv.gz"
+    tmp = path.with_suffix(".tmp")
+
+    with gzip.open(tmp, "wb") as archive, connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {name} ({COLUMNS}) TO STDOUT WITH (FORMAT csv, HEADER)", archive
+        )
+    os.replace(tmp, path)
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(f"ALTER TABLE {TABLE} DETACH PARTITION {name}")
+        if drop:
+            cursor.execute(f"DROP TABLE {name}")
+    return path
@@ -0,0 +1,217 @@
+from datetime import timedelta
+
+import numpy as np
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F, Max, Min, OuterRef, Subquery
+from django.utils.timezone import now
+from restaurants.models import Menu, Restaurant
+from scipy import sparse
+from votes.models import PreferenceDay, Recommendation, Vote, VotePreference
+
+CHUNK_DAYS = 31
+CHUNK_USERS = 4096
+# Weight of overall popularity, small enough to only order restaurants the
+# user's history ranks equally (including every restaurant of a new user).
+POPULARITY_WEIGHT = 1e-3
+
+
+def _add_days(start, end):
+    """
+    Add the votes cast from `start` until `end` (exclusive) to the
+    preference counts with a single upsert.
+    """
+    preference = VotePreference._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"""
+            INSERT INTO {preference} (user_id, restaurant_id, votes)
+            SELECT v.user_id, m.restaurant_id, COUNT(*)
+            FROM {Vote._meta.db_table} v
+            JOIN {Menu._meta.db_table} m ON m.id = v.menu_id
+            WHERE v.date >= %s AND v.date < %s
+            GROUP BY v.user_id, m.restaurant_id
+            ON CONFLICT (user_id, restaurant_id)
+            DO UPDATE SET votes = {preference}.votes + EXCLUDED.votes
+            """,
+            [start, end],
+        )
+    days = (end - start).days
+    PreferenceDay.objects.bulk_create(
+        PreferenceDay(date=start + timedelta(days=i)) for i in range(days)
+    )
+    return days
+
+
+def update_preferences(today=None, rebuild=False):
+    """
+    Add the votes of every closed day (before `today`) not counted yet to
+    the user x restaurant preference counts, in transactions of up to
+    CHUNK_DAYS days. `rebuild` starts over from the first menu.
+    Returns the number of days processed.
+    """
+    today = today or now().date()
+    if rebuild:
+        with transaction.atomic():
+            VotePreference.objects.all().delete()
+            PreferenceDay.objects.all().delete()
+
+    last = PreferenceDay.objects.aggregate(last=Max("date"))["last"]
+    if last is not None:
+        start = last + timedelta(days=1)
+    else:
+        start = Menu.objects.aggregate(first=Min("date"))["first"]
+        if start is None:
+            return 0
+
+    processed = 0
+    while start < today:
+        end = min(start + timedelta(days=CHUNK_DAYS), today)
+        with transaction.atomic():
+            processed += _add_days(start, end)
+        start = end
+    return processed
+
+
+def _matrix(users, restaurants, values, user_ids, restaurant_ids):
+    """
+    Build a users x restaurants CSR matrix from coordinate arrays of ids.
+    """
+    return sparse.csr_matrix(
+        (
+            values,
+            (
+                np.searchsorted(user_ids, users),
+                np.searchsorted(restaurant_ids, restaurants),
+            ),
+        ),
+        shape=(len(user_ids), len(restaurant_ids)),
+    )
+
+
+def item_similarity(weights):
+    """
+    Cosine similarity between the restaurant columns of a user x
+    restaurant matrix, as a sparse restaurant x restaurant matrix.
+    """
+    norms = np.sqrt(np.asarray(weights.multiply(weights).sum(axis=0))).ravel()
+    inverse = np.divide(1.0, norms, out=np.zeros_like(norms), where=norms > 0)
+    normalized = weights @ sparse.diags(inverse)
+    return (normalized.T @ normalized).tocsr()
+
+
+def top_k(scores, allowed, k):
+    """
+    Return the column indices and scores of the `k` best allowed entries
+    of each row, best first. Missing entries are -1 with a -inf score.
+    """
+    scores = np.where(allowed, scores, -np.inf)
+    k = min(k, scores.shape[1])
+    best = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+    best_scores = np.take_along_axis(scores, best, axis=1)
+    # Highest score first, lowest column first on ties.
+    order = np.lexsort((best, -best_scores), axis=1)
+    best = np.take_along_axis(best, order, axis=1)
+    best_scores = np.take_along_axis(best_scores, order, axis=1)
+    best[~np.isfinite(best_scores)] = -1
+    return best, best_scores
+
+
+def _rows(queryset, *fields):
+    return np.array(list(queryset.values_list(*fields)), dtype=np.int64).reshape(
+        -1, len(fields)
+    )
+
+
+def compute_recommendations(k=None):
+    """
+    Rank every employee's restaurants by item-item collaborative
+    filtering over the preference counts and replace the Recommendation
+    table with each user's top `k`. Returns the number of rows written.
+
+    A user's score for a restaurant is its similarity to the restaurants
+    they voted for, weighted by their vote counts (damped with log1p so
+    regulars do not dominate). Only restaurants they work at are ranked.
+    """
+    k = k or settings.RECOMMENDATIONS_TOP_K
+    preferences = _rows(VotePreference.objects, "user_id", "restaurant_id", "votes")
+    memberships = _rows(
+        Restaurant.employees.through.objects, "customuser_id", "restaurant_id"
+    )
+    restaurant_ids = _rows(Restaurant.objects.order_by("id"), "id").ravel()
+    # Skip rows of restaurants created or deleted between the reads.
+    preferences = preferences[np.isin(preferences[:, 1], restaurant_ids)]
+    memberships = memberships[np.isin(memberships[:, 1], restaurant_ids)]
+    user_ids = np.union1d(preferences[:, 0], memberships[:, 0])
+
+    recommendations = []
+    if len(memberships):
+        weights = _matrix(
+            preferences[:, 0],
+            preferences[:, 1],
+            np.log1p(preferences[:, 2].astype(np.float32)),
+            user_ids,
+            restaurant_ids,
+        )
+        allowed = _matrix(
+            memberships[:, 0],
+            memberships[:, 1],
+            np.ones(len(memberships), dtype=np.bool_),
+            user_ids,
+            restaurant_ids,
+        )
+        similarity = item_similarity(weights)
+        popularity = np.asarray(weights.sum(axis=0)).ravel()
+        prior = POPULARITY_WEIGHT * popularity / max(popularity.max(initial=0), 1e-9)
+
+        members = np.flatnonzero(np.diff(allowed.indptr))
+        for first in range(0, len(members), CHUNK_USERS):
+            rows = members[first : first + CHUNK_USERS]
+            scores = (weights[rows] @ similarity).toarray() + prior
+            best, best_scores = top_k(scores, allowed[rows].toarray(), k)
+            found_rows, found_ranks = np.nonzero(best >= 0)
+            recommendations.extend(
+                Recommendation(
+                    user_id=user_id, restaurant_id=restaurant_id, rank=rank, score=score
+                )
+                for user_id, restaurant_id, rank, score in zip(
+                    user_ids[rows[found_rows]].tolist(),
+                    restaurant_ids[best[found_rows, found_ranks]].tolist(),
+                    (found_ranks + 1).tolist(),
+                    best_scores[found_rows, found_ranks].round(6).tolist(),
+                )
+            )
+
+    with transaction.atomic():
+        Recommendation.objects.all().delete()
+        Recommendation.objects.bulk_create(recommendations, batch_size=5_000)
+    return len(recommendations)
+
+
+def refresh_recommendations(today=None, rebuild=False, k=None):
+    """
+    Count the newly closed days and recompute every user's top `k`.
+    Returns (days processed, recommendations written).
+    """
+    days = update_preferences(today=today, rebuild=rebuild)
+    return days, compute_recommendations(k=k)
+
+
+def recommendations_for(user, today=None):
+    """
+    A user's precomputed recommendations, best first, with the id of the
+    restaurant's menu for `today` (None if it has none yet).
+    """
+    today = today or now().date()
+    menu = Menu.objects.filter(restaurant_id=OuterRef("restaurant_id"), date=today)
+    return list(
+        Recommendation.objects.filter(user=user)
+        .order_by("rank")
+        .values(
+            "rank",
+            "score",
+            "restaurant_id",
+            restaurant_name=F("restaurant__name"),
+            menu_id=Subquery(menu.values("id")[:1]),
+        )
+    )
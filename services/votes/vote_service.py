@@ -1,22 +1,46 @@
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
 from restaurants.models import Menu
+from votes.models import Vote
 from django.utils.timezone import now
 
 
+def _results_query(date):
+    # Filtering votes on their own date column keeps the count inside one
+    # partition of the vote table.
+    votes = (
+        Vote.objects.filter(menu=OuterRef("pk"), date=date)
+        .order_by()
+        .values("menu")
+        .annotate(count=Count("*"))
+        .values("count")
+    )
+    return (
+        Menu.objects.filter(date=date)
+        .annotate(vote_count=Coalesce(Subquery(votes), 0))
+        .order_by("-vote_count", "id")
+        .values_list("restaurant__name", "id", "vote_count")
+    )
+
+
 def get_voting_results(date=None):
     """
     Fetch voting results for a given date.
     Defaults to today's date if not provided.
     """
     date = date or now().date()
-    menus = Menu.objects.filter(date=date).prefetch_related("votes")
-
-    results = [
-        {
-            "restaurant": menu.restaurant.name,
-            "menu_id": menu.id,
-            "votes": menu.votes.count(),
-        }
-        for menu in menus
+    return [
+        {"restaurant": restaurant, "menu_id": menu_id, "votes": votes}
+        for restaurant, menu_id, votes in _results_query(date)
     ]
 
-    return sorted(results, key=lambda x: x["votes"], reverse=True)
+
+async def aget_voting_results(date=None):
+    """
+    Async version of get_voting_results.
+    """
+    date = date or now().date()
+    return [
+        {"restaurant": restaurant, "menu_id": menu_id, "votes": votes}
+        async for restaurant, menu_id, votes in _results_query(date)
+    ]
@@ -1,3 +1,64 @@
 from django.contrib import admin
+from django.contrib.auth.admin import UserAdmin
+from django.contrib.auth.forms import BaseUserCreationForm, UserChangeForm
+from services.admin.large_tables import LargeTableAdmin
+from .models import CustomUser
 
-# Register your models here.
+
+class CustomUserCreationForm(BaseUserCreationForm):
+    class Meta:
+        model = CustomUser
+        fields = ("email", "name", "surname", "role")
+
+
+class CustomUserChangeForm(UserChangeForm):
+    class Meta:
+        model = CustomUser
+        fields = "__all__"
+
+
+@admin.register(CustomUser)
+class CustomUserAdmin(LargeTableAdmin, UserAdmin):
+    """
+    Admin for users, identified by email instead of a username.
+    """
+
+    form = CustomUserChangeForm
+    add_form = CustomUserCreationForm
+    list_display = ("id", "email", "name", "surname", "role", "is_staff")
+    list_filter = ("role", "is_staff", "is_active")
+    search_fields = ("email", "name", "surname")
+    fieldsets = (
+        (None, {"fields": ("email", "password")}),
+        ("Personal info", {"fields": ("name", "surname", "role")}),
+        (
+            "Permissions",
+            {
+                "fields": (
+                    "is_active",
+                    "is_staff",
+                    "is_superuser",
+                    "groups",
+                    "user_permissions",
+                )
+            },
+        ),
+        ("Important dates", {"fields": ("last_login", "created_at")}),
+    )
+    add_fieldsets = (
+        (
+            None,
+            {
+                "classes": ("wide",),
+                "fields": (
+                    "email",
+                    "name",
+                    "surname",
+                    "role",
+                    "password1",
+                    "password2",
+                ),
+            },
+        ),
+    )
+    readonly_fields = ("last_login", "created_at")
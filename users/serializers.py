@@ -2,12 +2,13 @@ from rest_framework import serializers
 from django.contrib.auth import get_user_model
 from services.validation.validate_login import validate_user_credentials
 from services.auth.logout_service import blacklist_refresh_token
+from services.api.fields import VersionedFieldsMixin
 
 
 User = get_user_model()
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(VersionedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for returning user data.
     """
@@ -16,6 +17,7 @@ class UserSerializer(serializers.ModelSerializer):
         model = User
         fields = ["id", "email", "name", "surname", "role", "created_at"]
         read_only_fields = ["id", "created_at"]
+        version_fields = {"2": ["id", "email", "name", "surname", "role"]}
 
 
 class UserRegisterSerializer(serializers.ModelSerializer):
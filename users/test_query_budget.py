@@ -0,0 +1,54 @@
+import pytest
+from rest_framework_simplejwt.tokens import RefreshToken
+from services.testing.query_budget import assert_query_budget
+
+BASE_URL = "/api/auth/"
+
+
+def register_request(dataset):
+    count = len(dataset.restaurants)
+    payload = {
+        "email": f"new{count}@example.com",
+        "name": "New",
+        "surname": "User",
+        "password": "password123",
+        "role": "employee",
+    }
+    return dataset.client(), f"{BASE_URL}register/", payload
+
+
+def login_request(dataset):
+    employee = dataset.fresh_employee()
+    payload = {"email": employee.email, "password": "testpass123"}
+    return dataset.client(), f"{BASE_URL}login/", payload
+
+
+def logout_request(dataset):
+    employee = dataset.fresh_employee()
+    refresh = str(RefreshToken.for_user(employee))
+    return dataset.client(employee), f"{BASE_URL}logout/", {"refresh": refresh}
+
+
+def token_refresh_request(dataset):
+    refresh = str(RefreshToken.for_user(dataset.fresh_employee()))
+    return dataset.client(), f"{BASE_URL}token/refresh/", {"refresh": refresh}
+
+
+def profile_request(dataset):
+    return dataset.client(dataset.fresh_employee()), f"{BASE_URL}profile/", None
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "url_name, method, make_request",
+    [
+        ("register", "post", register_request),
+        ("login", "post", login_request),
+        ("logout", "post", logout_request),
+        ("token_refresh", "post", token_refresh_request),
+        ("user_profile", "get", profile_request),
+    ],
+)
+def test_auth_query_budget(url_name, method, make_request):
+    """Test that auth endpoints stay within a constant query budget."""
+    assert_query_budget(url_name, method, make_request)
@@ -1,11 +1,24 @@
+from django.conf import settings
 from django.urls import path
 from rest_framework_simplejwt.views import TokenRefreshView
-from .views import RegisterView, CustomTokenObtainPairView, LogoutView, UserProfileView
+from .views import (
+    RegisterView,
+    CustomTokenObtainPairView,
+    LogoutView,
+    UserProfileView,
+    AsyncUserProfileView,
+)
 
 urlpatterns = [
     path("register/", RegisterView.as_view(), name="register"),
     path("login/", CustomTokenObtainPairView.as_view(), name="login"),
     path("logout/", LogoutView.as_view(), name="logout"),
     path("token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
-    path("profile/", UserProfileView.as_view(), name="user_profile"),
+    path(
+        "profile/",
+        (
+            AsyncUserProfileView if settings.ASYNC_READ_VIEWS else UserProfileView
+        ).as_view(),
+        name="user_profile",
+    ),
 ]
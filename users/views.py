@@ -8,6 +8,10 @@ from .serializers import (
     LogoutSerializer,
 )
 from django.contrib.auth import get_user_model
+from services.api.async_views import AsyncAPIView
+from services.permissions.is_authenticated import (
+    IsAuthenticated as AsyncIsAuthenticated,
+)
 
 User = get_user_model()
 
@@ -35,7 +39,9 @@ class CustomTokenObtainPairView(TokenObtainPairView):
         user = User.objects.filter(email=request.data.get("email")).first()
 
         if user:
-            response.data["user"] = UserSerializer(user).data
+            response.data["user"] = UserSerializer(
+                user, context={"request": request}
+            ).data
 
         return response
 
@@ -71,3 +77,15 @@ class UserProfileView(generics.RetrieveAPIView):
 
     def get_object(self):
         return self.request.user
+
+
+class AsyncUserProfileView(AsyncAPIView):
+    """
+    Async version of UserProfileView, served when ASYNC_READ_VIEWS is enabled.
+    """
+
+    permission_classes = [AsyncIsAuthenticated]
+
+    async def get(self, request):
+        serializer = UserSerializer(request.user, context={"request": request})
+        return self.render(serializer.data)
@@ -1,3 +1,16 @@
 from django.contrib import admin
+from services.admin.large_tables import LargeTableAdmin
+from .models import Vote
 
-# Register your models here.
+
+@admin.register(Vote)
+class VoteAdmin(LargeTableAdmin):
+    """
+    Admin for votes, browsable by date and searchable by exact voter email.
+    """
+
+    list_display = ("id", "user", "menu", "date", "created_at")
+    list_select_related = ("user", "menu__restaurant")
+    search_fields = ("=user__email",)
+    raw_id_fields = ("user", "menu")
+    date_hierarchy = "date"
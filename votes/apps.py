@@ -1,6 +1,49 @@
+import weakref
+from contextvars import ContextVar
+
 from django.apps import AppConfig
+from django.db import DEFAULT_DB_ALIAS
+from django.db.models.signals import post_delete, post_migrate
+
+# The delete() call whose vote versions were bumped last, and those keys.
+_bumped = ContextVar("deleted_vote_versions", default=(None, set()))
+
+
+def ensure_vote_partitions(sender, using=DEFAULT_DB_ALIAS, **kwargs):
+    """
+    Create upcoming vote partitions whenever migrations run.
+    """
+    from services.votes.partitions import ensure_partitions
+
+    if using == DEFAULT_DB_ALIAS:
+        ensure_partitions()
+
+
+def bump_deleted_vote_versions(sender, instance, origin=None, **kwargs):
+    """
+    Bump the versions a deleted vote belongs to, however it was deleted:
+    Vote.delete(), QuerySet.delete(), a cascade or a batch delete. A delete
+    call bumps each key once, not once per vote.
+    """
+    from services.api.versions import bump_versions
+
+    keys = set(instance.version_keys())
+    if origin is not None:
+        origin_ref, bumped = _bumped.get()
+        if origin_ref is None or origin_ref() is not origin:
+            bumped = set()
+            _bumped.set((weakref.ref(origin), bumped))
+        keys -= bumped
+        bumped |= keys
+    bump_versions(keys)
 
 
 class VotesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "votes"
+
+    def ready(self):
+        from votes.models import Vote
+
+        post_migrate.connect(ensure_vote_partitions, sender=self)
+        post_delete.connect(bump_deleted_vote_versions, sender=Vote)
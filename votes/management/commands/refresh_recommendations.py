@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+from services.votes.recommendations import refresh_recommendations
+
+
+class Command(BaseCommand):
+    help = (
+        "Add the votes of every day closed since the last run to the "
+        "preference counts and recompute each user's recommendations."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rebuild",
+            action="store_true",
+            help="Recount the preferences from the whole vote history.",
+        )
+        parser.add_argument(
+            "--top-k",
+            type=int,
+            help="Restaurants kept per user (default RECOMMENDATIONS_TOP_K).",
+        )
+
+    def handle(self, *args, **options):
+        days, rows = refresh_recommendations(
+            rebuild=options["rebuild"], k=options["top_k"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Counted {days} day(s), wrote {rows} recommendation(s)."
+            )
+        )
@@ -0,0 +1,29 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+from services.votes.analytics import refresh_rollups
+
+
+def date_arg(value):
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise CommandError(f"Expected a date as YYYY-MM-DD, got {value!r}.")
+
+
+class Command(BaseCommand):
+    help = (
+        "Roll up the votes of every day closed since the last run into the "
+        "daily tables behind the analytics endpoints."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--since",
+            type=date_arg,
+            help="Recount the days from this date on (YYYY-MM-DD).",
+        )
+
+    def handle(self, *args, **options):
+        days = refresh_rollups(since=options["since"])
+        self.stdout.write(self.style.SUCCESS(f"Rolled up {days} day(s)."))
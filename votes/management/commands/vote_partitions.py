@@ -0,0 +1,91 @@
+from datetime import datetime
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.timezone import now
+from services.votes.partitions import (
+    add_months,
+    archive_partition,
+    ensure_partitions,
+    is_partitioned,
+    list_partitions,
+    month_start,
+)
+
+
+def month_arg(value):
+    try:
+        return datetime.strptime(value, "%Y-%m").date()
+    except ValueError:
+        raise CommandError(f"Expected a month as YYYY-MM, got {value!r}.")
+
+
+class Command(BaseCommand):
+    help = (
+        "Manage the monthly partitions of the vote table: create upcoming "
+        "ones, list them, or archive closed months to gzipped CSV files."
+    )
+
+    def add_arguments(self, parser):
+        actions = parser.add_subparsers(dest="action", required=True)
+
+        ensure = actions.add_parser("ensure", help="Create upcoming partitions.")
+        ensure.add_argument("--months-ahead", type=int)
+
+        actions.add_parser("list", help="List attached partitions.")
+
+        archive = actions.add_parser(
+            "archive", help="Export, detach and drop closed months."
+        )
+        archive.add_argument(
+            "--before",
+            help="Archive months before this one (YYYY-MM). Defaults to "
+            "VOTE_PARTITION_RETAIN_MONTHS before the current month.",
+        )
+        archive.add_argument("--dir", default=settings.VOTE_ARCHIVE_DIR)
+        archive.add_argument(
+            "--keep-table",
+            action="store_true",
+            help="Detach the partitions but keep them as standalone tables.",
+        )
+        archive.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **options):
+        if not is_partitioned():
+            raise CommandError("The vote table is only partitioned on PostgreSQL.")
+        getattr(self, f"handle_{options['action']}")(options)
+
+    def handle_ensure(self, options):
+        created = ensure_partitions(options["months_ahead"])
+        for name in created:
+            self.stdout.write(f"Created {name}")
+        self.stdout.write(self.style.SUCCESS(f"{len(created)} partition(s) created."))
+
+    def handle_list(self, options):
+        for partition in list_partitions():
+            self.stdout.write(
+                f"{partition['name']}  {partition['month']:%Y-%m}  "
+                f"~{partition['rows']} rows"
+            )
+
+    def handle_archive(self, options):
+        current = month_start(now().date())
+        if options["before"]:
+            before = month_arg(options["before"])
+        else:
+            before = add_months(current, -settings.VOTE_PARTITION_RETAIN_MONTHS)
+        if before > current:
+            raise CommandError("Only closed months can be archived.")
+
+        months = [p for p in list_partitions() if p["month"] < before]
+        for partition in months:
+            if options["dry_run"]:
+                self.stdout.write(f"Would archive {partition['name']}")
+                continue
+            path = archive_partition(
+                partition["month"], options["dir"], drop=not options["keep_table"]
+            )
+            self.stdout.write(f"Archived {partition['name']} to {path}")
+        self.stdout.write(
+            self.style.SUCCESS(f"{len(months)} partition(s) before {before:%Y-%m}.")
+        )
@@ -0,0 +1,36 @@
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def copy_menu_dates(apps, schema_editor):
+    Vote = apps.get_model("votes", "Vote")
+    Menu = apps.get_model("restaurants", "Menu")
+    Vote.objects.using(schema_editor.connection.alias).update(
+        date=Subquery(Menu.objects.filter(pk=OuterRef("menu_id")).values("date")[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("restaurants", "0001_initial"),
+        ("votes", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="vote",
+            name="date",
+            field=models.DateField(editable=False, null=True),
+        ),
+        migrations.RunPython(copy_menu_dates, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="vote",
+            name="date",
+            field=models.DateField(editable=False),
+        ),
+        migrations.AlterUniqueTogether(
+            name="vote",
+            unique_together={("user", "menu", "date")},
+        ),
+    ]
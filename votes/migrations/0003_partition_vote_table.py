@@ -0,0 +1,28 @@
+from django.db import migrations
+from django.db.migrations.exceptions import IrreversibleError
+from services.votes.partitions import partition_table
+
+
+def partition(apps, schema_editor):
+    partition_table(schema_editor)
+
+
+def unpartition(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        raise IrreversibleError("The partitioned votes_vote table cannot be merged.")
+
+
+class Migration(migrations.Migration):
+    """
+    Partitions votes_vote by date on PostgreSQL; other databases keep a
+    plain table.
+    """
+
+    dependencies = [
+        ("users", "0001_initial"),
+        ("votes", "0002_vote_date"),
+    ]
+
+    operations = [
+        migrations.RunPython(partition, unpartition),
+    ]
@@ -0,0 +1,66 @@
+# Generated by Django 5.1.6 on 2026-10-19 11:40
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("restaurants", "0001_initial"),
+        ("votes", "0003_partition_vote_table"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyVoteTotal",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField(unique=True)),
+                ("votes", models.PositiveIntegerField()),
+                ("menus", models.PositiveIntegerField()),
+            ],
+        ),
+        migrations.CreateModel(
+            name="DailyRestaurantVotes",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("votes", models.PositiveIntegerField()),
+                ("share", models.FloatField()),
+                ("rank", models.PositiveIntegerField()),
+                (
+                    "restaurant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_votes",
+                        to="restaurants.restaurant",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(
+                        fields=["date", "restaurant"], name="votes_daily_date_idx"
+                    )
+                ],
+                "unique_together": {("restaurant", "date")},
+            },
+        ),
+    ]
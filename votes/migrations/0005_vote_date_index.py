@@ -0,0 +1,17 @@
+# Generated by Django 5.1.6 on 2026-10-19 12:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("votes", "0004_vote_rollups"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="vote",
+            index=models.Index(fields=["date"], name="votes_vote_date_idx"),
+        ),
+    ]
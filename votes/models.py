@@ -1,6 +1,9 @@
-from django.db import models
+from core.models import OutboxEvent
+from django.db import models, transaction
 from django.contrib.auth import get_user_model
-from restaurants.models import Menu
+from restaurants.models import Menu, Restaurant
+from services.api.versions import bump_versions
+from services.events.outbox import publish
 
 User = get_user_model()
 
@@ -13,10 +16,130 @@ class Vote(models.Model):
 
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="votes")
     menu = models.ForeignKey(Menu, on_delete=models.CASCADE, related_name="votes")
+    # Copy of menu.date; PostgreSQL partitions the table by it.
+    date = models.DateField(editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
 
     class Meta:
-        unique_together = ("user", "menu")
+        unique_together = ("user", "menu", "date")
+        indexes = [models.Index(fields=["date"], name="votes_vote_date_idx")]
+
+    outbox_topic = "vote"
+
+    def save(self, *args, **kwargs):
+        if self.date is None:
+            self.date = self.menu.date
+        action = OutboxEvent.CREATED if self._state.adding else OutboxEvent.UPDATED
+        with transaction.atomic(savepoint=False):
+            super().save(*args, **kwargs)
+            publish(self, action)
+            bump_versions(self.version_keys())
+
+    def delete(self, *args, **kwargs):
+        # Versions are bumped by the post_delete receiver in votes.apps.
+        with transaction.atomic(savepoint=False):
+            publish(self, OutboxEvent.DELETED)
+            return super().delete(*args, **kwargs)
+
+    def outbox_payload(self):
+        return {
+            "id": self.id,
+            "user": self.user_id,
+            "menu": self.menu_id,
+            "date": self.date,
+        }
+
+    def version_keys(self):
+        return [f"results:{self.date}"]
 
     def __str__(self):
         return f"{self.user.email} voted for {self.menu.restaurant.name} on {self.menu.date}"
+
+
+class DailyVoteTotal(models.Model):
+    """
+    Votes and menus of one closed day, maintained by refresh_rollups.
+    """
+
+    date = models.DateField(unique=True)
+    votes = models.PositiveIntegerField()
+    menus = models.PositiveIntegerField()
+
+    def __str__(self):
+        return f"{self.date}: {self.votes} votes"
+
+
+class DailyRestaurantVotes(models.Model):
+    """
+    A restaurant's votes on one closed day, with its share of that day's
+    votes and its rank among the day's menus (1 is a win, ties share it).
+    """
+
+    restaurant = models.ForeignKey(
+        Restaurant, on_delete=models.CASCADE, related_name="daily_votes"
+    )
+    date = models.DateField()
+    votes = models.PositiveIntegerField()
+    share = models.FloatField()
+    rank = models.PositiveIntegerField()
+
+    class Meta:
+        unique_together = ("restaurant", "date")
+        indexes = [
+            models.Index(fields=["date", "restaurant"], name="votes_daily_date_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.restaurant_id} on {self.date}: {self.votes} votes"
+
+
+class VotePreference(models.Model):
+    """
+    Votes a user cast for a restaurant's menus over the closed days
+    recorded in PreferenceDay; the entries of the sparse user x restaurant
+    matrix behind the recommendations.
+    """
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="+")
+    restaurant = models.ForeignKey(
+        Restaurant, on_delete=models.CASCADE, related_name="+"
+    )
+    votes = models.PositiveIntegerField()
+
+    class Meta:
+        unique_together = ("user", "restaurant")
+
+    def __str__(self):
+        return f"{self.user_id} -> {self.restaurant_id}: {self.votes} votes"
+
+
+class PreferenceDay(models.Model):
+    """
+    A closed day whose votes have been added to VotePreference.
+    """
+
+    date = models.DateField(unique=True)
+
+    def __str__(self):
+        return str(self.date)
+
+
+class Recommendation(models.Model):
+    """
+    One of a user's top restaurants, precomputed by refresh_recommendations.
+    """
+
+    user = models.ForeignKey(
+        User, on_delete=models.CASCADE, related_name="recommendations"
+    )
+    restaurant = models.ForeignKey(
+        Restaurant, on_delete=models.CASCADE, related_name="+"
+    )
+    rank = models.PositiveSmallIntegerField()
+    score = models.FloatField()
+
+    class Meta:
+        unique_together = ("user", "rank")
+
+    def __str__(self):
+        return f"{self.user_id} #{self.rank}: {self.restaurant_id}"
@@ -1,9 +1,18 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils.timezone import now
 from rest_framework import serializers
 from votes.models import Vote
-from services.validation.validate_vote import validate_user_vote
+from services.validation.validate_vote import (
+    validate_user_vote,
+    validate_vote_eligibility,
+)
+from services.api.fields import VersionedFieldsMixin
+from services.events.outbox import parse_cursor
 
 
-class VoteSerializer(serializers.ModelSerializer):
+class VoteSerializer(VersionedFieldsMixin, serializers.ModelSerializer):
     """
     Serializer for the Vote model.
     Ensures that users cannot vote for the same menu multiple times.
@@ -13,6 +22,7 @@ class VoteSerializer(serializers.ModelSerializer):
         model = Vote
         fields = ["id", "menu", "created_at"]
         read_only_fields = ["id", "created_at"]
+        version_fields = {"2": ["id", "menu"]}
 
     def validate(self, data):
         """
@@ -21,6 +31,7 @@ class VoteSerializer(serializers.ModelSerializer):
         user = self.context["request"].user
         menu = data.get("menu")
 
+        validate_vote_eligibility(user, menu)
         validate_user_vote(user, menu)
         return data
 
@@ -30,3 +41,43 @@ class VoteSerializer(serializers.ModelSerializer):
         """
         validated_data["user"] = self.context["request"].user
         return super().create(validated_data)
+
+
+class EventFeedQuerySerializer(serializers.Serializer):
+    """
+    Validates the cursor, page size and long-poll wait of the event feed.
+    """
+
+    after = serializers.CharField(default="0")
+    limit = serializers.IntegerField(min_value=1, default=100)
+    wait = serializers.FloatField(min_value=0, default=0)
+
+    def validate_after(self, value):
+        position = parse_cursor(value)
+        if position is None:
+            raise serializers.ValidationError("Pass the `next` value of a feed page.")
+        return position
+
+    def validate_limit(self, value):
+        return min(value, settings.EVENT_FEED_MAX_LIMIT)
+
+    def validate_wait(self, value):
+        return min(value, settings.EVENT_FEED_MAX_WAIT)
+
+
+class AnalyticsQuerySerializer(serializers.Serializer):
+    """
+    Validates the period and options of the analytics endpoints. The
+    period is the `days` days ending at `end` (yesterday by default).
+    """
+
+    days = serializers.IntegerField(min_value=1, max_value=3660, default=90)
+    end = serializers.DateField(required=False)
+    limit = serializers.IntegerField(min_value=1, required=False)
+    window = serializers.IntegerField(min_value=1, max_value=90, default=7)
+    restaurant = serializers.IntegerField(min_value=1, required=False)
+
+    def validate(self, attrs):
+        attrs["end"] = attrs.get("end") or now().date() - timedelta(days=1)
+        attrs["start"] = attrs["end"] - timedelta(days=attrs["days"] - 1)
+        return attrs
@@ -0,0 +1,28 @@
+from services.jobs.queue import task
+from services.votes.analytics import refresh_rollups
+from services.votes.partitions import ensure_partitions
+from services.votes.recommendations import refresh_recommendations
+
+
+@task(queue="maintenance")
+def ensure_vote_partitions():
+    """
+    Create the upcoming monthly vote partitions on PostgreSQL.
+    """
+    ensure_partitions()
+
+
+@task(queue="maintenance")
+def refresh_vote_rollups():
+    """
+    Roll up the votes of the days closed since the last run.
+    """
+    refresh_rollups()
+
+
+@task(queue="maintenance")
+def refresh_vote_recommendations():
+    """
+    Count the votes of newly closed days and recompute recommendations.
+    """
+    refresh_recommendations()
@@ -0,0 +1,152 @@
+from datetime import date, timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from rest_framework.test import APIClient
+from restaurants.models import Menu, Restaurant
+from services.votes.analytics import refresh_rollups
+from votes.models import DailyRestaurantVotes, DailyVoteTotal, Vote
+
+MONDAY = date(2026, 1, 5)
+
+
+@pytest.fixture
+def history(django_user_model):
+    """
+    Creates two restaurants with a menu on each of six days from a Monday.
+    Grill wins every day but the third, when Noodles wins 3 to 1.
+    """
+    owner = django_user_model.objects.create_user(
+        email="analytics.owner@example.com",
+        password="testpass123",
+        role="restaurant_admin",
+    )
+    voters = [
+        django_user_model.objects.create_user(
+            email=f"analytics{i}@example.com", password="testpass123"
+        )
+        for i in range(4)
+    ]
+    grill = Restaurant.objects.create(name="Analytics Grill", owner=owner)
+    noodles = Restaurant.objects.create(name="Analytics Noodles", owner=owner)
+    for offset in range(6):
+        day = MONDAY + timedelta(days=offset)
+        menus = [
+            Menu.objects.create(restaurant=r, date=day, items={"Soup": 5})
+            for r in (grill, noodles)
+        ]
+        winner, loser = menus if offset != 2 else menus[::-1]
+        for i, voter in enumerate(voters):
+            Vote.objects.create(user=voter, menu=winner if i < 3 else loser)
+    return grill, noodles
+
+
+def staff_client(django_user_model):
+    staff = django_user_model.objects.create_user(
+        email="analytics.staff@example.com", password="testpass123", is_staff=True
+    )
+    client = APIClient()
+    client.force_authenticate(user=staff)
+    return client
+
+
+@pytest.mark.django_db
+def test_rollups_only_process_new_closed_days(history):
+    """Test that each run rolls up the days closed since the last one."""
+    grill, _ = history
+
+    assert refresh_rollups(today=MONDAY + timedelta(days=3)) == 3
+    assert refresh_rollups(today=MONDAY + timedelta(days=3)) == 0
+    assert refresh_rollups(today=MONDAY + timedelta(days=10)) == 7
+
+    assert DailyVoteTotal.objects.count() == 10
+    assert DailyVoteTotal.objects.get(date=MONDAY + timedelta(days=8)).menus == 0
+    day = DailyRestaurantVotes.objects.get(restaurant=grill, date=MONDAY)
+    assert (day.votes, day.share, day.rank) == (3, 0.75, 1)
+
+
+@pytest.mark.django_db
+def test_rollups_can_be_recounted(history):
+    """Test that --since recounts closed days after late changes."""
+    grill, _ = history
+    refresh_rollups(today=MONDAY + timedelta(days=6))
+    Vote.objects.filter(menu__restaurant=grill, date=MONDAY).delete()
+
+    call_command("refresh_vote_rollups", "--since", str(MONDAY), stdout=StringIO())
+
+    day = DailyRestaurantVotes.objects.get(restaurant=grill, date=MONDAY)
+    assert (day.votes, day.rank) == (0, 2)
+
+
+@pytest.mark.django_db
+def test_win_counts(history, django_user_model):
+    """Test that restaurants are ranked by days won in the period."""
+    grill, noodles = history
+    refresh_rollups(today=MONDAY + timedelta(days=6))
+
+    response = staff_client(django_user_model).get(
+        "/api/votes/analytics/wins/",
+        {"end": str(MONDAY + timedelta(days=5)), "days": 6},
+    )
+
+    assert response.status_code == 200
+    assert [
+        (row["position"], row["restaurant"], row["wins"], row["win_rate"])
+        for row in response.data
+    ] == [(1, grill.id, 5, 0.8333), (2, noodles.id, 1, 0.1667)]
+
+
+@pytest.mark.django_db
+def test_vote_trend_rolling_averages(history, django_user_model):
+    """Test that rolling averages include days before the period."""
+    _, noodles = history
+    refresh_rollups(today=MONDAY + timedelta(days=6))
+
+    response = staff_client(django_user_model).get(
+        f"/api/votes/analytics/restaurants/{noodles.id}/trend/",
+        {"end": str(MONDAY + timedelta(days=3)), "days": 2, "window": 3},
+    )
+
+    assert [
+        (row["date"], row["votes"], row["rolling_votes"]) for row in response.data
+    ] == [
+        (MONDAY + timedelta(days=2), 3, 1.67),
+        (MONDAY + timedelta(days=3), 1, 1.67),
+    ]
+
+
+@pytest.mark.django_db
+def test_weekday_distribution(history, django_user_model):
+    """Test that votes are grouped by ISO weekday."""
+    _, noodles = history
+    refresh_rollups(today=MONDAY + timedelta(days=6))
+    client = staff_client(django_user_model)
+    period = {"end": str(MONDAY + timedelta(days=5)), "days": 6}
+
+    overall = client.get("/api/votes/analytics/weekdays/", period).data
+    assert [(row["weekday"], row["votes"]) for row in overall] == [
+        (day, 4) for day in range(1, 7)
+    ]
+    assert overall[0]["share"] == round(4 / 24, 4)
+
+    mine = client.get(
+        "/api/votes/analytics/weekdays/", {**period, "restaurant": noodles.id}
+    ).data
+    assert mine[2] == {
+        "weekday": 3,
+        "days": 1,
+        "votes": 3,
+        "average": 3.0,
+        "share": 0.375,
+    }
+
+
+@pytest.mark.django_db
+def test_analytics_are_staff_only(history):
+    """Test that regular users cannot read the analytics."""
+    grill, _ = history
+    client = APIClient()
+    client.force_authenticate(user=grill.owner)
+
+    assert client.get("/api/votes/analytics/wins/").status_code == 403
@@ -0,0 +1,171 @@
+import time
+
+import pytest
+from core.models import OutboxEvent
+from django.db import IntegrityError, transaction
+from django.utils.timezone import now
+from rest_framework.test import APIClient
+from restaurants.models import Menu, Restaurant
+from services.restaurants.deletion import delete_restaurant
+from votes.models import Vote
+
+
+@pytest.fixture(autouse=True)
+def fast_polling(settings):
+    settings.EVENT_FEED_POLL_INTERVAL = 0.01
+
+
+@pytest.fixture
+def data(django_user_model):
+    """
+    Creates a restaurant with today's menu, a voter and a staff consumer.
+    """
+    owner = django_user_model.objects.create_user(
+        email="events.owner@example.com",
+        password="testpass123",
+        role="restaurant_admin",
+    )
+    voter = django_user_model.objects.create_user(
+        email="events.voter@example.com", password="testpass123"
+    )
+    consumer = django_user_model.objects.create_user(
+        email="events.consumer@example.com", password="testpass123", is_staff=True
+    )
+    restaurant = Restaurant.objects.create(name="Events Diner", owner=owner)
+    menu = Menu.objects.create(
+        restaurant=restaurant, date=now().date(), items={"Soup": 5}
+    )
+    restaurant.employees.add(voter)
+    return restaurant, menu, voter, consumer
+
+
+def feed(user, **params):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client.get("/api/votes/events/", params)
+
+
+def changes(response):
+    return [
+        (e["topic"], e["action"], e["object_id"]) for e in response.json()["events"]
+    ]
+
+
+@pytest.mark.django_db
+def test_vote_and_menu_changes_are_published(data):
+    """Test that vote and menu writes append events in order."""
+    restaurant, menu, voter, _ = data
+    vote = Vote.objects.create(user=voter, menu=menu)
+    vote_id = vote.id
+    menu.items = {"Soup": 6}
+    menu.save()
+    vote.delete()
+
+    events = OutboxEvent.objects.order_by("id")
+    assert [(e.topic, e.action) for e in events] == [
+        ("menu", "created"),
+        ("vote", "created"),
+        ("menu", "updated"),
+        ("vote", "deleted"),
+    ]
+    assert events[1].payload == {
+        "id": vote_id,
+        "user": voter.id,
+        "menu": menu.id,
+        "date": str(menu.date),
+    }
+
+
+@pytest.mark.django_db
+def test_failed_write_publishes_nothing(data):
+    """Test that an event is rolled back with the write it describes."""
+    _, menu, voter, _ = data
+    Vote.objects.create(user=voter, menu=menu)
+    published = OutboxEvent.objects.count()
+
+    with pytest.raises(IntegrityError), transaction.atomic():
+        Vote.objects.create(user=voter, menu=menu)
+
+    assert OutboxEvent.objects.count() == published
+
+
+@pytest.mark.django_db
+def test_restaurant_deletion_publishes_batched_deletes(data):
+    """Test that batched restaurant deletes publish their deletions."""
+    restaurant, menu, voter, _ = data
+    vote = Vote.objects.create(user=voter, menu=menu)
+
+    delete_restaurant(restaurant)
+
+    deleted = OutboxEvent.objects.filter(action="deleted")
+    assert sorted(deleted.values_list("topic", "object_id")) == [
+        ("menu", menu.id),
+        ("vote", vote.id),
+    ]
+
+
+@pytest.mark.django_db
+def test_feed_pages_with_cursor(data):
+    """Test that consumers page through the feed with the next cursor."""
+    _, menu, voter, consumer = data
+    vote = Vote.objects.create(user=voter, menu=menu)
+
+    first = feed(consumer, limit=1)
+    assert first.status_code == 200
+    assert changes(first) == [("menu", "created", menu.id)]
+    created_at = OutboxEvent.objects.get(topic="menu").created_at
+    assert first.json()["events"][0]["created_at"] == (
+        created_at.isoformat().replace("+00:00", "Z")
+    )
+    assert first.json()["has_more"] is True
+
+    second = feed(consumer, after=first.json()["next"], limit=10)
+    assert changes(second) == [("vote", "created", vote.id)]
+    assert second.json()["has_more"] is False
+
+    caught_up = feed(consumer, after=second.json()["next"])
+    assert caught_up.json() == {
+        "events": [],
+        "next": second.json()["next"],
+        "has_more": False,
+    }
+
+
+@pytest.mark.django_db
+def test_feed_follows_commit_order(data):
+    """Test that events of earlier transactions come first, whatever their id."""
+    _, menu, voter, consumer = data
+    vote = Vote.objects.create(user=voter, menu=menu)
+    OutboxEvent.objects.filter(topic="menu").update(txid=7)
+    OutboxEvent.objects.filter(topic="vote").update(txid=5)
+
+    first = feed(consumer, limit=1)
+    assert changes(first) == [("vote", "created", vote.id)]
+    assert first.json()["next"] == f"5-{OutboxEvent.objects.get(topic='vote').id}"
+
+    second = feed(consumer, after=first.json()["next"])
+    assert changes(second) == [("menu", "created", menu.id)]
+
+
+@pytest.mark.django_db
+def test_feed_long_polls_until_timeout(data):
+    """Test that a caught-up consumer waits up to `wait` seconds."""
+    *_, consumer = data
+    last = feed(consumer).json()["next"]
+
+    started = time.monotonic()
+    response = feed(consumer, after=last, wait=0.1)
+
+    assert time.monotonic() - started >= 0.1
+    assert response.json()["events"] == []
+
+
+@pytest.mark.django_db
+def test_feed_is_staff_only_and_validates_params(data):
+    """Test that the feed needs a staff user and a valid cursor."""
+    _, _, voter, consumer = data
+
+    assert feed(voter).status_code == 403
+    assert APIClient().get("/api/votes/events/").status_code == 401
+    assert feed(consumer, after="latest").status_code == 400
+    assert feed(consumer, after="12").status_code == 400
@@ -0,0 +1,126 @@
+import gzip
+from datetime import date, timedelta
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.utils.timezone import now
+from restaurants.models import Menu, Restaurant
+from services.jobs.queue import schedule_periodic
+from services.jobs.worker import Worker
+from services.votes.partitions import (
+    DEFAULT_PARTITION,
+    add_months,
+    is_partitioned,
+    list_partitions,
+    month_start,
+    partition_name,
+)
+from votes.models import Vote
+
+postgres_only = pytest.mark.skipif(
+    connection.vendor != "postgresql", reason="Partitioning needs PostgreSQL."
+)
+
+
+@pytest.fixture
+def menu_on(django_user_model):
+    """
+    Returns a factory for menus of one restaurant on a given date.
+    """
+    owner = django_user_model.objects.create_user(
+        email="partition.owner@example.com",
+        password="testpass123",
+        role="restaurant_admin",
+    )
+    restaurant = Restaurant.objects.create(name="Partition Pub", owner=owner)
+
+    def make(day):
+        return Menu.objects.create(restaurant=restaurant, date=day, items={"Soup": 5})
+
+    return make
+
+
+def test_month_helpers():
+    """Test month arithmetic and partition naming."""
+    assert month_start(date(2025, 3, 17)) == date(2025, 3, 1)
+    assert add_months(date(2025, 11, 1), 3) == date(2026, 2, 1)
+    assert add_months(date(2025, 1, 1), -1) == date(2024, 12, 1)
+    assert partition_name(date(2025, 2, 1)) == "votes_vote_p202502"
+
+
+@pytest.mark.django_db
+def test_vote_copies_menu_date(menu_on, django_user_model):
+    """Test that a vote stores its menu's date for partitioning."""
+    menu = menu_on(date(2025, 1, 15))
+    user = django_user_model.objects.create_user(
+        email="partition.voter@example.com", password="testpass123"
+    )
+    assert Vote.objects.create(user=user, menu=menu).date == date(2025, 1, 15)
+
+
+@pytest.mark.django_db
+@pytest.mark.skipif(connection.vendor == "postgresql", reason="Plain table only.")
+def test_command_requires_postgresql():
+    """Test that the command refuses to run without a partitioned table."""
+    with pytest.raises(CommandError):
+        call_command("vote_partitions", "list", stdout=StringIO())
+
+
+@postgres_only
+@pytest.mark.django_db(transaction=True)
+def test_ensure_and_archive(menu_on, django_user_model, tmp_path):
+    """Test that stranded rows get a partition and closed months archive."""
+    assert is_partitioned()
+    old_month = add_months(month_start(now().date()), -24)
+    user = django_user_model.objects.create_user(
+        email="partition.archive@example.com", password="testpass123"
+    )
+    Vote.objects.create(user=user, menu=menu_on(old_month + timedelta(days=3)))
+
+    call_command("vote_partitions", "ensure", stdout=StringIO())
+    months = [p["month"] for p in list_partitions()]
+    assert old_month in months
+    assert month_start(now().date()) in months
+
+    call_command(
+        "vote_partitions",
+        "archive",
+        "--before",
+        f"{add_months(old_month, 1):%Y-%m}",
+        "--dir",
+        str(tmp_path),
+        stdout=StringIO(),
+    )
+    archive = tmp_path / f"{partition_name(old_month)}.csv.gz"
+    assert len(gzip.decompress(archive.read_bytes()).splitlines()) == 2
+    assert not Vote.objects.exists()
+    assert old_month not in [p["month"] for p in list_partitions()]
+
+
+@postgres_only
+@pytest.mark.django_db(transaction=True)
+def test_scheduled_ensure_moves_rows_out_of_default(menu_on, django_user_model):
+    """Test that the scheduled task gives rows in DEFAULT their own month."""
+    old_month = add_months(month_start(now().date()), -18)
+    user = django_user_model.objects.create_user(
+        email="partition.default@example.com", password="testpass123"
+    )
+    vote = Vote.objects.create(user=user, menu=menu_on(old_month + timedelta(days=5)))
+
+    def table_of(vote_id):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT tableoid::regclass::text FROM votes_vote WHERE id = %s",
+                [vote_id],
+            )
+            return cursor.fetchone()[0]
+
+    assert table_of(vote.id) == DEFAULT_PARTITION
+
+    assert "votes.tasks.ensure_vote_partitions" in schedule_periodic(["maintenance"])
+    Worker(["maintenance"], burst=True).run()
+
+    assert table_of(vote.id) == partition_name(old_month)
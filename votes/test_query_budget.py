@@ -0,0 +1,70 @@
+from datetime import timedelta
+
+import pytest
+from django.utils.timezone import now
+from services.testing.query_budget import assert_query_budget
+from services.votes.analytics import refresh_rollups
+from services.votes.recommendations import refresh_recommendations
+
+BASE_URL = "/api/votes/"
+
+
+def vote_request(dataset):
+    menu = dataset.menu
+    voter = dataset.fresh_employee(menu.restaurant)
+    return dataset.client(voter), f"{BASE_URL}vote/", {"menu": menu.id}
+
+
+def results_request(dataset):
+    return dataset.client(dataset.fresh_employee()), f"{BASE_URL}results/", None
+
+
+def staff_client(dataset):
+    staff = dataset.new_employee()
+    staff.is_staff = True
+    staff.save(update_fields=["is_staff"])
+    return dataset.client(staff)
+
+
+def events_request(dataset):
+    return staff_client(dataset), f"{BASE_URL}events/?limit=50", None
+
+
+def analytics_request(path):
+    def make_request(dataset):
+        refresh_rollups(today=now().date() + timedelta(days=1))
+        return (
+            staff_client(dataset),
+            f"{BASE_URL}analytics/{path}".format(restaurant=dataset.restaurant.id),
+            None,
+        )
+
+    return make_request
+
+
+def recommendations_request(dataset):
+    employee = dataset.fresh_employee()
+    refresh_recommendations(today=now().date() + timedelta(days=1))
+    return dataset.client(employee), f"{BASE_URL}recommendations/", None
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    "url_name, method, make_request",
+    [
+        ("vote-create", "post", vote_request),
+        ("vote-results", "get", results_request),
+        ("vote-events", "get", events_request),
+        ("analytics-wins", "get", analytics_request("wins/")),
+        (
+            "analytics-trend",
+            "get",
+            analytics_request("restaurants/{restaurant}/trend/"),
+        ),
+        ("analytics-weekdays", "get", analytics_request("weekdays/")),
+        ("vote-recommendations", "get", recommendations_request),
+    ],
+)
+def test_vote_query_budget(url_name, method, make_request):
+    """Test that voting endpoints do not run N+1 queries."""
+    assert_query_budget(url_name, method, make_request)
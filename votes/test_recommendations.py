@@ -0,0 +1,185 @@
+from datetime import date, timedelta
+from io import StringIO
+
+import numpy as np
+import pytest
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils.timezone import now
+from rest_framework.test import APIClient
+from restaurants.models import Menu, Restaurant
+from scipy import sparse
+from services.restaurants.membership import get_membership
+from services.testing.query_budget import budget_caches
+from services.votes.recommendations import (
+    compute_recommendations,
+    item_similarity,
+    refresh_recommendations,
+    top_k,
+    update_preferences,
+)
+from votes.models import Recommendation, Vote, VotePreference
+
+START = date(2026, 2, 2)
+
+
+@pytest.fixture
+def history(django_user_model):
+    """
+    Creates three restaurants and four employees. Over four days Ann votes
+    for Alpha three times and Beta once, Ben for Alpha and Beta twice each
+    and Cat for Gamma three times; Dan has just joined Beta and Gamma.
+    """
+    owner = django_user_model.objects.create_user(
+        email="rec.owner@example.com", password="testpass123", role="restaurant_admin"
+    )
+    users = {
+        name: django_user_model.objects.create_user(
+            email=f"rec.{name}@example.com", password="testpass123"
+        )
+        for name in ("ann", "ben", "cat", "dan")
+    }
+    restaurants = {
+        name: Restaurant.objects.create(name=f"Rec {name}", owner=owner)
+        for name in ("alpha", "beta", "gamma")
+    }
+    for user, names in [
+        ("ann", ["alpha", "beta", "gamma"]),
+        ("ben", ["alpha", "beta"]),
+        ("cat", ["alpha", "gamma"]),
+        ("dan", ["beta", "gamma"]),
+    ]:
+        for name in names:
+            restaurants[name].employees.add(users[user])
+
+    picks = {
+        "ann": ["alpha", "alpha", "alpha", "beta"],
+        "ben": ["alpha", "beta", "alpha", "beta"],
+        "cat": ["gamma", "gamma", "gamma", None],
+    }
+    for offset in range(4):
+        day = START + timedelta(days=offset)
+        menus = {
+            name: Menu.objects.create(restaurant=r, date=day, items={"Soup": 5})
+            for name, r in restaurants.items()
+        }
+        for user, choices in picks.items():
+            if choices[offset]:
+                Vote.objects.create(user=users[user], menu=menus[choices[offset]])
+    return users, restaurants
+
+
+def ranked(user):
+    return list(
+        Recommendation.objects.filter(user=user)
+        .order_by("rank")
+        .values_list("restaurant__name", flat=True)
+    )
+
+
+@pytest.mark.django_db
+def test_preferences_only_count_new_closed_days(history):
+    """Test that each run adds the votes of the days closed since the last."""
+    users, restaurants = history
+
+    assert update_preferences(today=START + timedelta(days=2)) == 2
+    assert update_preferences(today=START + timedelta(days=2)) == 0
+    ann_alpha = VotePreference.objects.get(
+        user=users["ann"], restaurant=restaurants["alpha"]
+    )
+    assert ann_alpha.votes == 2
+
+    assert update_preferences(today=START + timedelta(days=7)) == 5
+    ann_alpha.refresh_from_db()
+    assert ann_alpha.votes == 3
+    assert VotePreference.objects.count() == 5
+
+    assert update_preferences(today=START + timedelta(days=7), rebuild=True) == 7
+    ann_alpha = VotePreference.objects.get(
+        user=users["ann"], restaurant=restaurants["alpha"]
+    )
+    assert ann_alpha.votes == 3
+
+
+@pytest.mark.django_db
+def test_recommendations_rank_members_restaurants(history):
+    """Test rankings from own history, similar users and popularity."""
+    users, _ = history
+
+    assert refresh_recommendations(today=START + timedelta(days=4), k=2) == (4, 8)
+
+    assert ranked(users["ann"]) == ["Rec alpha", "Rec beta"]
+    assert ranked(users["ben"]) == ["Rec alpha", "Rec beta"]
+    # Cat only works at Alpha and Gamma.
+    assert ranked(users["cat"]) == ["Rec gamma", "Rec alpha"]
+    # Without votes of her own, Dan gets the more popular of her two.
+    assert ranked(users["dan"]) == ["Rec beta", "Rec gamma"]
+
+
+@pytest.mark.django_db
+def test_recommendations_are_replaced_on_refresh(history):
+    """Test that a refresh drops the recommendations of former employees."""
+    users, restaurants = history
+    compute_recommendations()
+    restaurants["gamma"].employees.remove(users["cat"])
+
+    compute_recommendations()
+
+    assert ranked(users["cat"]) == ["Rec alpha"]
+    call_command("refresh_recommendations", "--top-k", "1", stdout=StringIO())
+    assert Recommendation.objects.filter(rank__gt=1).count() == 0
+
+
+def test_top_k_orders_by_score_and_skips_disallowed_entries():
+    """Test best-first order, ties by column and padding of short rows."""
+    scores = np.array([[0.5, 0.9, 0.5, 0.1], [0.3, 0.2, 0.1, 0.0]])
+    allowed = np.array([[True, True, True, False], [False, False, True, False]])
+
+    best, best_scores = top_k(scores, allowed, 3)
+
+    assert best.tolist() == [[1, 0, 2], [2, -1, -1]]
+    assert best_scores[0].tolist() == [0.9, 0.5, 0.5]
+
+
+def test_item_similarity_is_cosine_between_columns():
+    """Test the similarity of restaurants voted for by the same users."""
+    weights = sparse.csr_matrix(np.array([[1.0, 1.0, 0.0], [1.0, 0.0, 0.0]]))
+
+    similarity = item_similarity(weights).toarray()
+
+    assert np.allclose(np.diag(similarity), [1.0, 1.0, 0.0])
+    assert np.isclose(similarity[0, 1], 1 / np.sqrt(2))
+    assert similarity[0, 2] == similarity[1, 2] == 0
+
+
+@pytest.mark.django_db
+@budget_caches()
+def test_recommendations_endpoint(history):
+    """Test the served rows, today's menu and the single query."""
+    users, restaurants = history
+    refresh_recommendations(today=START + timedelta(days=4))
+    client = APIClient()
+    client.force_authenticate(user=users["cat"])
+    get_membership(restaurants["alpha"].id)
+    get_membership(restaurants["gamma"].id)
+    today = Menu.objects.create(
+        restaurant=restaurants["gamma"], date=now().date(), items={"Soup": 5}
+    )
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get("/api/votes/recommendations/")
+
+    assert response.status_code == 200
+    assert len(queries) == 1
+    assert [row["restaurant_name"] for row in response.data] == [
+        "Rec gamma",
+        "Rec alpha",
+    ]
+    assert response.data[0]["rank"] == 1
+    assert response.data[0]["menu_id"] == today.id
+    assert response.data[1]["menu_id"] is None
+
+    restaurants["gamma"].employees.remove(users["cat"])
+    response = client.get("/api/votes/recommendations/")
+    assert [row["restaurant_name"] for row in response.data] == ["Rec alpha"]
@@ -43,8 +43,8 @@ def create_restaurant(db, create_user):
 def create_menu(db, create_restaurant):
     """Creates a menu for voting."""
 
-    def _create_menu():
-        restaurant = create_restaurant()
+    def _create_menu(restaurant=None):
+        restaurant = restaurant or create_restaurant()
         return Menu.objects.create(
             restaurant=restaurant,
             date=now().date(),
@@ -68,7 +68,7 @@ def authorized_client(client, create_user, create_restaurant):
 def test_vote_for_menu(authorized_client, create_menu):
     """Test that a user can vote for a menu."""
     client, restaurant, user = authorized_client
-    menu = create_menu()
+    menu = create_menu(restaurant)
 
     response = client.post(f"{BASE_URL}vote/", {"menu": menu.id}, format="json")
 
@@ -82,7 +82,7 @@ def test_vote_for_menu(authorized_client, create_menu):
 def test_cannot_vote_twice(authorized_client, create_menu):
     """Test that a user cannot vote for the same menu twice."""
     client, restaurant, user = authorized_client
-    menu = create_menu()
+    menu = create_menu(restaurant)
 
     client.post(f"{BASE_URL}vote/", {"menu": menu.id}, format="json")
     response = client.post(f"{BASE_URL}vote/", {"menu": menu.id}, format="json")
@@ -97,7 +97,7 @@ def test_cannot_vote_twice(authorized_client, create_menu):
 def test_get_voting_results(authorized_client, create_menu):
     """Test retrieving the voting results."""
     client, restaurant, user = authorized_client
-    menu = create_menu()
+    menu = create_menu(restaurant)
 
     client.post(f"{BASE_URL}vote/", {"menu": menu.id}, format="json")
     response = client.get(f"{BASE_URL}results/")
@@ -108,3 +108,17 @@ def test_get_voting_results(authorized_client, create_menu):
         result.get("menu_id") == menu.id and result.get("votes") == 1
         for result in response.data
     )
+
+
+@pytest.mark.django_db
+def test_cannot_vote_for_another_restaurant(authorized_client, create_menu):
+    """Test that only employees of the menu's restaurant can vote for it."""
+    client, restaurant, user = authorized_client
+    menu = create_menu()
+
+    response = client.post(f"{BASE_URL}vote/", {"menu": menu.id}, format="json")
+
+    assert (
+        response.status_code == status.HTTP_400_BAD_REQUEST
+    ), f"🚨 Response: {response.data}"
+    assert not Vote.objects.filter(user=user).exists()
@@ -1,7 +1,40 @@
+from django.conf import settings
 from django.urls import path
-from .views import VoteCreateView, VoteResultsView
+from .views import (
+    VoteCreateView,
+    VoteResultsView,
+    AsyncVoteResultsView,
+    EventFeedView,
+    WinCountsView,
+    VoteTrendView,
+    WeekdayDistributionView,
+    RecommendationsView,
+)
 
 urlpatterns = [
     path("vote/", VoteCreateView.as_view(), name="vote-create"),
-    path("results/", VoteResultsView.as_view(), name="vote-results"),
+    path(
+        "results/",
+        (
+            AsyncVoteResultsView if settings.ASYNC_READ_VIEWS else VoteResultsView
+        ).as_view(),
+        name="vote-results",
+    ),
+    path("events/", EventFeedView.as_view(), name="vote-events"),
+    path("analytics/wins/", WinCountsView.as_view(), name="analytics-wins"),
+    path(
+        "analytics/restaurants/<int:restaurant_id>/trend/",
+        VoteTrendView.as_view(),
+        name="analytics-trend",
+    ),
+    path(
+        "analytics/weekdays/",
+        WeekdayDistributionView.as_view(),
+        name="analytics-weekdays",
+    ),
+    path(
+        "recommendations/",
+        RecommendationsView.as_view(),
+        name="vote-recommendations",
+    ),
 ]
@@ -1,13 +1,28 @@
 from django.utils.timezone import now
 from rest_framework import generics, permissions
+from django.shortcuts import get_object_or_404
 from rest_framework.response import Response
+from rest_framework.views import APIView
 from votes.models import Vote
-from votes.serializers import VoteSerializer
-from restaurants.models import Menu
-from services.votes.vote_service import get_voting_results
+from votes.serializers import (
+    VoteSerializer,
+    EventFeedQuerySerializer,
+    AnalyticsQuerySerializer,
+)
+from restaurants.models import Menu, Restaurant
+from services.votes.vote_service import get_voting_results, aget_voting_results
+from services.permissions.is_authenticated import IsAuthenticated
+from services.api.async_views import AsyncAPIView
+from services.api.conditional import AsyncConditionalGetMixin, ConditionalGetMixin
+from services.api.idempotency import IdempotentPostMixin
+from services.monitoring.metrics import record_vote_accepted
+from services.events.outbox import cursor, serialize, wait_for_events
+from services.votes.analytics import vote_trend, weekday_distribution, win_counts
+from services.votes.recommendations import recommendations_for
+from services.restaurants.membership import is_employee
 
 
-class VoteCreateView(generics.CreateAPIView):
+class VoteCreateView(IdempotentPostMixin, generics.CreateAPIView):
     """
     API endpoint for users to cast a vote for a specific menu.
     """
@@ -20,15 +35,19 @@ class VoteCreateView(generics.CreateAPIView):
         Saves the vote with the authenticated user.
         """
         serializer.save(user=self.request.user)
+        record_vote_accepted()
 
 
-class VoteResultsView(generics.ListAPIView):
+class VoteResultsView(ConditionalGetMixin, generics.ListAPIView):
     """
     API endpoint to retrieve voting results for the current day.
     """
 
     permission_classes = [permissions.IsAuthenticated]
 
+    def get_version_keys(self):
+        return [f"results:{now().date()}"]
+
     def get(self, request, *args, **kwargs):
         """
         Returns a sorted list of menu votes for the current day.
@@ -36,3 +55,131 @@ class VoteResultsView(generics.ListAPIView):
         today = now().date()
         results = get_voting_results(today)
         return Response(results)
+
+
+class AsyncVoteResultsView(AsyncConditionalGetMixin, AsyncAPIView):
+    """
+    Async version of VoteResultsView, served when ASYNC_READ_VIEWS is enabled.
+    """
+
+    permission_classes = [IsAuthenticated]
+    get_version_keys = VoteResultsView.get_version_keys
+
+    async def get(self, request):
+        """
+        Returns a sorted list of menu votes for the current day.
+        """
+        return self.render(await aget_voting_results(now().date()))
+
+
+class EventFeedView(AsyncAPIView):
+    """
+    API endpoint streaming vote and menu changes from the outbox.
+
+    Consumers pass the `next` cursor of the previous page as `?after=` and
+    may long-poll with `?wait=<seconds>` when they are caught up.
+    """
+
+    permission_classes = [IsAuthenticated, permissions.IsAdminUser]
+
+    async def get(self, request):
+        """
+        Returns the events after the cursor, oldest first.
+        """
+        query = EventFeedQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        after, limit, wait = (
+            query.validated_data[k] for k in ("after", "limit", "wait")
+        )
+
+        events = await wait_for_events(after, limit, wait)
+        if events:
+            after = (events[-1].txid, events[-1].id)
+        return self.render(
+            {
+                "events": [serialize(event) for event in events],
+                "next": cursor(*after),
+                "has_more": len(events) == limit,
+            }
+        )
+
+
+class AnalyticsView(APIView):
+    """
+    Base for the staff analytics endpoints, served from the daily vote
+    rollups (see refresh_vote_rollups).
+    """
+
+    permission_classes = [permissions.IsAdminUser]
+
+    def get_query(self, request):
+        query = AnalyticsQuerySerializer(data=request.query_params)
+        query.is_valid(raise_exception=True)
+        return query.validated_data
+
+
+class WinCountsView(AnalyticsView):
+    """
+    API endpoint ranking restaurants by days won in a period.
+    """
+
+    def get(self, request):
+        """
+        Returns wins, days with a menu and win rate per restaurant.
+        """
+        query = self.get_query(request)
+        return Response(win_counts(query["start"], query["end"], query.get("limit")))
+
+
+class VoteTrendView(AnalyticsView):
+    """
+    API endpoint with a restaurant's daily votes, vote share and their
+    rolling averages.
+    """
+
+    def get(self, request, restaurant_id):
+        """
+        Returns one row per day the restaurant had a menu in the period.
+        """
+        restaurant = get_object_or_404(Restaurant, id=restaurant_id)
+        query = self.get_query(request)
+        return Response(
+            vote_trend(restaurant.id, query["start"], query["end"], query["window"])
+        )
+
+
+class WeekdayDistributionView(AnalyticsView):
+    """
+    API endpoint with votes per weekday, overall or for `?restaurant=`.
+    """
+
+    def get(self, request):
+        """
+        Returns votes, days and share of votes per ISO weekday.
+        """
+        query = self.get_query(request)
+        return Response(
+            weekday_distribution(query["start"], query["end"], query.get("restaurant"))
+        )
+
+
+class RecommendationsView(APIView):
+    """
+    API endpoint suggesting the restaurants the user is likely to vote
+    for, from the table refresh_recommendations precomputes.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request):
+        """
+        Returns the user's top restaurants, best first, with today's menu.
+        Restaurants the user has left since the last refresh are skipped.
+        """
+        return Response(
+            [
+                row
+                for row in recommendations_for(request.user)
+                if is_employee(row["restaurant_id"], request.user.id)
+            ]
+        )